@@ -0,0 +1,98 @@
+"""
+Offline tests for the streaming transcriber's VAD and endpointing.
+
+fixtures/speech_then_silence.wav is 16 kHz mono s16le: 0.3 s of low noise
+(~-60 dB), 1.2 s of a voiced tone (~-25 dB) standing in for speech, then
+1.0 s of low noise. The ASR backend is replaced by a stub that reports how
+much audio it was asked to decode, so no Whisper model is needed.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.asr.audio import SAMPLE_RATE
+from voice_assistant.asr.streaming import EnergyVAD, StreamingTranscriber, iter_wav_chunks
+
+FIXTURE = str(Path(__file__).resolve().parent / "fixtures" / "speech_then_silence.wav")
+
+
+class StubASR:
+    def __init__(self):
+        self.decoded_seconds = []
+
+    def transcribe(self, audio, **options):
+        self.decoded_seconds.append(len(audio) / SAMPLE_RATE)
+        return f"{len(audio) / SAMPLE_RATE:.2f}s"
+
+
+def make_transcriber(asr, **overrides):
+    options = dict(
+        asr=asr, vad=EnergyVAD(threshold_db=-45), frame_ms=30, partial_interval_ms=300,
+        silence_ms=600, min_speech_ms=150, preroll_ms=300, max_seconds=15, partial_window_ms=8000,
+    )
+    options.update(overrides)
+    return StreamingTranscriber(**options)
+
+
+def run(transcriber, chunks):
+    events = []
+    for chunk in chunks:
+        events += transcriber.feed(chunk)
+        if transcriber.finished:
+            break
+    return events
+
+
+def test_partials_then_final_at_end_of_speech():
+    asr = StubASR()
+    transcriber = make_transcriber(asr)
+    events = run(transcriber, iter_wav_chunks(FIXTURE, chunk_ms=100))
+
+    kinds = [event["type"] for event in events]
+    assert kinds[-1] == "final" and set(kinds[:-1]) == {"partial"}
+    assert len(kinds) >= 3  # ~1.2 s of speech at one partial per 300 ms
+    # Endpoint: 600 ms of silence after the speech, not the end of the file
+    final = events[-1]
+    assert 1.7 <= final["audio_seconds"] <= 2.3
+    assert transcriber.finished
+    assert transcriber.feed(np.zeros(1600, dtype=np.float32)) == []
+
+
+def test_finish_flushes_without_endpoint():
+    asr = StubASR()
+    transcriber = make_transcriber(asr, silence_ms=5000)
+    events = run(transcriber, iter_wav_chunks(FIXTURE, chunk_ms=100))
+    assert all(event["type"] == "partial" for event in events)
+    final = transcriber.finish()
+    assert [event["type"] for event in final] == ["final"]
+    assert final[0]["text"] == final[0]["text"].strip() != ""
+
+
+def test_silence_stops_at_max_seconds():
+    asr = StubASR()
+    transcriber = make_transcriber(asr, max_seconds=1)
+    silence = np.random.default_rng(0).normal(0, 0.001, SAMPLE_RATE * 5).astype(np.float32)
+    events = run(transcriber, np.array_split(silence, 50))
+    assert events == [{"type": "final", "text": "", "audio_seconds": 0.0}]
+    assert asr.decoded_seconds == []  # nothing decoded for a stream without speech
+
+
+def test_partials_decode_a_bounded_window():
+    asr = StubASR()
+    transcriber = make_transcriber(asr, partial_window_ms=600, silence_ms=5000)
+    run(transcriber, iter_wav_chunks(FIXTURE, chunk_ms=100))
+    assert asr.decoded_seconds and max(asr.decoded_seconds) <= 0.6 + 1e-9
+
+
+def test_vad_floor_is_not_seeded_from_speech():
+    frame = int(SAMPLE_RATE * 0.03)
+    loud = np.full(frame, 0.1, dtype=np.float32)
+    quiet = np.full(frame, 0.001, dtype=np.float32)
+    vad = EnergyVAD(threshold_db=-45, calibration_frames=10)
+    # Stream starts mid-speech: speech must still be detected after calibration
+    decisions = [vad.is_speech(f) for f in [loud] * 5 + [quiet] * 5 + [loud, quiet]]
+    assert decisions == [True] * 5 + [False] * 5 + [True, False]
+    assert vad.noise_floor_db < -50
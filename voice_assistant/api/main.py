@@ -1,7 +1,26 @@
-from fastapi import FastAPI, Request
+import json
+import time
+import logging
+
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from voice_assistant.nlu import nlu_pipeline
 from voice_assistant.nlu.nlu_pipeline import parse_text
-from voice_assistant.search.search_workouts import search_workouts
+from voice_assistant.search import search_workouts
+from voice_assistant.search.search_workouts import async_search_workouts
+from voice_assistant.search.client import async_check_health, close_clients, init_clients
+from voice_assistant.asr import model_registry
+from voice_assistant.utils import config
+from voice_assistant.utils.batching import BatchQueueFull
+from voice_assistant.utils import metrics
+from voice_assistant.utils.log import get_logger
+from voice_assistant.utils.metrics import Trace, timed
+from voice_assistant.asr.audio import decode_audio_bytes
+from voice_assistant.asr.batch_worker import ASRBatchWorker, ASRQueueFull
+from voice_assistant.api.voice_session import VoiceSession
+from voice_assistant.api import workers
+from voice_assistant.api.workers import WorkerPoolBusy, run_cpu
 
 app = FastAPI()
 
@@ -13,19 +32,209 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+logger = get_logger(__name__)
+
+asr_worker = ASRBatchWorker()
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    # One Trace per request; pipeline stages record into it via timed()
+    start = time.perf_counter()
+    endpoint = request.url.path
+    with Trace():
+        try:
+            response = await call_next(request)
+        except Exception:
+            metrics.REQUESTS.inc(endpoint, "500")
+            raise
+        finally:
+            metrics.REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint)
+    metrics.REQUESTS.inc(endpoint, str(response.status_code))
+    return response
+
+@app.on_event("startup")
+def warmup_models():
+    # Load models once per worker process so no request pays the load cost
+    model_registry.warmup()
+    nlu_pipeline.warmup()
+    asr_worker.start()
+    if config.INTENT_BATCHING:
+        nlu_pipeline.enable_intent_batching()
+    if config.SEARCH_BACKEND == "local":
+        from voice_assistant.search.local_engine import get_local_index
+
+        get_local_index()
+
+@app.on_event("startup")
+async def open_search_clients():
+    # Pooled OpenSearch clients are built here, inside the serving event loop
+    if config.SEARCH_BACKEND != "local":
+        await init_clients()
+
+@app.on_event("shutdown")
+async def stop_workers():
+    asr_worker.stop()
+    nlu_pipeline.disable_intent_batching()
+    workers.shutdown()
+    await close_clients()
+
+@app.exception_handler(WorkerPoolBusy)
+@app.exception_handler(BatchQueueFull)
+async def overloaded_handler(request: Request, exc: Exception):
+    return JSONResponse(status_code=503, content={"detail": str(exc)})
+
+@app.get("/api/asr/models")
+def asr_models():
+    return {"models": model_registry.model_stats(), "worker": asr_worker.stats()}
+
+@app.get("/api/nlu/stats")
+def nlu_stats():
+    pipeline = nlu_pipeline.get_pipeline()
+    batcher = pipeline.intent_batcher
+    return {
+        "intent_batcher": batcher.stats() if batcher else None,
+        "fast_path": pipeline.fast_path_stats(),
+        "cache": pipeline.cache.stats() if pipeline.cache else None,
+    }
+
+@app.get("/api/search/stats")
+def search_stats():
+    cache = search_workouts.result_cache
+    return {"backend": config.SEARCH_BACKEND, "result_cache": cache.stats() if cache else None}
+
+@app.get("/api/health")
+async def health():
+    if config.SEARCH_BACKEND == "local":
+        return {"search": {"status": "local"}}
+    search = await async_check_health()
+    status_code = 503 if search["status"] in ("red", "unreachable") else 200
+    return JSONResponse(status_code=status_code, content={"search": search})
+
+@app.get("/metrics")
+def prometheus_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+def _json_response(payload) -> Response:
+    with timed("serialization"):
+        body = json.dumps(payload)
+    return Response(content=body, media_type="application/json")
+
 @app.post("/api/search")
 async def search_endpoint(request: Request):
     data = await request.json()
     query_text = data.get("text", "")
-    parsed = parse_text(query_text)
+    parsed = await run_cpu(parse_text, query_text)
     if parsed["intent"] == "search_class":
-        results = search_workouts(parsed["intent"], parsed["entities"], top_k=10)
+        results = await async_search_workouts(parsed["intent"], parsed["entities"], top_k=10)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for res in results:
+                logger.debug(
+                    "[%s] %s | %s min | %s | %s | %s",
+                    res["score"], res["title"], res["duration"], res["instructor"], res["intensity"], res["type"],
+                )
+
+        return _json_response(results)
+    return _json_response([])
+
+@app.post("/api/voice")
+async def voice_endpoint(request: Request, format: str = None, top_k: int = 10):
+    """
+    Voice → ASR → NLU → search in one request.
+
+    Accepts multipart form data (field `file` or `audio`) or a raw binary body.
+    Raw 16 kHz mono 16-bit PCM must be sent with `?format=s16le`; anything
+    else (wav, webm, ogg, mp3, ...) is decoded in memory.
+    """
+    start = time.perf_counter()
+
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file") or form.get("audio")
+        if upload is None:
+            raise HTTPException(status_code=400, detail="Expected an audio file in form field 'file' or 'audio'")
+        data = await upload.read()
+    else:
+        data = await request.body()
+
+    try:
+        with timed("audio_decode"):
+            audio = await run_cpu(decode_audio_bytes, data, format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        with timed("asr"):
+            transcript = await asr_worker.transcribe_async(audio)
+    except ASRQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    parsed = await run_cpu(parse_text, transcript)
+
+    results = []
+    if parsed["intent"] == "search_class":
+        results = await async_search_workouts(parsed["intent"], parsed["entities"], top_k=top_k)
+
+    # Stage timings recorded by timed() in this request's trace (intent, ner, opensearch, ...)
+    timings = dict(metrics.current_trace.get().timings_ms)
+    timings["total"] = _elapsed_ms(start)
+    return _json_response({
+        "transcript": transcript,
+        "intent": parsed["intent"],
+        "confidence": parsed.get("confidence"),
+        "entities": parsed["entities"],
+        "results": results,
+        "timings_ms": timings,
+    })
 
-        print("\n================ SEARCH & RECOMMENDATION START ==================\n")
-        for res in results:
-            print(
-                f"- [{res['score']}] {res['title']} | {res['duration']} min | {res['instructor']} | {res['intensity']} | {res['type']}"
-            )
+@app.websocket("/ws/voice")
+async def voice_stream(websocket: WebSocket, top_k: int = 10):
+    """
+    Streaming voice session over one persistent connection.
 
-        return results
-    return []
+    The client sends binary frames of 16 kHz mono s16le PCM and may send
+    {"type": "end"} to flush early. The server pushes partial transcripts,
+    the intent once it is stable, refreshed results whenever the entities
+    change, and a final message after which the socket is closed. A malformed
+    control frame gets an {"type": "error"} reply and the session continues;
+    if the server is overloaded the session ends with an error and close
+    code 1013 (try again later).
+    """
+    await websocket.accept()
+    metrics.REQUESTS.inc("/ws/voice", "101")
+    trace = Trace()
+    session = VoiceSession(top_k=top_k, trace=trace)
+    with trace:
+        try:
+            while not session.finished:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                if message.get("bytes"):
+                    outgoing = await session.feed(message["bytes"])
+                elif message.get("text"):
+                    try:
+                        control = json.loads(message["text"])
+                    except json.JSONDecodeError:
+                        control = None
+                    if not isinstance(control, dict):
+                        await websocket.send_json({"type": "error", "detail": 'Expected a JSON object such as {"type": "end"}'})
+                        continue
+                    if control.get("type") != "end":
+                        continue
+                    outgoing = await session.finish()
+                else:
+                    continue
+                for msg in outgoing:
+                    await websocket.send_json(msg)
+            await websocket.close()
+        except (WorkerPoolBusy, BatchQueueFull) as e:
+            # Same condition the HTTP endpoints answer with 503
+            metrics.REQUESTS.inc("/ws/voice", "1013")
+            await websocket.send_json({"type": "error", "detail": str(e)})
+            await websocket.close(code=1013)
+        except WebSocketDisconnect:
+            pass
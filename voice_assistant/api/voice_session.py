@@ -0,0 +1,89 @@
+import time
+
+from voice_assistant.api.workers import run_cpu
+from voice_assistant.asr.audio import pcm16_to_float32
+from voice_assistant.asr.streaming import StreamingTranscriber
+from voice_assistant.nlu.nlu_pipeline import parse_text
+from voice_assistant.search.search_workouts import async_search_workouts
+from voice_assistant.utils.metrics import Trace
+
+
+class VoiceSession:
+    """
+    State for one streaming voice connection.
+
+    Audio arrives as raw 16 kHz mono s16le PCM frames. Every partial transcript
+    is parsed right away; the intent is announced once two consecutive parses
+    agree, and a search is (re)run whenever the parsed entities change, so
+    results are usually ready before the user stops talking.
+
+    `feed()` / `finish()` return the messages to push to the client:
+      {"type": "partial", "text"}
+      {"type": "intent", "intent", "entities"}
+      {"type": "results", "entities", "results"}
+      {"type": "final", "text", "intent", "entities", "results", "timings_ms"}
+    """
+
+    def __init__(self, top_k: int = 10, trace: Trace = None):
+        self.top_k = top_k
+        self.trace = trace or Trace()
+        self.transcriber = StreamingTranscriber()
+        self.started = time.perf_counter()
+        self._last_intent = None
+        self._stable_intent = None
+        self._searched_entities = None
+        self._parsed = {"intent": None, "entities": {}}
+        self.results = []
+
+    @property
+    def finished(self) -> bool:
+        return self.transcriber.finished
+
+    async def feed(self, frame: bytes) -> list:
+        events = await run_cpu(self.transcriber.feed, pcm16_to_float32(frame))
+        return await self._handle(events)
+
+    async def finish(self) -> list:
+        events = await run_cpu(self.transcriber.finish)
+        return await self._handle(events)
+
+    async def _handle(self, events: list) -> list:
+        messages = []
+        for event in events:
+            final = event["type"] == "final"
+            if not final:
+                messages.append({"type": "partial", "text": event["text"]})
+            if event["text"]:
+                messages += await self._update(event["text"], final)
+            if final:
+                messages.append({
+                    "type": "final",
+                    "text": event["text"],
+                    "intent": self._parsed["intent"],
+                    "entities": self._parsed["entities"],
+                    "results": self.results,
+                    "timings_ms": {
+                        **self.trace.timings_ms,
+                        "total": round((time.perf_counter() - self.started) * 1000, 1),
+                    },
+                })
+        return messages
+
+    async def _update(self, text: str, final: bool) -> list:
+        messages = []
+        self._parsed = await run_cpu(parse_text, text)
+        intent = self._parsed["intent"]
+
+        if (intent == self._last_intent or final) and intent != self._stable_intent:
+            self._stable_intent = intent
+            messages.append({"type": "intent", "intent": intent, "entities": self._parsed["entities"]})
+        self._last_intent = intent
+
+        if self._stable_intent == "search_class" and self._parsed["entities"] != self._searched_entities:
+            self._searched_entities = dict(self._parsed["entities"])
+            # The query builder normalizes entities in place, so hand it a copy
+            self.results = await async_search_workouts(intent, dict(self._parsed["entities"]), self.top_k)
+            messages.append({"type": "results", "entities": self._searched_entities, "results": self.results})
+        elif self._stable_intent not in (None, "search_class"):
+            self.results = []
+        return messages
@@ -0,0 +1,39 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from voice_assistant.utils import config
+
+# === Dedicated pool for CPU-bound inference ===
+# DistilBERT / spaCy / ffmpeg decode run here instead of on the event loop or
+# Starlette's shared default threadpool. The pool size bounds how many
+# inferences run at once; an extra semaphore bounds how many may wait, so a
+# burst gets a fast 503 instead of an ever-growing queue.
+nlu_pool = ThreadPoolExecutor(max_workers=config.NLU_WORKERS, thread_name_prefix="nlu")
+_pending = None
+
+
+class WorkerPoolBusy(Exception):
+    """Raised when more than NLU_MAX_PENDING inference calls are already queued."""
+
+
+def _semaphore() -> asyncio.Semaphore:
+    global _pending
+    if _pending is None:
+        _pending = asyncio.Semaphore(config.NLU_WORKERS + config.NLU_MAX_PENDING)
+    return _pending
+
+
+async def run_cpu(func, *args):
+    """Run a blocking, CPU-bound call in the inference pool."""
+    semaphore = _semaphore()
+    if semaphore.locked():
+        raise WorkerPoolBusy(f"Inference pool is saturated ({config.NLU_MAX_PENDING} requests waiting)")
+    async with semaphore:
+        # Carry the request's context (active trace) into the worker thread
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(nlu_pool, lambda: context.run(func, *args))
+
+
+def shutdown():
+    nlu_pool.shutdown(wait=False, cancel_futures=True)
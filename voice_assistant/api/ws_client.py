@@ -0,0 +1,55 @@
+'''
+Replay a WAV file into the /ws/voice endpoint at real-time pace and print
+what the server pushes back, with timestamps relative to the start of audio.
+
+    python voice_assistant/api/ws_client.py --file voice_assistant/data/input.wav
+'''
+import sys
+import json
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+import numpy as np
+import websockets
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.asr.streaming import iter_wav_chunks
+
+
+async def stream_file(url: str, path: str, chunk_ms: int, realtime: bool):
+    async with websockets.connect(url, max_size=None) as ws:
+        start = time.perf_counter()
+
+        async def sender():
+            for chunk in iter_wav_chunks(path, chunk_ms):
+                await ws.send((np.clip(chunk, -1, 1) * 32767).astype(np.int16).tobytes())
+                if realtime:
+                    await asyncio.sleep(chunk_ms / 1000)
+            await ws.send(json.dumps({"type": "end"}))
+
+        send_task = asyncio.create_task(sender())
+        try:
+            async for raw in ws:
+                msg = json.loads(raw)
+                elapsed = time.perf_counter() - start
+                if msg["type"] == "results":
+                    print(f"[{elapsed:6.2f}s] results: {len(msg['results'])} for {msg['entities']}")
+                else:
+                    print(f"[{elapsed:6.2f}s] {msg['type']}: {json.dumps({k: v for k, v in msg.items() if k not in ('type', 'results')})}")
+                if msg["type"] == "final":
+                    break
+        finally:
+            send_task.cancel()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file", required=True)
+    parser.add_argument("--url", default="ws://127.0.0.1:8000/ws/voice")
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    parser.add_argument("--fast", action="store_true", help="Send as fast as possible instead of real time")
+    args = parser.parse_args()
+    asyncio.run(stream_file(args.url, args.file, args.chunk_ms, not args.fast))
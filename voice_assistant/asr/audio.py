@@ -0,0 +1,72 @@
+import io
+import sys
+import wave
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+# Enable root-level imports
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+
+# Whisper expects 16 kHz mono float32 in [-1, 1]
+SAMPLE_RATE = 16000
+
+
+def pcm16_to_float32(data: bytes) -> np.ndarray:
+    """Convert raw little-endian 16-bit mono PCM to a float32 buffer."""
+    if len(data) % 2:
+        data = data[:-1]  # drop a trailing half sample from a truncated stream
+    return np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def _decode_wav(data: bytes):
+    """Decode a 16 kHz mono 16-bit WAV without spawning ffmpeg, else None."""
+    try:
+        with wave.open(io.BytesIO(data)) as wav:
+            if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) != (SAMPLE_RATE, 1, 2):
+                return None
+            return pcm16_to_float32(wav.readframes(wav.getnframes()))
+    except (wave.Error, EOFError):
+        return None
+
+
+def _decode_with_ffmpeg(data: bytes, input_format: str = None) -> np.ndarray:
+    """Pipe encoded audio (webm, ogg, mp3, ...) through ffmpeg entirely in memory."""
+    cmd = ["ffmpeg", "-nostdin", "-threads", "0"]
+    if input_format:
+        cmd += ["-f", input_format]
+    cmd += ["-i", "pipe:0", "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "pipe:1"]
+    proc = subprocess.run(cmd, input=data, capture_output=True)
+    if proc.returncode != 0:
+        raise ValueError(f"Failed to decode audio: {proc.stderr.decode(errors='ignore').strip()}")
+    return pcm16_to_float32(proc.stdout)
+
+
+def decode_audio_bytes(data: bytes, input_format: str = None) -> np.ndarray:
+    """
+    Decode an in-memory audio blob to a 16 kHz float32 buffer.
+
+    `input_format="s16le"` marks the bytes as raw 16 kHz mono PCM; otherwise
+    WAV is parsed directly and anything else is decoded by ffmpeg over pipes.
+    """
+    if not data:
+        raise ValueError("Empty audio payload")
+    if input_format == "s16le":
+        return pcm16_to_float32(data)
+    if input_format in (None, "wav") and data[:4] == b"RIFF":
+        audio = _decode_wav(data)
+        if audio is not None:
+            return audio
+    return _decode_with_ffmpeg(data, input_format)
+
+
+def record_audio(duration: float = 5) -> np.ndarray:
+    """Record from the default ALSA device straight into memory."""
+    record_cmd = [
+        "ffmpeg", "-nostdin", "-f", "alsa", "-i", "default", "-t", str(duration),
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "pipe:1",
+    ]
+    proc = subprocess.run(record_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    return pcm16_to_float32(proc.stdout)
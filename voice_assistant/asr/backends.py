@@ -0,0 +1,165 @@
+import sys
+import copy
+from pathlib import Path
+
+import numpy as np
+import torch
+import whisper
+
+# Enable root-level imports
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.utils import config
+from voice_assistant.asr.model_registry import get_whisper_model
+
+
+# === Backend interface ===
+class ASRBackend:
+    """
+    Common interface for speech-to-text engines.
+
+    Every backend takes 16 kHz mono float32 buffers. Decoding options come from
+    config (ASR_BEAM_SIZE, ASR_TEMPERATURES, ASR_LANGUAGE) unless overridden
+    per call.
+    """
+
+    name = "base"
+
+    def __init__(self, model_size: str):
+        self.model_size = model_size
+        self.beam_size = config.ASR_BEAM_SIZE
+        self.temperatures = config.ASR_TEMPERATURES
+        self.language = config.ASR_LANGUAGE
+
+    def transcribe(self, audio: np.ndarray, **overrides) -> str:
+        raise NotImplementedError
+
+    def decode_batch(self, audios: list) -> list:
+        """Default: sequential decode. Backends with real batching override this."""
+        return [self.transcribe(audio) for audio in audios]
+
+
+# === openai-whisper (PyTorch) ===
+class WhisperBackend(ASRBackend):
+    """Reference fp32 openai-whisper model on ASR_DEVICE."""
+
+    name = "whisper"
+
+    def __init__(self, model_size: str):
+        super().__init__(model_size)
+        self.model = self._load_model()
+
+    def _load_model(self):
+        return get_whisper_model(self.model_size)
+
+    @property
+    def _fp16(self) -> bool:
+        return next(self.model.parameters()).device.type == "cuda"
+
+    def transcribe(self, audio: np.ndarray, **overrides) -> str:
+        options = {
+            "beam_size": self.beam_size,
+            "temperature": self.temperatures,
+            "language": self.language,
+            "fp16": self._fp16,
+        }
+        options.update(overrides)
+        result = self.model.transcribe(audio.astype(np.float32, copy=False), **options)
+        return result["text"].strip()
+
+    @staticmethod
+    def _needs_fallback(result) -> bool:
+        # The checks whisper.transcribe() uses to move on to the next temperature
+        if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+            return False  # silence: nothing better to decode
+        return result.compression_ratio > 2.4 or result.avg_logprob < -1.0
+
+    def decode_batch(self, audios: list) -> list:
+        """
+        One padded decode at the first temperature over the utterances that fit
+        Whisper's 30 s window. Longer clips (pad_or_trim would cut them) and
+        batched results that fail whisper's quality checks go through
+        transcribe(), which handles any length and the temperature fallback.
+        """
+        texts = [None] * len(audios)
+        short = [i for i, audio in enumerate(audios) if len(audio) <= whisper.audio.N_SAMPLES]
+        if short:
+            device = next(self.model.parameters()).device
+            mels = torch.stack([
+                whisper.log_mel_spectrogram(whisper.pad_or_trim(audios[i]), n_mels=self.model.dims.n_mels)
+                for i in short
+            ]).to(device)
+            options = whisper.DecodingOptions(
+                language=self.language,
+                beam_size=self.beam_size,
+                temperature=self.temperatures[0],
+                without_timestamps=True,
+                fp16=self._fp16,
+            )
+            with torch.inference_mode():
+                results = whisper.decode(self.model, mels, options)
+            for i, result in zip(short, results):
+                if len(self.temperatures) == 1 or not self._needs_fallback(result):
+                    texts[i] = result.text.strip()
+        return [text if text is not None else self.transcribe(audio) for text, audio in zip(texts, audios)]
+
+
+def _to_plain_linear(module: torch.nn.Module):
+    """
+    Swap whisper's Linear subclass for torch.nn.Linear.
+
+    quantize_dynamic only converts exact nn.Linear types; whisper's subclass
+    merely casts weights to the input dtype, which is a no-op in fp32 on CPU.
+    """
+    for name, child in module.named_children():
+        if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+            plain = torch.nn.Linear(child.in_features, child.out_features, bias=child.bias is not None)
+            plain.load_state_dict(child.state_dict())
+            setattr(module, name, plain)
+        else:
+            _to_plain_linear(child)
+
+
+class QuantizedWhisperBackend(WhisperBackend):
+    """openai-whisper with dynamic int8 quantization of every Linear layer (CPU only)."""
+
+    name = "whisper-int8"
+
+    def _load_model(self):
+        model = copy.deepcopy(get_whisper_model(self.model_size, device="cpu"))
+        _to_plain_linear(model)
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8).eval()
+
+
+# === CTranslate2 (faster-whisper) ===
+class FasterWhisperBackend(ASRBackend):
+    """CTranslate2 int8 Whisper via the optional faster-whisper package."""
+
+    name = "faster-whisper"
+
+    def __init__(self, model_size: str):
+        super().__init__(model_size)
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as e:
+            raise ImportError("ASR_BACKEND=faster-whisper requires `pip install faster-whisper`") from e
+        self.model = WhisperModel(model_size, device="cpu", compute_type=config.ASR_COMPUTE_TYPE)
+
+    def transcribe(self, audio: np.ndarray, **overrides) -> str:
+        options = {
+            "beam_size": self.beam_size or 1,
+            "temperature": list(self.temperatures),
+            "language": self.language,
+        }
+        options.update(overrides)
+        if isinstance(options["temperature"], (int, float)):
+            options["temperature"] = [options["temperature"]]
+        segments, _ = self.model.transcribe(audio.astype(np.float32, copy=False), **options)
+        return "".join(segment.text for segment in segments).strip()
+
+
+BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    QuantizedWhisperBackend.name: QuantizedWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
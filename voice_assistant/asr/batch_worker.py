@@ -0,0 +1,56 @@
+import sys
+from concurrent.futures import Future
+from pathlib import Path
+
+import numpy as np
+
+# Enable root-level imports
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.utils import config
+from voice_assistant.utils.batching import BatchQueueFull, MicroBatcher
+from voice_assistant.asr.model_registry import get_asr_backend
+
+
+class ASRQueueFull(BatchQueueFull):
+    """Raised when the ASR request queue is full (backpressure signal)."""
+
+
+class ASRBatchWorker(MicroBatcher):
+    """
+    Background worker that decodes queued utterances in padded batches.
+
+    Callers `submit()` 16 kHz float32 buffers and get a Future back. Pending
+    utterances are grouped (up to ASR_MAX_BATCH_SIZE, waiting at most
+    ASR_MAX_WAIT_MS) and run through the backend's batched decode; Whisper pads
+    every utterance to its 30 s window, and decodes longer clips (or ones that
+    fail its quality checks) on their own with the full temperature fallback.
+    More than ASR_QUEUE_SIZE waiting requests raises ASRQueueFull.
+    """
+
+    name = "asr-batch-worker"
+    queue_full_error = ASRQueueFull
+
+    def __init__(self, backend: str = None, model_size: str = None, max_batch_size: int = None, max_wait_ms: float = None, max_queue: int = None):
+        super().__init__(
+            max_batch_size=max_batch_size or config.ASR_MAX_BATCH_SIZE,
+            max_wait_ms=max_wait_ms if max_wait_ms is not None else config.ASR_MAX_WAIT_MS,
+            max_queue=max_queue or config.ASR_QUEUE_SIZE,
+        )
+        self.backend = backend
+        self.model_size = model_size
+
+    def setup(self):
+        self.asr = get_asr_backend(self.backend, self.model_size)
+
+    def process_batch(self, audios: list) -> list:
+        return self.asr.decode_batch(audios)
+
+    def submit(self, audio: np.ndarray, timeout: float = 0) -> Future:
+        return super().submit(audio.astype(np.float32, copy=False), timeout)
+
+    def transcribe(self, audio: np.ndarray, timeout: float = None) -> str:
+        return self.submit(audio).result(timeout)
+
+    async def transcribe_async(self, audio: np.ndarray) -> str:
+        return await self.submit_async(audio)
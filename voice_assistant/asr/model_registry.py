@@ -0,0 +1,88 @@
+import sys
+import time
+import threading
+from pathlib import Path
+
+import psutil
+
+# Enable root-level imports
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.utils import config
+from voice_assistant.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# === Process-wide ASR model registry ===
+# Each (backend, model size) pair is loaded at most once per process and shared
+# by every caller (CLI recording, file transcription, API endpoints).
+_models = {}
+_stats = {}
+_lock = threading.Lock()
+
+
+def _load_once(key: str, loader):
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    with _lock:
+        # Another thread may have finished loading while we waited for the lock
+        if key in _models:
+            return _models[key]
+
+        logger.info("Loading ASR model (%s)...", key)
+        process = psutil.Process()
+        rss_before = process.memory_info().rss
+        start = time.perf_counter()
+        model = loader()
+        load_seconds = time.perf_counter() - start
+        rss_after = process.memory_info().rss
+
+        _stats[key] = {
+            "load_seconds": round(load_seconds, 3),
+            "rss_delta_mb": round((rss_after - rss_before) / 1024 ** 2, 1),
+        }
+        if hasattr(model, "parameters"):
+            param_bytes = sum(p.numel() * p.element_size() for p in model.parameters())
+            _stats[key]["param_mb"] = round(param_bytes / 1024 ** 2, 1)
+        logger.info("ASR model (%s) loaded: %s", key, _stats[key])
+        _models[key] = model
+        return model
+
+
+def get_whisper_model(size: str = None, device: str = None):
+    """Return the cached fp32 openai-whisper model for `size`, loading it on first use."""
+    import whisper
+
+    size = size or config.WHISPER_MODEL
+    device = device or config.ASR_DEVICE
+    return _load_once(f"whisper:{size}:{device}", lambda: whisper.load_model(size, device=device))
+
+
+def get_asr_backend(name: str = None, size: str = None):
+    """Return the cached ASR backend selected by ASR_BACKEND / WHISPER_MODEL."""
+    # Imported here: backends build on get_whisper_model from this module
+    from voice_assistant.asr.backends import BACKENDS
+
+    name = name or config.ASR_BACKEND
+    size = size or config.WHISPER_MODEL
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown ASR backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+    return _load_once(f"{name}:{size}", lambda: BACKENDS[name](size))
+
+
+def warmup(backends=None):
+    """Load the configured ASR backend(s) ahead of the first request."""
+    for name in backends or [config.ASR_BACKEND]:
+        get_asr_backend(name)
+    return model_stats()
+
+
+def model_stats() -> dict:
+    """Load time and memory footprint of every model loaded in this process."""
+    return {key: dict(stats) for key, stats in _stats.items()}
+
+
+def loaded_models() -> list:
+    return list(_models)
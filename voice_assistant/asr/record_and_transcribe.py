@@ -1,19 +1,31 @@
-import subprocess
-import whisper
 import sys
 import argparse
 from pathlib import Path
 
-project_root = Path(__file__).resolve().parent.parent
+project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(project_root))
-from voice_assistant.asr.transcribe import transcribe_audio
+from voice_assistant.asr.audio import record_audio
+from voice_assistant.asr.transcribe import transcribe_array
+from voice_assistant.asr.streaming import iter_microphone_chunks, transcribe_stream
+from voice_assistant.utils.log import get_logger
 
-def record_and_transcribe(path="voice_assistant/data/input.wav", duration=5):
-    print("[INFO] Recording audio...")
-    record_cmd = [
-        "ffmpeg", "-y", "-f", "alsa", "-i", "default", "-t", str(duration), path
-    ]
-    subprocess.run(record_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+logger = get_logger(__name__)
 
-    print("[INFO] Running Whisper ASR...")
-    return transcribe_audio(path)
+def record_and_transcribe(duration=5):
+    logger.info("Recording audio...")
+    audio = record_audio(duration)
+
+    logger.info("Running Whisper ASR...")
+    return transcribe_array(audio)
+
+def stream_and_transcribe(on_partial=None):
+    """Record until end of speech instead of a fixed duration."""
+    logger.info("Listening (stops at end of speech)...")
+    for event in transcribe_stream(iter_microphone_chunks()):
+        if event["type"] == "partial":
+            if on_partial:
+                on_partial(event["text"])
+            continue
+        logger.info("Transcription: %s", event["text"])
+        return event["text"]
+    return ""
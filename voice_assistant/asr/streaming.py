@@ -0,0 +1,226 @@
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+# Enable root-level imports
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.utils import config
+from voice_assistant.asr.audio import SAMPLE_RATE, pcm16_to_float32, decode_audio_bytes
+from voice_assistant.asr.model_registry import get_asr_backend
+from voice_assistant.utils.metrics import timed
+
+
+# === Voice activity detection ===
+class EnergyVAD:
+    """
+    Frame-level energy VAD with an adaptive noise floor.
+
+    A frame counts as speech when its RMS level is above both the absolute
+    threshold and the running noise floor plus a margin. The noise floor is
+    seeded from the quietest of the first `calibration_frames` frames (only the
+    absolute threshold applies until then), so a stream that starts mid-word
+    does not take speech for the floor. Afterwards it only adapts on
+    non-speech frames so a long utterance cannot raise it.
+    """
+
+    def __init__(self, threshold_db: float = None, margin_db: float = 10.0, calibration_frames: int = 10):
+        self.threshold_db = config.VAD_THRESHOLD_DB if threshold_db is None else threshold_db
+        self.margin_db = margin_db
+        self.calibration_frames = calibration_frames
+        self.noise_floor_db = None
+        self._calibration = []
+
+    @staticmethod
+    def level_db(frame: np.ndarray) -> float:
+        rms = float(np.sqrt(np.mean(np.square(frame)))) if len(frame) else 0.0
+        return 20 * np.log10(max(rms, 1e-10))
+
+    def is_speech(self, frame: np.ndarray) -> bool:
+        level = self.level_db(frame)
+        if self.noise_floor_db is None:
+            self._calibration.append(level)
+            if len(self._calibration) < self.calibration_frames:
+                return level > self.threshold_db
+            self.noise_floor_db = min(self._calibration)
+        speech = level > max(self.threshold_db, self.noise_floor_db + self.margin_db)
+        if not speech:
+            self.noise_floor_db = 0.95 * self.noise_floor_db + 0.05 * level
+        return speech
+
+
+# === Audio sources ===
+def iter_wav_chunks(path: str, chunk_ms: int = None):
+    """Yield float32 chunks from a WAV file, e.g. a recorded test fixture."""
+    chunk_ms = chunk_ms or config.ASR_CHUNK_MS
+    with open(path, "rb") as f:
+        audio = decode_audio_bytes(f.read())
+    step = int(SAMPLE_RATE * chunk_ms / 1000)
+    for start in range(0, len(audio), step):
+        yield audio[start:start + step]
+
+
+def iter_microphone_chunks(chunk_ms: int = None, max_seconds: float = None):
+    """Yield float32 chunks from the default ALSA device as they are captured."""
+    chunk_ms = chunk_ms or config.ASR_CHUNK_MS
+    max_seconds = max_seconds or config.ASR_MAX_SECONDS
+    cmd = [
+        "ffmpeg", "-nostdin", "-f", "alsa", "-i", "default", "-t", str(max_seconds),
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "pipe:1",
+    ]
+    chunk_bytes = int(SAMPLE_RATE * chunk_ms / 1000) * 2
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            data = proc.stdout.read(chunk_bytes)
+            if not data:
+                break
+            yield pcm16_to_float32(data)
+    finally:
+        # The consumer stops iterating at end of speech; stop recording with it
+        proc.kill()
+        proc.wait()
+
+
+# === Streaming transcription ===
+class StreamingTranscriber:
+    """
+    Incremental Whisper transcription over a stream of audio chunks.
+
+    Feed 16 kHz float32 chunks with `feed()`; it returns events as they become
+    available:
+      {"type": "partial", "text": ..., "audio_seconds": ...}  while speaking
+      {"type": "final",   "text": ..., "audio_seconds": ...}  at end of speech
+    End of speech is `silence_ms` of non-speech after at least `min_speech_ms`
+    of speech, or `max_seconds` of audio in total. Partials decode only the
+    last `partial_window_ms` of audio, so their cost stays flat as the
+    utterance grows; the final decodes everything.
+    """
+
+    def __init__(
+        self,
+        model_size: str = None,
+        vad: EnergyVAD = None,
+        frame_ms: int = 30,
+        partial_interval_ms: int = None,
+        silence_ms: int = None,
+        min_speech_ms: int = 150,
+        preroll_ms: int = 300,
+        max_seconds: float = None,
+        partial_window_ms: int = None,
+        asr=None,
+    ):
+        self.asr = asr or get_asr_backend(size=model_size)
+        self.vad = vad or EnergyVAD()
+        self.frame_size = int(SAMPLE_RATE * frame_ms / 1000)
+        self.frame_ms = frame_ms
+        self.partial_interval_ms = partial_interval_ms or config.ASR_PARTIAL_INTERVAL_MS
+        self.silence_ms = silence_ms or config.VAD_SILENCE_MS
+        self.min_speech_ms = min_speech_ms
+        self.preroll_frames = max(1, preroll_ms // frame_ms)
+        self.max_samples = int(SAMPLE_RATE * (max_seconds or config.ASR_MAX_SECONDS))
+        self.partial_window_frames = max(1, (partial_window_ms or config.ASR_PARTIAL_WINDOW_MS) // frame_ms)
+        self.reset()
+
+    def reset(self):
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._frames = []
+        self._speech_ms = 0
+        self._silence_run_ms = 0
+        self._since_partial_ms = 0
+        self._total_samples = 0
+        self.last_text = ""
+        self.finished = False
+
+    @property
+    def audio(self) -> np.ndarray:
+        return np.concatenate(self._frames) if self._frames else np.zeros(0, dtype=np.float32)
+
+    def _decode(self, audio: np.ndarray) -> str:
+        # Partials are re-decoded often: greedy, no temperature fallback
+        with timed("asr"):
+            return self.asr.transcribe(audio, temperature=0.0, condition_on_previous_text=False)
+
+    def _event(self, kind: str) -> dict:
+        if kind == "partial":
+            audio = np.concatenate(self._frames[-self.partial_window_frames:])
+        else:
+            audio = self.audio
+        self.last_text = self._decode(audio)
+        return {
+            "type": kind,
+            "text": self.last_text,
+            "audio_seconds": round(len(self._frames) * self.frame_size / SAMPLE_RATE, 2),
+        }
+
+    def feed(self, chunk: np.ndarray) -> list:
+        if self.finished:
+            return []
+        events = []
+        self._pending = np.concatenate([self._pending, chunk.astype(np.float32, copy=False)])
+
+        while len(self._pending) >= self.frame_size and not self.finished:
+            frame = self._pending[:self.frame_size]
+            self._pending = self._pending[self.frame_size:]
+            self._total_samples += len(frame)
+
+            if self.vad.is_speech(frame):
+                self._speech_ms += self.frame_ms
+                self._silence_run_ms = 0
+            elif self._speech_ms:
+                self._silence_run_ms += self.frame_ms
+
+            self._frames.append(frame)
+            if not self._speech_ms:
+                # Keep only a short pre-roll of leading silence
+                self._frames = self._frames[-self.preroll_frames:]
+                if self._total_samples >= self.max_samples:
+                    # Nothing but silence or noise up to the limit: end without decoding
+                    events.append({"type": "final", "text": "", "audio_seconds": 0.0})
+                    self.finished = True
+                continue
+
+            self._since_partial_ms += self.frame_ms
+            end_of_speech = (
+                self._speech_ms >= self.min_speech_ms and self._silence_run_ms >= self.silence_ms
+            )
+            if end_of_speech or self._total_samples >= self.max_samples:
+                events.append(self._event("final"))
+                self.finished = True
+            elif self._since_partial_ms >= self.partial_interval_ms and not self._silence_run_ms:
+                self._since_partial_ms = 0
+                events.append(self._event("partial"))
+        return events
+
+    def finish(self) -> list:
+        """Flush at end of input (e.g. the end of a WAV fixture)."""
+        if self.finished:
+            return []
+        self.finished = True
+        if not self._speech_ms:
+            return [{"type": "final", "text": "", "audio_seconds": 0.0}]
+        return [self._event("final")]
+
+
+def transcribe_stream(chunks, **kwargs):
+    """Yield partial and final events for an iterable of audio chunks."""
+    transcriber = StreamingTranscriber(**kwargs)
+    for chunk in chunks:
+        yield from transcriber.feed(chunk)
+        if transcriber.finished:
+            return
+    yield from transcriber.finish()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file", help="Stream a WAV file instead of the microphone")
+    parser.add_argument("--model", default=None, help="Whisper model size (defaults to WHISPER_MODEL)")
+    args = parser.parse_args()
+
+    source = iter_wav_chunks(args.file) if args.file else iter_microphone_chunks()
+    for event in transcribe_stream(source, model_size=args.model):
+        print(f"[{event['type'].upper()}] ({event['audio_seconds']}s) {event['text']}")
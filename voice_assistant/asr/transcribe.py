@@ -1,23 +1,41 @@
-import whisper
 import sys
 import argparse
 from pathlib import Path
 
+import numpy as np
+
 # Enable root-level imports
-project_root = Path(__file__).resolve().parent.parent
+project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(project_root))
+from voice_assistant.asr.model_registry import get_asr_backend
+from voice_assistant.asr.audio import decode_audio_bytes
+from voice_assistant.utils.log import get_logger
+from voice_assistant.utils.metrics import timed
+
+logger = get_logger(__name__)
 
-def transcribe_audio(file_path: str) -> str:
-    print("Loading Whisper model...")
-    model = whisper.load_model("base")
-    print("Transcribing...")
-    result = model.transcribe(file_path)
-    transcription = result["text"]
-    print("Transcription:", transcription)
+def transcribe_array(audio: np.ndarray, model_size: str = None, backend: str = None) -> str:
+    """Transcribe a 16 kHz float32 buffer that is already in memory."""
+    asr = get_asr_backend(backend, model_size)
+    with timed("asr"):
+        transcription = asr.transcribe(audio)
+    logger.debug("Transcription: %s", transcription)
     return transcription
 
+def transcribe_bytes(data: bytes, input_format: str = None, model_size: str = None, backend: str = None) -> str:
+    """Transcribe raw PCM or an encoded blob (e.g. an upload) with no temp file."""
+    with timed("audio_decode"):
+        audio = decode_audio_bytes(data, input_format)
+    return transcribe_array(audio, model_size, backend)
+
+def transcribe_audio(file_path: str, model_size: str = None, backend: str = None) -> str:
+    with open(file_path, "rb") as f:
+        return transcribe_bytes(f.read(), model_size=model_size, backend=backend)
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--file", required=True)
+    parser.add_argument("--model", default=None, help="Whisper model size (defaults to WHISPER_MODEL)")
+    parser.add_argument("--backend", default=None, help="ASR backend (defaults to ASR_BACKEND)")
     args = parser.parse_args()
-    transcribe_audio(args.file)
+    print("Transcription:", transcribe_audio(args.file, args.model, args.backend))
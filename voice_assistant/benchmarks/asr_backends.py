@@ -0,0 +1,76 @@
+'''
+Compare ASR backends on real-time factor (RTF) and word error rate (WER).
+
+The manifest is a CSV with `path,text` columns (audio file, reference transcript):
+
+    python voice_assistant/benchmarks/asr_backends.py --manifest asr_manifest.csv --backends whisper,whisper-int8
+'''
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.asr.audio import SAMPLE_RATE, decode_audio_bytes
+from voice_assistant.asr.model_registry import get_asr_backend, model_stats
+
+
+def normalize_words(text: str) -> list:
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+
+def word_errors(reference: str, hypothesis: str):
+    """Levenshtein distance over words; returns (errors, reference length)."""
+    ref, hyp = normalize_words(reference), normalize_words(hypothesis)
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        cur = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = cur
+    return prev[-1], len(ref)
+
+
+def evaluate_backend(name: str, size: str, samples: list) -> dict:
+    asr = get_asr_backend(name, size)
+    asr.transcribe(samples[0][0])  # warmup
+
+    decode_seconds, audio_seconds, errors, ref_words = 0.0, 0.0, 0, 0
+    for audio, reference in samples:
+        start = time.perf_counter()
+        hypothesis = asr.transcribe(audio)
+        decode_seconds += time.perf_counter() - start
+        audio_seconds += len(audio) / SAMPLE_RATE
+        e, n = word_errors(reference, hypothesis)
+        errors += e
+        ref_words += n
+
+    return {
+        "backend": name,
+        "model": size or "",
+        "rtf": round(decode_seconds / audio_seconds, 3),
+        "wer": round(errors / max(ref_words, 1), 3),
+        "avg_latency_s": round(decode_seconds / len(samples), 3),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--manifest", required=True, help="CSV with path,text columns")
+    parser.add_argument("--backends", default="whisper,whisper-int8")
+    parser.add_argument("--model", default=None, help="Whisper model size (defaults to WHISPER_MODEL)")
+    args = parser.parse_args()
+
+    manifest = pd.read_csv(args.manifest)
+    samples = []
+    for row in manifest.itertuples():
+        with open(row.path, "rb") as f:
+            samples.append((decode_audio_bytes(f.read()), row.text))
+
+    rows = [evaluate_backend(name, args.model, samples) for name in args.backends.split(",")]
+    print(pd.DataFrame(rows).to_string(index=False))
+    print("\n[INFO] Model load stats:", model_stats())
@@ -0,0 +1,65 @@
+'''
+Measure Whisper throughput (utterances/sec) as a function of batch size on CPU.
+
+    python voice_assistant/benchmarks/asr_batch_throughput.py --file voice_assistant/data/input.wav
+'''
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import torch
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.asr.audio import decode_audio_bytes
+from voice_assistant.asr.batch_worker import ASRBatchWorker
+from voice_assistant.asr.model_registry import get_asr_backend
+
+
+def bench_direct(asr, audio, batch_size, n_utterances):
+    """Raw batched decode throughput, no queueing."""
+    asr.decode_batch([audio] * batch_size)  # warmup
+    start = time.perf_counter()
+    done = 0
+    while done < n_utterances:
+        asr.decode_batch([audio] * batch_size)
+        done += batch_size
+    return done / (time.perf_counter() - start)
+
+
+def bench_worker(backend, audio, batch_size, n_utterances, max_wait_ms):
+    """Throughput through the queue when n_utterances arrive at once."""
+    worker = ASRBatchWorker(backend, max_batch_size=batch_size, max_wait_ms=max_wait_ms, max_queue=n_utterances).start()
+    start = time.perf_counter()
+    futures = [worker.submit(audio) for _ in range(n_utterances)]
+    for f in futures:
+        f.result()
+    elapsed = time.perf_counter() - start
+    stats = worker.stats()
+    worker.stop()
+    return n_utterances / elapsed, stats["mean_batch_size"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file", required=True, help="WAV/encoded utterance to decode repeatedly")
+    parser.add_argument("--batch-sizes", default="1,2,4,8,16")
+    parser.add_argument("--utterances", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=20)
+    parser.add_argument("--backend", default=None, help="ASR backend (defaults to ASR_BACKEND)")
+    parser.add_argument("--threads", type=int, default=None, help="torch intra-op threads")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    with open(args.file, "rb") as f:
+        audio = decode_audio_bytes(f.read())
+    asr = get_asr_backend(args.backend)
+
+    print(f"[INFO] backend={asr.name} torch threads={torch.get_num_threads()} utterances={args.utterances}")
+    print(f"{'batch':>5} | {'direct utt/s':>12} | {'worker utt/s':>12} | {'mean batch':>10}")
+    for batch_size in [int(b) for b in args.batch_sizes.split(",")]:
+        direct = bench_direct(asr, audio, batch_size, args.utterances)
+        worker, mean_batch = bench_worker(args.backend, audio, batch_size, args.utterances, args.max_wait_ms)
+        print(f"{batch_size:>5} | {direct:>12.2f} | {worker:>12.2f} | {mean_batch:>10.2f}")
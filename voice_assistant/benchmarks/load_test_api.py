@@ -0,0 +1,73 @@
+'''
+Concurrent load test for the FastAPI search endpoint.
+
+Start the API with the worker settings under test, e.g.
+
+    NLU_WORKERS=1 uvicorn voice_assistant.api.main:app --workers 1
+    NLU_WORKERS=4 OMP_NUM_THREADS=1 uvicorn voice_assistant.api.main:app --workers 2
+
+then compare throughput and latency percentiles at increasing concurrency:
+
+    python voice_assistant/benchmarks/load_test_api.py --concurrency 1,4,16 --requests 200
+'''
+import time
+import asyncio
+import argparse
+
+import httpx
+import numpy as np
+
+UTTERANCES = [
+    "find me a 20 minute yoga with Alex",
+    "yoga",
+    "30 min high intensity cycling",
+    "I want to lose weight, give me a 45 minute run",
+    "show me a relaxing stretching class",
+    "hello there",
+    "how many calories did I burn today",
+    "strength training with Cody",
+]
+
+
+async def run_level(url: str, concurrency: int, n_requests: int) -> dict:
+    latencies, errors = [], 0
+    counter = iter(range(n_requests))
+
+    async with httpx.AsyncClient(timeout=60, limits=httpx.Limits(max_connections=concurrency)) as http:
+        async def user():
+            nonlocal errors
+            for i in counter:
+                start = time.perf_counter()
+                try:
+                    res = await http.post(url, json={"text": UTTERANCES[i % len(UTTERANCES)]})
+                    res.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+                except httpx.HTTPError:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    return {
+        "concurrency": concurrency,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(float(np.percentile(ms, 50)), 1),
+        "p95_ms": round(float(np.percentile(ms, 95)), 1),
+        "p99_ms": round(float(np.percentile(ms, 99)), 1),
+        "errors": errors,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8000/api/search")
+    parser.add_argument("--concurrency", default="1,4,16")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'conc':>4} | {'req/s':>7} | {'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8} | errors")
+    for level in [int(c) for c in args.concurrency.split(",")]:
+        r = asyncio.run(run_level(args.url, level, args.requests))
+        print(f"{r['concurrency']:>4} | {r['rps']:>7} | {r['p50_ms']:>8} | {r['p95_ms']:>8} | {r['p99_ms']:>8} | {r['errors']}")
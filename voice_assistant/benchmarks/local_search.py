@@ -0,0 +1,52 @@
+'''
+In-process search engine latency, optionally checked against OpenSearch.
+
+    python voice_assistant/benchmarks/local_search.py
+    python voice_assistant/benchmarks/local_search.py --catalog voice_assistant/data/database_workouts/augmented_workouts.json --compare-opensearch
+'''
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.utils import config
+from voice_assistant.search.local_engine import LocalWorkoutIndex
+from voice_assistant.benchmarks.search_query_builder import entity_grid  # same grid as the query builder regression
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--catalog", default=config.LOCAL_CATALOG_PATH)
+parser.add_argument("--queries", type=int, default=500)
+parser.add_argument("--repeats", type=int, default=5)
+parser.add_argument("--top-k", type=int, default=10)
+parser.add_argument("--compare-opensearch", action="store_true", help="Check top-k ids against the live index")
+args = parser.parse_args()
+
+start = time.perf_counter()
+index = LocalWorkoutIndex.from_file(args.catalog)
+print(f"[INFO] Built local index over {len(index.docs)} docs in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+grid = entity_grid(args.queries)
+timings_ms = []
+for entities in grid:
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        index.search(dict(entities), args.top_k)
+        timings_ms.append((time.perf_counter() - start) * 1000)
+print(f"[INFO] Local search p50={statistics.median(timings_ms):.3f} ms p99={statistics.quantiles(timings_ms, n=100)[98]:.3f} ms")
+
+if args.compare_opensearch:
+    from voice_assistant.search.query_builder import build_query
+    from voice_assistant.search.search_workouts import INDEX_NAME, get_client
+
+    client = get_client()
+    same = 0
+    for entities in grid:
+        positions, _ = index.rank(dict(entities), args.top_k)
+        local_ids = [index.ids[p] for p in positions]
+        response = client.search(index=INDEX_NAME, body=build_query(dict(entities), args.top_k))
+        remote_ids = [hit["_id"] for hit in response["hits"]["hits"]]
+        same += local_ids == remote_ids
+    print(f"[INFO] Top-{args.top_k} identical to OpenSearch for {same}/{len(grid)} queries")
@@ -0,0 +1,83 @@
+'''
+Gazetteer fast-path hit rate and latency.
+
+Input is either the NER json (`text` + `entities` char spans, as written by
+generate_ner_data.py) or a plain text file with one utterance per line. With
+gold spans, entity accuracy on fast-path hits is reported as well.
+
+    python voice_assistant/benchmarks/nlu_fast_path.py --data voice_assistant/data/entity_data/dev.json
+    python voice_assistant/benchmarks/nlu_fast_path.py --data utterances.txt --compare-neural
+'''
+import sys
+import json
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.nlu.gazetteer import Gazetteer
+
+
+def load_records(path: str) -> list:
+    if path.endswith(".json"):
+        with open(path) as f:
+            data = json.load(f)
+        return [
+            {"text": r["text"], "entities": {label.lower(): r["text"][s:e] for s, e, label in r["entities"]}}
+            for r in data
+        ]
+    with open(path) as f:
+        return [{"text": line.strip(), "entities": None} for line in f if line.strip()]
+
+
+def percentile(values: list, q: float) -> float:
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--data", required=True)
+parser.add_argument("--limit", type=int, default=None)
+parser.add_argument("--compare-neural", action="store_true", help="Also time the DistilBERT + spaCy path on the same utterances")
+args = parser.parse_args()
+
+records = load_records(args.data)[:args.limit]
+
+start = time.perf_counter()
+gazetteer = Gazetteer()
+print(f"[INFO] Built automaton over {gazetteer.size} phrases in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+latencies_ms, hits, exact, gold_hits = [], [], 0, 0
+for record in records:
+    start = time.perf_counter()
+    parsed = gazetteer.parse(record["text"])
+    latencies_ms.append((time.perf_counter() - start) * 1000)
+    if parsed is None:
+        continue
+    hits.append(record)
+    if record["entities"] is not None:
+        gold_hits += 1
+        exact += {k: v.lower() for k, v in parsed["entities"].items()} == {k: v.lower() for k, v in record["entities"].items()}
+
+print(f"[INFO] Utterances: {len(records)}")
+print(f"[INFO] Fast-path hit rate: {len(hits) / max(len(records), 1):.2%}")
+print(f"[INFO] Gazetteer latency p50={percentile(latencies_ms, 50):.3f} ms p99={percentile(latencies_ms, 99):.3f} ms")
+if gold_hits:
+    print(f"[INFO] Exact entity match on hits: {exact / gold_hits:.2%}")
+
+if args.compare_neural:
+    from voice_assistant.nlu.nlu_pipeline import NLUPipeline
+
+    pipeline = NLUPipeline(fast_path=False).warmup()
+    neural_ms = []
+    for record in records:
+        start = time.perf_counter()
+        pipeline.run(record["text"])
+        neural_ms.append((time.perf_counter() - start) * 1000)
+    print(f"[INFO] Neural latency    p50={percentile(neural_ms, 50):.3f} ms p99={percentile(neural_ms, 99):.3f} ms")
+    blended = statistics.mean(
+        g if parsed else g + n  # a miss pays for the gazetteer check too
+        for g, n, parsed in zip(latencies_ms, neural_ms, (gazetteer.parse(r["text"]) for r in records))
+    )
+    print(f"[INFO] Mean latency with fast path: {blended:.3f} ms (neural only: {statistics.mean(neural_ms):.3f} ms)")
@@ -0,0 +1,71 @@
+'''
+Concurrent load test for OpenSearch through the pooled client factory.
+
+Runs `--concurrency` asyncio workers issuing the query builder's entity grid
+against one shared AsyncOpenSearch client (the result cache is bypassed) and
+reports throughput, latency percentiles, errors and retries. Compare pool
+sizes to pick OPENSEARCH_POOL_SIZE:
+
+    python voice_assistant/benchmarks/search_load_test.py --concurrency 64 --pool-size 8
+    python voice_assistant/benchmarks/search_load_test.py --concurrency 64 --pool-size 64 --duration 30
+'''
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.search.client import async_with_retries, create_async_client
+from voice_assistant.search.query_builder import build_query
+from voice_assistant.search.search_workouts import INDEX_NAME
+from voice_assistant.utils.metrics import SEARCH_RETRIES
+from voice_assistant.benchmarks.search_query_builder import entity_grid
+
+
+async def worker(client, queries: list, offset: int, deadline: float, latencies: list, errors: dict):
+    i = offset
+    while time.perf_counter() < deadline:
+        query = queries[i % len(queries)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            await async_with_retries(client.search, index=INDEX_NAME, body=query, request_cache=False)
+            latencies.append((time.perf_counter() - start) * 1000)
+        except Exception as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+
+
+async def main(args):
+    client = create_async_client(timeout=args.timeout, pool_size=args.pool_size)
+    queries = [build_query(entities, args.top_k) for entities in entity_grid(args.queries)]
+    try:
+        # Warm the connection pool and the node caches before measuring
+        await asyncio.gather(*(client.search(index=INDEX_NAME, body=q) for q in queries[:args.concurrency]))
+        latencies, errors = [], {}
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(worker(client, queries, n, deadline, latencies, errors) for n in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.close()
+
+    retries = int(sum(SEARCH_RETRIES.value(name) for name in ("ConnectionError", "ConnectionTimeout", "TransportError")))
+    print(f"[INFO] concurrency={args.concurrency} pool={args.pool_size} timeout={args.timeout}s")
+    print(f"[INFO] {len(latencies)} ok in {elapsed:.1f}s = {len(latencies) / elapsed:.0f} req/s, errors={errors or 0}, retries={retries}")
+    if len(latencies) >= 2:
+        q = statistics.quantiles(latencies, n=100)
+        print(f"[INFO] p50={q[49]:.1f} ms p95={q[94]:.1f} ms p99={q[98]:.1f} ms max={max(latencies):.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent in-flight requests")
+    parser.add_argument("--pool-size", type=int, default=None, help="Connections per node (default OPENSEARCH_POOL_SIZE)")
+    parser.add_argument("--timeout", type=float, default=None, help="Per-request timeout (default OPENSEARCH_TIMEOUT)")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds to run")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,144 @@
+'''
+Relevance regression + latency benchmark for the filter-context query builder.
+
+Two checks per entity combination; the run exits with status 1 if either fails,
+so it can gate a CI job with OpenSearch:
+
+- Recall: the previous all-`must` query (frozen below as `legacy_build_query`)
+  runs against a copy of the catalog under the original dynamic mapping
+  (analyzed text fields, as the first index_workouts.py created them) and must
+  match as many workouts as `build_query` on the live alias. This catches a
+  constraint that silently stops matching (e.g. "Alex" vs "Alex Morgan").
+- Ranking: `scored_build_query` (the current constraints scored in `must`, the
+  structure before filter context) and `build_query` run on the live alias
+  and must return identical top-k ids, i.e. moving constraints to `filter`
+  does not change the ranking.
+
+    python voice_assistant/benchmarks/search_query_builder.py
+    python voice_assistant/benchmarks/search_query_builder.py --queries 500 --repeats 5
+'''
+import sys
+import random
+import argparse
+import itertools
+import statistics
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.search.query_builder import build_query, extract_minutes, normalize_entities
+from voice_assistant.search.search_workouts import INDEX_NAME, get_client
+from voice_assistant.search.synonyms import GOAL_TO_TAGS
+
+
+def legacy_build_query(entities: dict, top_k: int = 10) -> dict:
+    """The original search_workouts query: every constraint scored in `must`."""
+    entities = normalize_entities(entities)
+    must_clauses, should_clauses = [], []
+    minutes = extract_minutes(entities.get("duration", ""))
+    if minutes:
+        must_clauses.append({"range": {"duration": {"gte": max(minutes - 5, 5), "lte": minutes + 5}}})
+        should_clauses.append({"match": {"duration": {"query": minutes, "boost": 10}}})
+    if "instructor" in entities:
+        must_clauses.append({"match": {"instructor": {"query": entities["instructor"], "boost": 7}}})
+    if "intensity" in entities:
+        must_clauses.append({"match": {"intensity": {"query": entities["intensity"], "boost": 2.5}}})
+    if "workout_type" in entities:
+        must_clauses.append({"match": {"type": {"query": entities["workout_type"], "boost": 6}}})
+    if "goal" in entities:
+        for tag in GOAL_TO_TAGS.get(entities["goal"].lower(), [entities["goal"]]):
+            must_clauses.append({"match": {"tags": {"query": tag, "boost": 2}}})
+    else:
+        for tag_list in GOAL_TO_TAGS.values():
+            for tag in tag_list:
+                should_clauses.append({"match": {"tags": {"query": tag, "boost": 1}}})
+    return {"size": top_k, "query": {"bool": {"must": must_clauses, "should": should_clauses, "minimum_should_match": 0}}}
+
+
+def scored_build_query(entities: dict, top_k: int = 10) -> dict:
+    """build_query with every hard constraint scored in `must` instead of `filter`."""
+    query = build_query(entities, top_k)
+    query["query"]["bool"]["must"] = query["query"]["bool"].pop("filter")
+    return query
+
+
+def entity_grid(n: int, seed: int = 42) -> list:
+    """Random combinations of the entity values the NLU produces."""
+    options = {
+        "workout_type": [None, "yoga", "cycling", "running", "strength", "hiit", "pilates", "stretching", "meditation"],
+        "duration": [None, "10 min", "20 minutes", "thirty minutes", "45 min", "60 min"],
+        "intensity": [None, "low impact", "moderate", "high intensity"],
+        "instructor": [None, "Alex", "Robin", "Emma", "Cody"],
+        "goal": [None] + list(GOAL_TO_TAGS),
+    }
+    rng = random.Random(seed)
+    combos = [dict(zip(options, values)) for values in itertools.product(*options.values())]
+    return [{k: v for k, v in combo.items() if v} for combo in rng.sample(combos, min(n, len(combos)))]
+
+
+def run(client, index: str, query: dict):
+    start = time.perf_counter()
+    response = client.search(index=index, body=dict(query, track_total_hits=True), request_cache=False)
+    wall_ms = (time.perf_counter() - start) * 1000
+    ids = [hit["_id"] for hit in response["hits"]["hits"]]
+    return ids, response["hits"]["total"]["value"], response["took"], wall_ms
+
+
+def create_baseline_index(client, index: str):
+    """Copy the live catalog into an index with no explicit mapping (the original text mapping)."""
+    if client.indices.exists(index=index):
+        client.indices.delete(index=index)
+    client.indices.create(index=index)
+    client.reindex(body={"source": {"index": INDEX_NAME}, "dest": {"index": index}}, refresh=True)
+
+
+def summarize(name: str, took: list, wall: list):
+    print(f"[INFO] {name:<8} took p50={statistics.median(took):.1f} ms p99={statistics.quantiles(took, n=100)[98]:.1f} ms | "
+          f"wall p50={statistics.median(wall):.1f} ms p99={statistics.quantiles(wall, n=100)[98]:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3, help="Latency runs per query (filters are cached after the first)")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--baseline-index", default=f"{INDEX_NAME}-baseline-mapping")
+    args = parser.parse_args()
+
+    client = get_client()
+    create_baseline_index(client, args.baseline_index)
+    grid = entity_grid(args.queries)
+    recall_mismatches = ranking_mismatches = 0
+    latency = {"legacy": ([], []), "scored": ([], []), "filter": ([], [])}
+    targets = (
+        ("legacy", legacy_build_query, args.baseline_index),
+        ("scored", scored_build_query, INDEX_NAME),
+        ("filter", build_query, INDEX_NAME),
+    )
+
+    try:
+        for entities in grid:
+            ids, totals = {}, {}
+            for name, builder, index in targets:
+                query = builder(dict(entities), args.top_k)
+                for _ in range(args.repeats):
+                    ids[name], totals[name], took, wall = run(client, index, query)
+                    latency[name][0].append(took)
+                    latency[name][1].append(wall)
+            if totals["legacy"] != totals["filter"]:
+                recall_mismatches += 1
+                if recall_mismatches <= 10:
+                    print(f"[WARN] Matches differ for {entities}: legacy={totals['legacy']} filter={totals['filter']}")
+            if ids["scored"] != ids["filter"]:
+                ranking_mismatches += 1
+                if ranking_mismatches <= 10:
+                    print(f"[WARN] Ranking differs for {entities}:\n  scored={ids['scored']}\n  filter={ids['filter']}")
+    finally:
+        client.indices.delete(index=args.baseline_index)
+
+    print(f"[INFO] {len(grid)} queries: same match count as the original mapping for {len(grid) - recall_mismatches}, "
+          f"identical top-{args.top_k} for {len(grid) - ranking_mismatches}")
+    for name, (took, wall) in latency.items():
+        summarize(name, took, wall)
+    sys.exit(1 if recall_mismatches or ranking_mismatches else 0)
@@ -0,0 +1,79 @@
+'''
+Full spaCy pipeline vs the trimmed NER-only load: load time, per-utterance
+latency, nlp.pipe throughput, and whether the entities are identical.
+
+    python voice_assistant/benchmarks/spacy_ner_trim.py --model en_core_web_sm
+    python voice_assistant/benchmarks/spacy_ner_trim.py --model voice_assistant/models/entity_model/model-best --data voice_assistant/data/entity_data/dev.json
+'''
+import sys
+import json
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+import spacy
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.nlu.spacy_loader import load_ner_pipeline
+
+SAMPLE_UTTERANCES = [
+    "find me a 30 minute yoga class with Alex",
+    "I want a high intensity ride in the morning",
+    "something relaxing before bed",
+    "give me a twenty minute strength workout to build muscle",
+    "I'm feeling tired, maybe a gentle stretch",
+]
+
+
+def ents(doc) -> list:
+    return [(e.start_char, e.end_char, e.label_) for e in doc.ents]
+
+
+def measure(name: str, loader, texts: list, batch_size: int) -> dict:
+    start = time.perf_counter()
+    nlp = loader()
+    load_s = time.perf_counter() - start
+    nlp(texts[0])  # warmup
+
+    per_utt_ms = []
+    results = []
+    for text in texts:
+        start = time.perf_counter()
+        results.append(ents(nlp(text)))
+        per_utt_ms.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    list(nlp.pipe(texts, batch_size=batch_size))
+    pipe_s = time.perf_counter() - start
+
+    print(f"[INFO] {name}: pipes={nlp.pipe_names}")
+    print(f"       load={load_s:.2f}s  per-utterance p50={statistics.median(per_utt_ms):.2f} ms "
+          f"mean={statistics.mean(per_utt_ms):.2f} ms  nlp.pipe={pipe_s / len(texts) * 1000:.2f} ms/utt")
+    return {"mean_ms": statistics.mean(per_utt_ms), "results": results}
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--model", required=True, help="spaCy package name or model directory")
+parser.add_argument("--data", help="NER json (text field used) or a text file, one utterance per line")
+parser.add_argument("--limit", type=int, default=500)
+parser.add_argument("--batch-size", type=int, default=64)
+args = parser.parse_args()
+
+if args.data and args.data.endswith(".json"):
+    with open(args.data) as f:
+        texts = [r["text"] for r in json.load(f)]
+elif args.data:
+    with open(args.data) as f:
+        texts = [line.strip() for line in f if line.strip()]
+else:
+    texts = SAMPLE_UTTERANCES * 20
+texts = texts[:args.limit]
+
+full = measure("full", lambda: spacy.load(args.model), texts, args.batch_size)
+trimmed = measure("trimmed", lambda: load_ner_pipeline(args.model), texts, args.batch_size)
+
+same = sum(a == b for a, b in zip(full["results"], trimmed["results"]))
+print(f"[INFO] Per-utterance speedup: {full['mean_ms'] / trimmed['mean_ms']:.2f}x")
+print(f"[INFO] Identical entities: {same}/{len(texts)}")
@@ -0,0 +1,74 @@
+'''
+Import-time and cold-start benchmark. Every measurement runs in a fresh
+interpreter so module caches do not hide the real startup cost.
+
+    python voice_assistant/benchmarks/startup_time.py
+    python voice_assistant/benchmarks/startup_time.py --cold-start "find me a 20 minute yoga with Alex"
+'''
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+
+MODULES = [
+    "voice_assistant.utils.config",
+    "voice_assistant.nlu.nlu_pipeline",
+    "voice_assistant.search.search_workouts",
+    "voice_assistant.asr.transcribe",
+    "voice_assistant.api.main",
+]
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+COLD_START_SNIPPET = """
+import json, time
+t0 = time.perf_counter()
+from voice_assistant.nlu import nlu_pipeline
+t1 = time.perf_counter()
+nlu_pipeline.warmup()
+t2 = time.perf_counter()
+nlu_pipeline.parse_text({text!r})
+t3 = time.perf_counter()
+nlu_pipeline.parse_text({text!r})
+t4 = time.perf_counter()
+print(json.dumps({{"import_s": t1 - t0, "warmup_s": t2 - t1, "first_parse_s": t3 - t2, "warm_parse_s": t4 - t3}}))
+"""
+
+
+def run_snippet(code: str, **env) -> str:
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=project_root, capture_output=True, text=True, env=dict(os.environ, LOG_LEVEL="OFF", **env)
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "failed")
+    return proc.stdout.strip().splitlines()[-1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cold-start", metavar="TEXT", help="Also time warmup and first/second parse of TEXT")
+    args = parser.parse_args()
+
+    print(f"{'module':<42} | {'median import s':>15}")
+    for module in MODULES:
+        try:
+            samples = [float(run_snippet(IMPORT_SNIPPET.format(module=module))) for _ in range(args.repeat)]
+            print(f"{module:<42} | {statistics.median(samples):>15.3f}")
+        except RuntimeError as e:
+            print(f"{module:<42} | {'error':>15}  ({e})")
+
+    if args.cold_start:
+        # Parse cache and gazetteer fast path off: the second parse must run the models too
+        result = run_snippet(COLD_START_SNIPPET.format(text=args.cold_start), NLU_CACHE_SIZE="0", NLU_FAST_PATH="0")
+        print("\n[INFO] NLU cold start:", json.loads(result))
@@ -0,0 +1,87 @@
+'''
+Bulk NLU parsing of logged transcripts.
+
+Streams a JSONL or CSV file in chunks through `parse_batch` and writes one
+parse per input record. Input fields are kept; `intent` and `entities` are added.
+
+    python voice_assistant/nlu/bulk_parse.py --input queries.jsonl --output parsed.jsonl
+    python voice_assistant/nlu/bulk_parse.py --input voice_assistant/data/intent_data/intent_training_data.csv --output parsed.csv
+    python voice_assistant/nlu/bulk_parse.py --input requests.jsonl --text-field body --n-process 4
+'''
+import sys
+import csv
+import json
+import time
+import argparse
+from pathlib import Path
+from itertools import islice
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.nlu.nlu_pipeline import NLUPipeline
+
+
+def read_records(path: str):
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def chunks(iterable, size: int):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class RecordWriter:
+    """JSONL by default; CSV (entities as a JSON string) when the output ends with .csv."""
+
+    def __init__(self, path: str = None):
+        self.file = open(path, "w", newline="", encoding="utf-8") if path else sys.stdout
+        self.is_csv = bool(path and path.endswith(".csv"))
+        self.csv_writer = None
+
+    def write(self, record: dict):
+        if not self.is_csv:
+            self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            return
+        row = dict(record, entities=json.dumps(record["entities"], ensure_ascii=False))
+        if self.csv_writer is None:
+            self.csv_writer = csv.DictWriter(self.file, fieldnames=list(row))
+            self.csv_writer.writeheader()
+        self.csv_writer.writerow(row)
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse a JSONL/CSV of transcripts in batches.")
+    parser.add_argument("--input", required=True, help="JSONL or CSV file")
+    parser.add_argument("--output", default=None, help="JSONL or CSV file (default: JSONL on stdout)")
+    parser.add_argument("--text-field", default="text", help="Field / column holding the transcript")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="Records read and parsed per chunk")
+    parser.add_argument("--batch-size", type=int, default=64, help="Model batch size")
+    parser.add_argument("--n-process", type=int, default=1, help="Processes for spaCy nlp.pipe")
+    args = parser.parse_args()
+
+    pipeline = NLUPipeline().warmup()
+    writer = RecordWriter(args.output)
+    total, start = 0, time.perf_counter()
+    try:
+        for chunk in chunks(read_records(args.input), args.chunk_size):
+            texts = [str(record.get(args.text_field) or "") for record in chunk]
+            for record, parsed in zip(chunk, pipeline.parse_batch(texts, args.batch_size, args.n_process)):
+                writer.write(dict(record, intent=parsed["intent"], entities=parsed["entities"]))
+            total += len(chunk)
+            elapsed = time.perf_counter() - start
+            print(f"[INFO] Parsed {total} records ({total / elapsed:.1f}/s)", file=sys.stderr)
+    finally:
+        writer.close()
+
+    print(f"[INFO] Done: {total} records in {time.perf_counter() - start:.1f}s", file=sys.stderr)
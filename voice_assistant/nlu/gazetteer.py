@@ -0,0 +1,192 @@
+import re
+import threading
+
+from voice_assistant.search.synonyms import WORKOUT_TYPE_SYNONYMS, INTENSITY_SYNONYMS, GOAL_SYNONYMS, GOAL_TO_TAGS
+
+# === Gazetteer vocabulary ===
+# Extra surface forms mirror the generators in entity_scripts/generate_ner_data.py
+# (not imported: that module pulls in spaCy and builds data at import time);
+# workout, intensity and goal forms live in search/synonyms.py.
+INSTRUCTORS = [
+    "Alex", "Robin", "Kendall", "Tunde", "Matt", "Jess", "Emma", "Cody", "Tatiana", "Aya",
+    "Ben", "Ally", "Adrian", "Denis", "Chelsea", "Olivia", "Chris", "Rebecca",
+]
+MOODS = [
+    "tired", "low energy", "worn out", "sleepy", "energized", "excited", "ready to go",
+    "unmotivated", "not feeling it", "pumped", "hyped", "lazy", "sluggish",
+    "anxious", "stressed", "on edge",
+]
+TIME_OF_DAY = [
+    "morning", "early morning", "late morning", "afternoon", "midday", "evening",
+    "early evening", "late evening", "night", "late night", "before bed",
+    "before work", "after work",
+]
+NUMBER_WORDS = [
+    "five", "ten", "fifteen", "twenty", "twenty five", "thirty", "forty", "forty five",
+    "fifty", "sixty", "ninety",
+]
+DURATION_PHRASES = [f"{n} {unit}" for n in NUMBER_WORDS for unit in ("min", "mins", "minute", "minutes")] + [
+    "half an hour", "an hour", "one hour", "hour long", "an hour long", "half hour",
+]
+DURATION_PATTERN = re.compile(r"\b\d{1,3}\s?-?\s?(?:min|mins|minute|minutes|hr|hrs|hour|hours)\b")
+
+# Words that may appear around the entities without changing the request
+FILLER_WORDS = {
+    "a", "an", "the", "me", "i", "i'm", "im", "my", "some", "something", "any", "anything",
+    "find", "recommend", "give", "show", "search", "get", "pull", "up", "help", "can", "you",
+    "could", "would", "want", "need", "like", "looking", "let's", "lets", "do", "go", "start",
+    "for", "with", "by", "to", "in", "of", "and", "or", "on", "about", "around", "maybe",
+    "class", "classes", "workout", "workouts", "session", "sessions", "minute", "long",
+    "please", "now", "today", "asap", "right", "away", "quick", "quickly", "soon", "if",
+    "possible", "hey", "ok", "okay", "um", "uh", "so", "just", "what's", "good", "feeling",
+}
+
+# Workout types, intensities and goals come only from the synonym tables, so every
+# one the fast path emits normalizes to a catalog value in the query builder; other
+# surface forms ("treadmill", "intensity level 5", "get fit") are left to the neural models.
+WORKOUT_TYPES = list(WORKOUT_TYPE_SYNONYMS) + sorted(set(WORKOUT_TYPE_SYNONYMS.values()))
+INTENSITIES = list(INTENSITY_SYNONYMS) + sorted(set(INTENSITY_SYNONYMS.values()))
+GOALS = list(GOAL_SYNONYMS) + list(GOAL_TO_TAGS)
+
+# Labels, in priority order when the same phrase appears in several lists
+DEFAULT_ENTRIES = {
+    "workout_type": WORKOUT_TYPES,
+    "instructor": INSTRUCTORS,
+    "intensity": INTENSITIES,
+    "duration": DURATION_PHRASES,
+    "goal": GOALS,
+    "mood": MOODS,
+    "time_of_day": TIME_OF_DAY,
+}
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+
+def _normalize(text: str) -> str:
+    return text.replace("’", "'").lower()
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    return index < 0 or index >= len(text) or not text[index].isalnum()
+
+
+class Gazetteer:
+    """
+    Aho-Corasick automaton over the entity phrase lists.
+
+    Built once; `find` is a single left-to-right scan of the utterance regardless
+    of how many phrases are loaded. Matches must start and end on word boundaries.
+    """
+
+    def __init__(self, entries: dict = None):
+        entries = DEFAULT_ENTRIES if entries is None else entries
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]  # node -> [(phrase length, label)]
+        seen = set()
+        for label, phrases in entries.items():
+            for phrase in phrases:
+                phrase = _normalize(phrase.strip())
+                if phrase and phrase not in seen:
+                    seen.add(phrase)
+                    self._add(phrase, label)
+        self._build_fail_links()
+        self.size = len(seen)
+
+    def _add(self, phrase: str, label: str):
+        node = 0
+        for char in phrase:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(phrase), label))
+
+    def _build_fail_links(self):
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, text: str) -> list:
+        """Leftmost-longest, non-overlapping (start, end, label) matches."""
+        text = _normalize(text)
+        candidates = []
+        node = 0
+        for i, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for length, label in self._out[node]:
+                start = i + 1 - length
+                if _is_boundary(text, start - 1) and _is_boundary(text, i + 1):
+                    candidates.append((start, i + 1, label))
+        candidates.extend((m.start(), m.end(), "duration") for m in DURATION_PATTERN.finditer(text))
+
+        matches, last_end = [], 0
+        for start, end, label in sorted(candidates, key=lambda m: (m[0], -(m[1] - m[0]))):
+            if start >= last_end:
+                matches.append((start, end, label))
+                last_end = end
+        return matches
+
+    def extract(self, text: str) -> dict:
+        """Entities found in `text`, shaped like the spaCy path ({label: surface text})."""
+        entities = {}
+        for start, end, label in self.find(text):
+            entities.setdefault(label, text[start:end])
+        return entities
+
+    def parse(self, text: str):
+        """
+        Full parse when every word is either part of an entity or a filler word
+        and the request names a workout or an instructor; None otherwise, so the
+        caller falls back to the neural models.
+        """
+        if len(_normalize(text)) != len(text):
+            return None
+        matches = self.find(text)
+        labels = [label for _, _, label in matches]
+        if "workout_type" not in labels and "instructor" not in labels:
+            return None
+        if len(set(labels)) != len(labels):  # e.g. two workout types: ambiguous
+            return None
+
+        covered = iter(matches)
+        current = next(covered, None)
+        for word in _WORD.finditer(_normalize(text)):
+            while current is not None and current[1] <= word.start():
+                current = next(covered, None)
+            inside = current is not None and current[0] <= word.start() and word.end() <= current[1]
+            if not inside and word.group() not in FILLER_WORDS:
+                return None
+
+        return {
+            "intent": "search_class",
+            "confidence": 1.0,
+            "entities": {label: text[start:end] for start, end, label in matches},
+        }
+
+
+_default_gazetteer = None
+_default_lock = threading.Lock()
+
+def get_gazetteer() -> Gazetteer:
+    global _default_gazetteer
+    if _default_gazetteer is None:
+        with _default_lock:
+            if _default_gazetteer is None:
+                _default_gazetteer = Gazetteer()
+    return _default_gazetteer
+
+def fast_parse(text: str):
+    return get_gazetteer().parse(text)
@@ -0,0 +1,112 @@
+import os
+import sys
+import json
+from pathlib import Path
+
+import numpy as np
+
+# Enable root-level imports
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.utils import config
+
+
+# === Intent classifier backends ===
+# Both backends take a list of utterances and return one (label_id, score)
+# pair per utterance; label ids index into the intent model's label_map.json.
+# Scores are softmax(logits / temperature), with the temperature fitted per
+# backend by intent_scripts/calibrate_intent.py so that they track actual
+# accuracy (int8 ONNX and the joint head are not scaled like fp32 torch).
+
+CALIBRATION_FILE = "calibration.json"
+
+
+def load_temperature(model_dir: str, backend: str) -> float:
+    """INTENT_TEMPERATURE if set, else the value fitted for `backend` next to the model, else 1.0 (uncalibrated)."""
+    if config.INTENT_TEMPERATURE:
+        return config.INTENT_TEMPERATURE
+    path = os.path.join(model_dir, CALIBRATION_FILE)
+    if os.path.exists(path):
+        with open(path) as f:
+            temperatures = json.load(f).get("temperatures", {})
+        if backend in temperatures:
+            return float(temperatures[backend])
+    return 1.0
+
+
+def softmax_predictions(logits: np.ndarray, temperature: float = 1.0) -> list:
+    scaled = logits / temperature
+    exp = np.exp(scaled - scaled.max(axis=1, keepdims=True))
+    probs = exp / exp.sum(axis=1, keepdims=True)
+    ids = probs.argmax(axis=1)
+    return [(int(i), float(probs[row, i])) for row, i in enumerate(ids)]
+
+class TorchIntentClassifier:
+    """Fine-tuned DistilBERT (or a distilled student) through the Hugging Face pipeline (fp32, PyTorch)."""
+
+    name = "torch"
+
+    def __init__(self, model_dir: str):
+        from transformers import pipeline, AutoModelForSequenceClassification, AutoTokenizer
+
+        model = AutoModelForSequenceClassification.from_pretrained(model_dir)
+        tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.pipeline = pipeline("text-classification", model=model, tokenizer=tokenizer, top_k=None)
+        self.temperature = load_temperature(model_dir, self.name)
+
+    def logits(self, texts: list) -> np.ndarray:
+        # Raw logits for every label, ordered by label id
+        results = self.pipeline(texts, batch_size=len(texts), function_to_apply="none")
+        rows = []
+        for result in results:
+            by_id = {int(r["label"].split("_")[-1]): r["score"] for r in result}
+            rows.append([by_id[i] for i in range(len(by_id))])
+        return np.array(rows, dtype=np.float32)
+
+    def predict(self, texts: list) -> list:
+        return softmax_predictions(self.logits(texts), self.temperature)
+
+
+class OnnxIntentClassifier:
+    """Exported (optionally int8-quantized) DistilBERT on ONNX Runtime."""
+
+    name = "onnx"
+
+    def __init__(self, model_dir: str, onnx_path: str = None):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        onnx_path = onnx_path or config.INTENT_ONNX_PATH
+        if not os.path.exists(onnx_path):
+            raise FileNotFoundError(
+                f"{onnx_path} not found. Run voice_assistant/nlu/intent_scripts/export_intent_onnx.py first."
+            )
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if config.INTENT_ONNX_THREADS:
+            options.intra_op_num_threads = config.INTENT_ONNX_THREADS
+        self.session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.temperature = load_temperature(model_dir, self.name)
+
+    def logits(self, texts: list) -> np.ndarray:
+        encoded = self.tokenizer(texts, padding=True, truncation=True, max_length=config.INTENT_MAX_LENGTH, return_tensors="np")
+        feeds = {k: v.astype(np.int64) for k, v in encoded.items() if k in self.input_names}
+        return self.session.run(None, feeds)[0]
+
+    def predict(self, texts: list) -> list:
+        return softmax_predictions(self.logits(texts), self.temperature)
+
+
+INTENT_BACKENDS = {
+    TorchIntentClassifier.name: TorchIntentClassifier,
+    OnnxIntentClassifier.name: OnnxIntentClassifier,
+}
+
+
+def load_intent_classifier(model_dir: str, backend: str = None):
+    backend = backend or config.INTENT_BACKEND
+    if backend not in INTENT_BACKENDS:
+        raise ValueError(f"Unknown intent backend '{backend}'. Choose from: {', '.join(INTENT_BACKENDS)}")
+    return INTENT_BACKENDS[backend](model_dir)
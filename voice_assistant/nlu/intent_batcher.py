@@ -0,0 +1,38 @@
+import sys
+from pathlib import Path
+
+# Enable root-level imports
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.utils import config
+from voice_assistant.utils.batching import MicroBatcher
+
+
+class IntentBatcher(MicroBatcher):
+    """
+    Coalesces concurrent intent requests into one padded classifier batch.
+
+    Requests that arrive within INTENT_MAX_WAIT_MS of each other (up to
+    INTENT_MAX_BATCH_SIZE) share a single DistilBERT forward pass; each caller
+    gets its own label back through a Future. `stats()` reports the batch sizes
+    actually achieved.
+    """
+
+    name = "intent-batcher"
+
+    def __init__(self, classify_batch, max_batch_size: int = None, max_wait_ms: float = None, max_queue: int = None):
+        # Callers are the API's NLU worker threads, so a batch can never hold more
+        # than NLU_WORKERS requests; a larger limit would only make each one wait
+        # the full INTENT_MAX_WAIT_MS.
+        super().__init__(
+            max_batch_size=max_batch_size or min(config.INTENT_MAX_BATCH_SIZE, config.NLU_WORKERS),
+            max_wait_ms=max_wait_ms if max_wait_ms is not None else config.INTENT_MAX_WAIT_MS,
+            max_queue=max_queue or config.INTENT_QUEUE_SIZE,
+        )
+        self.classify_batch = classify_batch
+
+    def process_batch(self, texts: list) -> list:
+        return self.classify_batch(texts)
+
+    def classify(self, text: str, timeout: float = None):
+        return self.submit(text).result(timeout)
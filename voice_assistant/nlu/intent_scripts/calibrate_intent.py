@@ -0,0 +1,100 @@
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.nlu.intent_backends import CALIBRATION_FILE, INTENT_BACKENDS
+
+# === Config ===
+MODEL_DIR = "voice_assistant/models/intent_model"
+JOINT_MODEL_DIR = "voice_assistant/models/joint_model"
+DATA_PATH = "voice_assistant/data/intent_data/intent_training_data.csv"
+
+parser = argparse.ArgumentParser(description="Fit a softmax temperature for one intent backend (temperature scaling).")
+parser.add_argument("--data", default=DATA_PATH)
+parser.add_argument("--backend", default="torch", choices=list(INTENT_BACKENDS) + ["joint"],
+                    help="Each backend gets its own temperature; run once per backend you serve")
+parser.add_argument("--batch-size", type=int, default=64)
+parser.add_argument("--threshold", type=float, default=0.6, help="Report coverage/accuracy above this confidence")
+args = parser.parse_args()
+
+
+def softmax(logits, temperature):
+    scaled = logits / temperature
+    exp = np.exp(scaled - scaled.max(axis=1, keepdims=True))
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def nll(probs, gold):
+    return float(-np.log(probs[np.arange(len(gold)), gold] + 1e-12).mean())
+
+
+def expected_calibration_error(probs, gold, bins=10):
+    confidence = probs.max(axis=1)
+    correct = probs.argmax(axis=1) == gold
+    ece = 0.0
+    for low in np.linspace(0, 1, bins, endpoint=False):
+        mask = (confidence > low) & (confidence <= low + 1 / bins)
+        if mask.any():
+            ece += mask.mean() * abs(correct[mask].mean() - confidence[mask].mean())
+    return float(ece)
+
+
+# === Held-out split (same split as train_intent_classifier.py) ===
+with open(os.path.join(MODEL_DIR, "label_map.json")) as f:
+    label_to_id = json.load(f)
+df = pd.read_csv(args.data)
+df = df[df["label"].isin(label_to_id)]
+_, dev_df = train_test_split(df, test_size=0.2, random_state=42)
+texts = dev_df["text"].tolist()
+gold = dev_df["label"].map(label_to_id).to_numpy()
+print(f"[INFO] Calibrating on {len(texts)} held-out utterances")
+
+if args.backend == "joint":
+    from voice_assistant.nlu.joint_model import JointNLU
+
+    # Joint intent labels use the same ids as label_map.json (see train_joint_nlu.py)
+    model_dir = JOINT_MODEL_DIR
+    classifier = JointNLU(model_dir)
+else:
+    model_dir = MODEL_DIR
+    classifier = INTENT_BACKENDS[args.backend](model_dir)
+logits = np.concatenate([
+    classifier.logits(texts[i:i + args.batch_size]) for i in range(0, len(texts), args.batch_size)
+])
+
+# === Temperature search (1-D, so a grid is enough) ===
+grid = np.arange(0.25, 10.0, 0.05)
+losses = [nll(softmax(logits, t), gold) for t in grid]
+temperature = float(grid[int(np.argmin(losses))])
+
+for name, t in [("uncalibrated", 1.0), ("calibrated", temperature)]:
+    probs = softmax(logits, t)
+    confident = probs.max(axis=1) >= args.threshold
+    accuracy_above = (probs.argmax(axis=1) == gold)[confident].mean() if confident.any() else float("nan")
+    print(
+        f"[INFO] {name:<13} T={t:.2f} NLL={nll(probs, gold):.4f} ECE={expected_calibration_error(probs, gold):.4f} "
+        f"coverage@{args.threshold}={confident.mean():.2%} accuracy@{args.threshold}={accuracy_above:.2%}"
+    )
+
+# One file per model dir, one temperature per backend: {"temperatures": {"torch": ..., "onnx": ...}, ...}
+calibration_path = os.path.join(model_dir, CALIBRATION_FILE)
+temperatures, fitted_on = {}, {}
+if os.path.exists(calibration_path):
+    with open(calibration_path) as f:
+        previous = json.load(f)
+    # Older files held a single shared temperature; only per-backend entries are kept
+    temperatures = previous.get("temperatures", {})
+    fitted_on = previous.get("fitted_on") if isinstance(previous.get("fitted_on"), dict) else {}
+temperatures[args.backend] = round(temperature, 4)
+fitted_on[args.backend] = len(texts)
+with open(calibration_path, "w") as f:
+    json.dump({"temperatures": temperatures, "fitted_on": fitted_on}, f, indent=2)
+print(f"[INFO] Saved {args.backend} temperature {temperature:.2f} to {calibration_path}")
@@ -0,0 +1,188 @@
+import os
+import sys
+import json
+import copy
+import time
+import random
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn.functional as F
+from torch.utils.data import DataLoader
+from transformers import (
+    AutoModelForSequenceClassification,
+    AutoTokenizer,
+    DataCollatorWithPadding,
+    get_linear_schedule_with_warmup,
+)
+from sklearn.model_selection import train_test_split
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.append(str(project_root))
+
+# === Config ===
+MODEL_DIR = "voice_assistant/models/intent_model"          # fine-tuned teacher
+DATA_PATH = "voice_assistant/data/intent_data/intent_training_data.csv"
+OUTPUT_ROOT = "voice_assistant/models"
+
+parser = argparse.ArgumentParser(description="Distill the intent classifier into smaller students and report latency/accuracy.")
+parser.add_argument(
+    "--student", action="append", default=None,
+    help="Layer count (truncated copy of the teacher, e.g. 2) or a HF model name "
+         "(e.g. huawei-noah/TinyBERT_General_4L_312D). Repeat to compare several. Default: 3 and 2 layers.",
+)
+parser.add_argument("--epochs", type=int, default=8)
+parser.add_argument("--batch-size", type=int, default=32)
+parser.add_argument("--lr", type=float, default=5e-5)
+parser.add_argument("--max-length", type=int, default=32, help="Voice queries are < 20 tokens")
+parser.add_argument("--temperature", type=float, default=2.0, help="Distillation softmax temperature")
+parser.add_argument("--alpha", type=float, default=0.5, help="Weight of the hard-label loss vs the teacher KL loss")
+parser.add_argument("--p99-budget-ms", type=float, default=10.0, help="CPU p99 budget for a single utterance")
+parser.add_argument("--latency-samples", type=int, default=300)
+parser.add_argument("--threads", type=int, default=1, help="torch threads for the latency measurement")
+args = parser.parse_args()
+students = args.student or ["3", "2"]
+
+random.seed(42)
+torch.manual_seed(42)
+device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+print(f"[INFO] Using device: {device}")
+
+# === Data (same split as train_intent_classifier.py) ===
+with open(os.path.join(MODEL_DIR, "label_map.json")) as f:
+    label_to_id = json.load(f)
+df = pd.read_csv(DATA_PATH)
+df = df[df["label"].isin(label_to_id)]
+df["label_id"] = df["label"].map(label_to_id)
+train_df, test_df = train_test_split(df, test_size=0.2, random_state=42)
+train_texts, train_labels = train_df["text"].tolist(), train_df["label_id"].tolist()
+test_texts, test_labels = test_df["text"].tolist(), np.array(test_df["label_id"].tolist())
+
+# === Teacher ===
+teacher_tokenizer = AutoTokenizer.from_pretrained(MODEL_DIR)
+teacher = AutoModelForSequenceClassification.from_pretrained(MODEL_DIR).to(device).eval()
+
+
+@torch.no_grad()
+def batched_logits(model, tokenizer, texts, batch_size=64):
+    model.eval()
+    out = []
+    for i in range(0, len(texts), batch_size):
+        enc = tokenizer(texts[i:i + batch_size], padding=True, truncation=True, max_length=args.max_length, return_tensors="pt").to(device)
+        out.append(model(**enc).logits.float().cpu())
+    return torch.cat(out)
+
+# Soft targets computed once; the teacher is not needed inside the training loop
+teacher_train_logits = batched_logits(teacher, teacher_tokenizer, train_texts)
+
+
+def build_student(spec: str):
+    if spec.isdigit():
+        n_layers = int(spec)
+        student = copy.deepcopy(teacher).cpu()
+        layers = student.distilbert.transformer.layer
+        # Keep evenly spaced teacher layers (first and last included)
+        keep = sorted(set(np.linspace(0, len(layers) - 1, n_layers).round().astype(int).tolist()))
+        student.distilbert.transformer.layer = torch.nn.ModuleList([layers[i] for i in keep])
+        student.config.n_layers = len(keep)
+        return f"distilbert-{len(keep)}L", student, teacher_tokenizer
+    student = AutoModelForSequenceClassification.from_pretrained(spec, num_labels=len(label_to_id))
+    return spec.split("/")[-1], student, AutoTokenizer.from_pretrained(spec)
+
+
+def distill(student, tokenizer):
+    student.to(device)
+    # Tokenize once without padding; DataCollatorWithPadding pads each batch to its longest utterance
+    encoded = tokenizer(train_texts, truncation=True, max_length=args.max_length)
+    features = [
+        {"input_ids": ids, "attention_mask": mask, "labels": label, "index": i}
+        for i, (ids, mask, label) in enumerate(zip(encoded["input_ids"], encoded["attention_mask"], train_labels))
+    ]
+    collator = DataCollatorWithPadding(tokenizer)
+    loader = DataLoader(features, batch_size=args.batch_size, shuffle=True, collate_fn=collator)
+
+    optimizer = torch.optim.AdamW(student.parameters(), lr=args.lr, weight_decay=0.01)
+    total_steps = len(loader) * args.epochs
+    scheduler = get_linear_schedule_with_warmup(optimizer, int(0.1 * total_steps), total_steps)
+    t = args.temperature
+
+    for epoch in range(args.epochs):
+        student.train()  # accuracy() below switches to eval mode
+        losses = []
+        for batch in loader:
+            soft = teacher_train_logits[batch.pop("index")].to(device)
+            batch = {k: v.to(device) for k, v in batch.items()}
+            labels = batch.pop("labels")
+            logits = student(**batch).logits
+            hard_loss = F.cross_entropy(logits, labels)
+            soft_loss = F.kl_div(F.log_softmax(logits / t, -1), F.softmax(soft / t, -1), reduction="batchmean") * t * t
+            loss = args.alpha * hard_loss + (1 - args.alpha) * soft_loss
+            loss.backward()
+            torch.nn.utils.clip_grad_norm_(student.parameters(), 1.0)
+            optimizer.step()
+            scheduler.step()
+            optimizer.zero_grad()
+            losses.append(loss.item())
+        acc = accuracy(student, tokenizer)
+        print(f"[INFO]   epoch {epoch + 1}: loss={np.mean(losses):.4f} test_acc={acc:.4f}")
+    return student.eval()
+
+
+def accuracy(model, tokenizer) -> float:
+    preds = batched_logits(model, tokenizer, test_texts).argmax(-1).numpy()
+    return float((preds == test_labels).mean())
+
+
+@torch.no_grad()
+def cpu_latency(model, tokenizer) -> dict:
+    """Single-utterance latency (tokenize + forward) on CPU, like one API request."""
+    model = model.cpu().eval()
+    torch.set_num_threads(args.threads)
+    samples = [random.choice(test_texts) for _ in range(args.latency_samples)]
+    for text in samples[:10]:
+        model(**tokenizer(text, return_tensors="pt"))
+    timings = []
+    for text in samples:
+        start = time.perf_counter()
+        model(**tokenizer(text, truncation=True, max_length=args.max_length, return_tensors="pt"))
+        timings.append((time.perf_counter() - start) * 1000)
+    model.to(device)
+    return {"p50_ms": round(float(np.percentile(timings, 50)), 2), "p99_ms": round(float(np.percentile(timings, 99)), 2)}
+
+
+def report_row(name, model, tokenizer, output_dir=None):
+    row = {
+        "model": name,
+        "params_m": round(sum(p.numel() for p in model.parameters()) / 1e6, 1),
+        "accuracy": round(accuracy(model, tokenizer), 4),
+        **cpu_latency(model, tokenizer),
+        "output_dir": output_dir,
+    }
+    row["meets_budget"] = row["p99_ms"] <= args.p99_budget_ms
+    return row
+
+
+# === Distill + report ===
+report = [report_row("teacher", teacher, teacher_tokenizer, MODEL_DIR)]
+for spec in students:
+    name, student, tokenizer = build_student(spec)
+    print(f"[INFO] Distilling student {name}")
+    student = distill(student, tokenizer)
+    output_dir = os.path.join(OUTPUT_ROOT, f"intent_model_{name}")
+    student.save_pretrained(output_dir)
+    tokenizer.save_pretrained(output_dir)
+    with open(os.path.join(output_dir, "label_map.json"), "w") as f:
+        json.dump(label_to_id, f)
+    report.append(report_row(name, student, tokenizer, output_dir))
+
+print(f"\n[INFO] Latency/accuracy report (CPU, {args.threads} thread(s), budget p99 <= {args.p99_budget_ms} ms)")
+print(f"{'model':<28}{'params(M)':>10}{'acc':>9}{'p50(ms)':>10}{'p99(ms)':>10}  budget")
+for row in report:
+    print(f"{row['model']:<28}{row['params_m']:>10}{row['accuracy']:>9.4f}{row['p50_ms']:>10}{row['p99_ms']:>10}  {'ok' if row['meets_budget'] else '-'}")
+
+with open(os.path.join(OUTPUT_ROOT, "intent_distillation_report.json"), "w") as f:
+    json.dump(report, f, indent=2)
+print("\nServe a student with INTENT_MODEL_DIR=<output_dir>.")
@@ -0,0 +1,71 @@
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.nlu.intent_backends import TorchIntentClassifier, OnnxIntentClassifier
+
+# === Config ===
+MODEL_DIR = "voice_assistant/models/intent_model"
+DATA_PATH = "voice_assistant/data/intent_data/intent_training_data.csv"
+ONNX_DIR = os.path.join(MODEL_DIR, "onnx")
+
+parser = argparse.ArgumentParser(description="Accuracy + latency comparison of intent backends.")
+parser.add_argument("--data", default=DATA_PATH)
+parser.add_argument("--latency-samples", type=int, default=300)
+parser.add_argument("--batch-size", type=int, default=32)
+args = parser.parse_args()
+
+# Labels come from the label map the production model was trained with
+with open(os.path.join(MODEL_DIR, "label_map.json")) as f:
+    label_to_id = json.load(f)
+
+df = pd.read_csv(args.data)
+df = df[df["label"].isin(label_to_id)]
+texts = df["text"].tolist()
+gold = df["label"].map(label_to_id).to_numpy()
+print(f"[INFO] {len(texts)} labelled utterances, labels: {label_to_id}")
+
+backends = {"torch-fp32": TorchIntentClassifier(MODEL_DIR)}
+for name, filename in [("onnx-fp32", "model.onnx"), ("onnx-int8", "model.int8.onnx")]:
+    path = os.path.join(ONNX_DIR, filename)
+    if os.path.exists(path):
+        backends[name] = OnnxIntentClassifier(MODEL_DIR, onnx_path=path)
+    else:
+        print(f"[WARN] {path} missing, skipping {name} (run export_intent_onnx.py)")
+
+rows = []
+reference = None
+for name, backend in backends.items():
+    # Accuracy over the full CSV, in batches
+    preds = []
+    for start in range(0, len(texts), args.batch_size):
+        preds += [label_id for label_id, _ in backend.predict(texts[start:start + args.batch_size])]
+    preds = np.array(preds)
+    if reference is None:
+        reference = preds
+
+    # Single-utterance latency, as served per request
+    backend.predict(["warmup"])
+    latencies = []
+    for text in texts[:args.latency_samples]:
+        start = time.perf_counter()
+        backend.predict([text])
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    rows.append({
+        "backend": name,
+        "accuracy": round(float((preds == gold).mean()), 4),
+        "agreement_vs_torch": round(float((preds == reference).mean()), 4),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+        "p99_ms": round(float(np.percentile(latencies, 99)), 2),
+    })
+
+print(pd.DataFrame(rows).to_string(index=False))
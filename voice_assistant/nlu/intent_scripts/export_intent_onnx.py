@@ -0,0 +1,59 @@
+import os
+import sys
+import argparse
+from pathlib import Path
+
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.append(str(project_root))
+
+# === Config ===
+MODEL_DIR = "voice_assistant/models/intent_model"
+OUTPUT_DIR = os.path.join(MODEL_DIR, "onnx")
+
+parser = argparse.ArgumentParser(description="Export the intent classifier to ONNX (fp32 + dynamic int8).")
+parser.add_argument("--model-dir", default=MODEL_DIR)
+parser.add_argument("--output-dir", default=OUTPUT_DIR)
+parser.add_argument("--opset", type=int, default=14)
+args = parser.parse_args()
+
+os.makedirs(args.output_dir, exist_ok=True)
+fp32_path = os.path.join(args.output_dir, "model.onnx")
+int8_path = os.path.join(args.output_dir, "model.int8.onnx")
+
+# === Load fine-tuned model ===
+print(f"[INFO] Loading fine-tuned model from {args.model_dir}")
+model = AutoModelForSequenceClassification.from_pretrained(args.model_dir).eval()
+tokenizer = AutoTokenizer.from_pretrained(args.model_dir)
+# The HF model returns a ModelOutput; export plain logits
+model.config.return_dict = False
+
+# === Export (dynamic batch and sequence length) ===
+sample = tokenizer(["find me a 20 minute yoga with Alex"], return_tensors="pt")
+with torch.no_grad():
+    torch.onnx.export(
+        model,
+        (sample["input_ids"], sample["attention_mask"]),
+        fp32_path,
+        input_names=["input_ids", "attention_mask"],
+        output_names=["logits"],
+        dynamic_axes={
+            "input_ids": {0: "batch", 1: "sequence"},
+            "attention_mask": {0: "batch", 1: "sequence"},
+            "logits": {0: "batch"},
+        },
+        opset_version=args.opset,
+        do_constant_folding=True,
+    )
+print(f"[INFO] Exported fp32 ONNX model: {fp32_path} ({os.path.getsize(fp32_path) / 1024 ** 2:.1f} MB)")
+
+# === Dynamic int8 quantization (weights int8, activations quantized at runtime) ===
+quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+print(f"[INFO] Quantized int8 ONNX model: {int8_path} ({os.path.getsize(int8_path) / 1024 ** 2:.1f} MB)")
+
+# Tokenizer travels with the ONNX files so the folder is self-contained
+tokenizer.save_pretrained(args.output_dir)
+print("[INFO] Done. Select it with INTENT_BACKEND=onnx (INTENT_ONNX_PATH to pick fp32 vs int8).")
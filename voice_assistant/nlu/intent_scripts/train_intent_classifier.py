@@ -1,49 +1,79 @@
 import os
 import json
+import hashlib
+import argparse
 import torch
 import pandas as pd
 import numpy as np
 import evaluate
-from datasets import Dataset, DatasetDict
+from datasets import Dataset, DatasetDict, load_from_disk
 from transformers import (
-    DistilBertTokenizerFast,
-    DistilBertForSequenceClassification,
+    AutoTokenizer,
+    AutoModelForSequenceClassification,
+    DataCollatorWithPadding,
     Trainer,
     TrainingArguments
 )
+from transformers.trainer_utils import get_last_checkpoint
 from sklearn.model_selection import train_test_split
 
-print(f"[INFO] Using device: {'GPU' if torch.cuda.is_available() else 'CPU'}")
-
 # === Config ===
 MODEL_DIR = "voice_assistant/models/intent_model"
 DATA_PATH = "voice_assistant/data/intent_data/intent_training_data.csv"
+CACHE_DIR = "voice_assistant/data/intent_data/.tokenized_cache"
+
+parser = argparse.ArgumentParser(description="Fine-tune the intent classifier (CPU-friendly, resumable).")
+parser.add_argument("--base-model", default="distilbert-base-uncased")
+parser.add_argument("--data", default=DATA_PATH)
+parser.add_argument("--output-dir", default=MODEL_DIR)
+parser.add_argument("--epochs", type=int, default=20)
+parser.add_argument("--batch-size", type=int, default=16)
+parser.add_argument("--max-length", type=int, default=64, help="Voice queries are < 20 tokens; no need for 512")
+parser.add_argument("--resume", action="store_true", help="Continue from the latest checkpoint of a run with the same data and settings")
+args = parser.parse_args()
+
+use_cuda = torch.cuda.is_available()
+print(f"[INFO] Using device: {'GPU' if use_cuda else 'CPU'}")
 
 # === Load & prepare data ===
-df = pd.read_csv(DATA_PATH)
+df = pd.read_csv(args.data)
 label_list = df["label"].unique().tolist()
 label_to_id = {label: i for i, label in enumerate(label_list)}
 df["label_id"] = df["label"].map(label_to_id)
 
-train_df, test_df = train_test_split(df, test_size=0.2, random_state=42)
-dataset = DatasetDict({
-    "train": Dataset.from_pandas(train_df),
-    "test": Dataset.from_pandas(test_df),
-})
+# === Tokenization (cached on disk, keyed by data + tokenizer) ===
+tokenizer = AutoTokenizer.from_pretrained(args.base_model)
 
-# === Tokenization ===
-tokenizer = DistilBertTokenizerFast.from_pretrained("distilbert-base-uncased")
+def cache_key() -> str:
+    digest = hashlib.sha256()
+    with open(args.data, "rb") as f:
+        digest.update(f.read())
+    digest.update(f"{args.base_model}|{type(tokenizer).__name__}|{len(tokenizer)}|{args.max_length}".encode())
+    return digest.hexdigest()[:16]
 
 def tokenize(example):
-    return tokenizer(example["text"], padding="max_length", truncation=True)
-
-dataset = dataset.map(tokenize)
-dataset = dataset.remove_columns(["text", "label"])
-dataset = dataset.rename_column("label_id", "labels")
+    # No padding here: DataCollatorWithPadding pads each batch to its longest example
+    return tokenizer(example["text"], truncation=True, max_length=args.max_length)
+
+cache_path = os.path.join(CACHE_DIR, cache_key())
+if os.path.exists(cache_path):
+    print(f"[INFO] Loading tokenized dataset from cache: {cache_path}")
+    dataset = load_from_disk(cache_path)
+else:
+    train_df, test_df = train_test_split(df, test_size=0.2, random_state=42)
+    dataset = DatasetDict({
+        "train": Dataset.from_pandas(train_df, preserve_index=False),
+        "test": Dataset.from_pandas(test_df, preserve_index=False),
+    })
+    dataset = dataset.map(tokenize, batched=True)
+    dataset = dataset.remove_columns(["text", "label"])
+    dataset = dataset.rename_column("label_id", "labels")
+    dataset.save_to_disk(cache_path)
+    print(f"[INFO] Cached tokenized dataset: {cache_path}")
 
 # === Model ===
-model = DistilBertForSequenceClassification.from_pretrained(
-    "distilbert-base-uncased",
+model = AutoModelForSequenceClassification.from_pretrained(
+    args.base_model,
     num_labels=len(label_list)
 )
 
@@ -56,22 +86,32 @@ def compute_metrics(eval_pred):
     return accuracy.compute(predictions=predictions, references=labels)
 
 # === Training config ===
+# Checkpoints live under a directory keyed by data + hyperparameters, so --resume
+# can only continue a run that was training the same thing.
+def run_key() -> str:
+    settings = f"{cache_key()}|{args.epochs}|{args.batch_size}"
+    return hashlib.sha256(settings.encode()).hexdigest()[:16]
+
+checkpoint_dir = os.path.join(args.output_dir, "checkpoints", run_key())
+
 training_args = TrainingArguments(
-    output_dir=MODEL_DIR,
+    output_dir=checkpoint_dir,
     evaluation_strategy="epoch",
-    save_strategy="epoch", 
+    save_strategy="epoch",
     logging_strategy="epoch",
-    num_train_epochs=20,
-    per_device_train_batch_size=16,
-    per_device_eval_batch_size=8,
+    num_train_epochs=args.epochs,
+    per_device_train_batch_size=args.batch_size,
+    per_device_eval_batch_size=32,
     learning_rate=2e-5,
     weight_decay=0.01,
     logging_dir="./logs",
     load_best_model_at_end=True,
-    warmup_ratio=0.1,              
-    lr_scheduler_type="linear",    
+    save_total_limit=2,
+    warmup_ratio=0.1,
+    lr_scheduler_type="linear",
     metric_for_best_model="accuracy",
-    fp16=True,
+    group_by_length=True,          # batches of similar length -> little padding
+    fp16=use_cuda,                 # mixed precision only where it is supported
 )
 
 trainer = Trainer(
@@ -80,17 +120,21 @@ trainer = Trainer(
     train_dataset=dataset["train"],
     eval_dataset=dataset["test"],
     tokenizer=tokenizer,
+    data_collator=DataCollatorWithPadding(tokenizer),
     compute_metrics=compute_metrics,
 )
 
-# === Train ===
-trainer.train()
+# === Train (with --resume, from the latest checkpoint of this run, if any) ===
+last_checkpoint = get_last_checkpoint(checkpoint_dir) if args.resume and os.path.isdir(checkpoint_dir) else None
+if last_checkpoint:
+    print(f"[INFO] Resuming from checkpoint: {last_checkpoint}")
+trainer.train(resume_from_checkpoint=last_checkpoint)
 
 # === Save final model/tokenizer/label map ===
-model.save_pretrained(MODEL_DIR)
-tokenizer.save_pretrained(MODEL_DIR)
+model.save_pretrained(args.output_dir)
+tokenizer.save_pretrained(args.output_dir)
 
-with open(os.path.join(MODEL_DIR, "label_map.json"), "w") as f:
+with open(os.path.join(args.output_dir, "label_map.json"), "w") as f:
     json.dump(label_to_id, f)
 
 print("Model, tokenizer, and label map saved.")
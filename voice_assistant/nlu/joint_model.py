@@ -0,0 +1,167 @@
+import os
+import sys
+import json
+from pathlib import Path
+
+import torch
+from torch import nn
+
+# Enable root-level imports
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.nlu.intent_backends import load_temperature
+
+# Entity labels produced by nlu/entity_scripts/generate_ner_data.py
+ENTITY_LABELS = ["WORKOUT_TYPE", "DURATION", "INTENSITY", "GOAL", "MOOD", "INSTRUCTOR", "TIME_OF_DAY"]
+BIO_LABELS = ["O"] + [f"{prefix}-{label}" for label in ENTITY_LABELS for prefix in ("B", "I")]
+CONFIG_NAME = "joint_config.json"
+WEIGHTS_NAME = "joint_model.pt"
+
+
+class JointIntentEntityModel(nn.Module):
+    """
+    One transformer encoder shared by two heads: sequence classification for
+    the intent (on the first token) and BIO token classification for entities.
+    """
+
+    def __init__(self, encoder_name: str, intent_labels: list, bio_labels: list = BIO_LABELS, dropout: float = 0.1, pretrained: bool = True):
+        super().__init__()
+        from transformers import AutoConfig, AutoModel
+
+        self.intent_labels = list(intent_labels)
+        self.bio_labels = list(bio_labels)
+        if pretrained:
+            self.encoder = AutoModel.from_pretrained(encoder_name)
+        else:
+            # Architecture only; weights come from the saved joint state dict
+            self.encoder = AutoModel.from_config(AutoConfig.from_pretrained(encoder_name))
+        hidden = self.encoder.config.hidden_size
+        self.dropout = nn.Dropout(dropout)
+        self.intent_head = nn.Linear(hidden, len(self.intent_labels))
+        self.entity_head = nn.Linear(hidden, len(self.bio_labels))
+
+    def forward(self, input_ids, attention_mask, intent_labels=None, entity_labels=None):
+        hidden = self.dropout(self.encoder(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state)
+        intent_logits = self.intent_head(hidden[:, 0])
+        entity_logits = self.entity_head(hidden)
+
+        loss = None
+        if intent_labels is not None or entity_labels is not None:
+            loss_fn = nn.CrossEntropyLoss(ignore_index=-100)
+            loss = 0.0
+            if intent_labels is not None:
+                loss = loss + loss_fn(intent_logits, intent_labels)
+            # Utterances without span annotations carry all -100 entity labels
+            if entity_labels is not None and (entity_labels != -100).any():
+                loss = loss + loss_fn(entity_logits.reshape(-1, len(self.bio_labels)), entity_labels.reshape(-1))
+        return {"loss": loss, "intent_logits": intent_logits, "entity_logits": entity_logits}
+
+    # === Persistence ===
+    def save(self, output_dir: str, tokenizer=None):
+        os.makedirs(output_dir, exist_ok=True)
+        torch.save(self.state_dict(), os.path.join(output_dir, WEIGHTS_NAME))
+        self.encoder.config.save_pretrained(output_dir)
+        with open(os.path.join(output_dir, CONFIG_NAME), "w") as f:
+            json.dump({"intent_labels": self.intent_labels, "bio_labels": self.bio_labels}, f, indent=2)
+        if tokenizer is not None:
+            tokenizer.save_pretrained(output_dir)
+
+    @classmethod
+    def load(cls, model_dir: str):
+        with open(os.path.join(model_dir, CONFIG_NAME)) as f:
+            meta = json.load(f)
+        # Encoder config lives in model_dir, so no download is needed here
+        model = cls(model_dir, meta["intent_labels"], meta["bio_labels"], pretrained=False)
+        model.load_state_dict(torch.load(os.path.join(model_dir, WEIGHTS_NAME), map_location="cpu"))
+        return model.eval()
+
+
+def align_entity_labels(offsets, spans, bio_labels: list = BIO_LABELS) -> list:
+    """Map character-level entity spans to one BIO label id per token (-100 for special tokens)."""
+    label_ids = []
+    for start, end in offsets:
+        if start == end:  # special / padding token
+            label_ids.append(-100)
+            continue
+        tag = "O"
+        for span_start, span_end, label in spans:
+            if start >= span_start and end <= span_end:
+                tag = f"{'B' if start == span_start else 'I'}-{label}"
+                break
+        label_ids.append(bio_labels.index(tag) if tag in bio_labels else 0)
+    return label_ids
+
+
+def decode_entities(text: str, offsets, tag_ids, bio_labels: list = BIO_LABELS) -> dict:
+    """Collapse BIO token tags back into {label: surface text}, same shape as the spaCy path."""
+    entities = {}
+    current_label, span_start, span_end = None, None, None
+
+    def close():
+        if current_label is not None:
+            entities[current_label.lower()] = text[span_start:span_end]
+
+    for (start, end), tag_id in zip(offsets, tag_ids):
+        if start == end:
+            continue
+        tag = bio_labels[tag_id]
+        if tag == "O":
+            close()
+            current_label = None
+            continue
+        prefix, label = tag.split("-", 1)
+        if prefix == "I" and label == current_label:
+            span_end = end
+        else:
+            close()
+            current_label, span_start, span_end = label, start, end
+    close()
+    return entities
+
+
+class JointNLU:
+    """
+    Inference wrapper: one tokenization and one forward pass per batch of utterances.
+
+    Intent scores are softmax(intent_logits / temperature) with the joint
+    head's own fitted temperature (calibrate_intent.py --backend joint).
+    """
+
+    name = "joint"
+
+    def __init__(self, model_dir: str, max_length: int = 64):
+        from transformers import AutoTokenizer
+
+        self.model = JointIntentEntityModel.load(model_dir)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.max_length = max_length
+        self.temperature = load_temperature(model_dir, self.name)
+
+    def _forward(self, texts: list):
+        encoded = self.tokenizer(
+            texts, padding=True, truncation=True, max_length=self.max_length,
+            return_offsets_mapping=True, return_tensors="pt",
+        )
+        offsets = encoded.pop("offset_mapping").tolist()
+        return offsets, self.model(encoded["input_ids"], encoded["attention_mask"])
+
+    @torch.inference_mode()
+    def logits(self, texts: list):
+        # Raw intent logits ordered by intent label id, as in the classifier backends
+        return self._forward(texts)[1]["intent_logits"].numpy()
+
+    @torch.inference_mode()
+    def predict(self, texts: list) -> list:
+        offsets, out = self._forward(texts)
+        intent_probs = (out["intent_logits"] / self.temperature).softmax(-1)
+        tag_ids = out["entity_logits"].argmax(-1).tolist()
+
+        results = []
+        for i, text in enumerate(texts):
+            score, intent_id = intent_probs[i].max(-1)
+            results.append({
+                "intent": self.model.intent_labels[int(intent_id)],
+                "intent_score": float(score),
+                "entities": decode_entities(text, offsets[i], tag_ids[i], self.model.bio_labels),
+            })
+        return results
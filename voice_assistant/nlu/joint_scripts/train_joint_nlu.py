@@ -0,0 +1,146 @@
+import os
+import sys
+import json
+import random
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import torch
+from torch.utils.data import DataLoader
+from transformers import AutoTokenizer, get_linear_schedule_with_warmup
+from sklearn.model_selection import train_test_split
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.append(str(project_root))
+from voice_assistant.nlu.joint_model import BIO_LABELS, JointIntentEntityModel, align_entity_labels
+
+# === Config ===
+INTENT_DATA_PATH = "voice_assistant/data/intent_data/intent_training_data.csv"
+ENTITY_DATA_DIR = "voice_assistant/data/entity_data"  # train.json / dev.json from generate_ner_data.py
+INTENT_LABEL_MAP = "voice_assistant/models/intent_model/label_map.json"
+OUTPUT_DIR = "voice_assistant/models/joint_model"
+
+parser = argparse.ArgumentParser(description="Train one encoder with intent + entity heads.")
+parser.add_argument("--base-model", default="distilbert-base-uncased")
+parser.add_argument("--output-dir", default=OUTPUT_DIR)
+parser.add_argument("--epochs", type=int, default=5)
+parser.add_argument("--batch-size", type=int, default=32)
+parser.add_argument("--lr", type=float, default=5e-5)
+parser.add_argument("--max-length", type=int, default=64)
+parser.add_argument("--max-entity-examples", type=int, default=None, help="Subsample the NER set for faster runs")
+parser.add_argument("--entity-intent", default="search_class", help="Intent label for the NER utterances (all are search queries)")
+args = parser.parse_args()
+
+random.seed(42)
+torch.manual_seed(42)
+device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+print(f"[INFO] Using device: {device}")
+
+# === Load data ===
+# Intent CSV rows have no span annotations; NER rows have spans and a fixed intent.
+with open(INTENT_LABEL_MAP) as f:
+    label_to_id = json.load(f)
+intent_labels = [label for label, _ in sorted(label_to_id.items(), key=lambda kv: kv[1])]
+
+intent_df = pd.read_csv(INTENT_DATA_PATH)
+# Same label space as the intent classifier: rows with other labels are skipped
+unknown = ~intent_df["label"].isin(label_to_id)
+if unknown.any():
+    print(f"[WARN] Skipping {int(unknown.sum())} rows with labels not in {INTENT_LABEL_MAP}: {sorted(intent_df.loc[unknown, 'label'].unique())}")
+    intent_df = intent_df[~unknown]
+intent_train, intent_dev = train_test_split(intent_df, test_size=0.2, random_state=42)
+
+def intent_records(df):
+    return [{"text": r.text, "intent": label_to_id[r.label], "spans": None} for r in df.itertuples()]
+
+def entity_records(path, limit=None):
+    with open(path) as f:
+        data = json.load(f)
+    if limit:
+        data = random.sample(data, min(limit, len(data)))
+    return [{"text": r["text"], "intent": label_to_id[args.entity_intent], "spans": r["entities"]} for r in data]
+
+train_records = intent_records(intent_train) + entity_records(os.path.join(ENTITY_DATA_DIR, "train.json"), args.max_entity_examples)
+dev_intent = intent_records(intent_dev)
+dev_entity = entity_records(os.path.join(ENTITY_DATA_DIR, "dev.json"), args.max_entity_examples and args.max_entity_examples // 4)
+print(f"[INFO] Train: {len(train_records)} | Dev intent: {len(dev_intent)} | Dev entity: {len(dev_entity)}")
+
+# === Tokenization (dynamic padding per batch) ===
+tokenizer = AutoTokenizer.from_pretrained(args.base_model)
+
+def collate(records):
+    encoded = tokenizer(
+        [r["text"] for r in records], padding=True, truncation=True,
+        max_length=args.max_length, return_offsets_mapping=True, return_tensors="pt",
+    )
+    offsets = encoded.pop("offset_mapping").tolist()
+    entity_labels = [
+        align_entity_labels(offs, r["spans"]) if r["spans"] is not None else [-100] * len(offs)
+        for offs, r in zip(offsets, records)
+    ]
+    return {
+        "input_ids": encoded["input_ids"],
+        "attention_mask": encoded["attention_mask"],
+        "intent_labels": torch.tensor([r["intent"] for r in records]),
+        "entity_labels": torch.tensor(entity_labels),
+    }
+
+train_loader = DataLoader(train_records, batch_size=args.batch_size, shuffle=True, collate_fn=collate)
+
+# === Model ===
+model = JointIntentEntityModel(args.base_model, intent_labels, BIO_LABELS).to(device)
+optimizer = torch.optim.AdamW(model.parameters(), lr=args.lr, weight_decay=0.01)
+total_steps = len(train_loader) * args.epochs
+scheduler = get_linear_schedule_with_warmup(optimizer, int(0.1 * total_steps), total_steps)
+
+# === Evaluation ===
+@torch.no_grad()
+def evaluate():
+    model.eval()
+    correct = total = 0
+    for start in range(0, len(dev_intent), 64):
+        batch = {k: v.to(device) for k, v in collate(dev_intent[start:start + 64]).items()}
+        preds = model(batch["input_ids"], batch["attention_mask"])["intent_logits"].argmax(-1)
+        correct += int((preds == batch["intent_labels"]).sum())
+        total += len(preds)
+
+    tp = fp = fn = 0
+    for start in range(0, len(dev_entity), 64):
+        batch = {k: v.to(device) for k, v in collate(dev_entity[start:start + 64]).items()}
+        preds = model(batch["input_ids"], batch["attention_mask"])["entity_logits"].argmax(-1)
+        gold = batch["entity_labels"]
+        mask = gold != -100
+        # Token-level micro F1 over entity (non-O) tags
+        tp += int(((preds == gold) & (gold > 0) & mask).sum())
+        fp += int(((preds != gold) & (preds > 0) & mask).sum())
+        fn += int(((preds != gold) & (gold > 0) & mask).sum())
+    f1 = 2 * tp / max(2 * tp + fp + fn, 1)
+    model.train()
+    return correct / max(total, 1), f1
+
+# === Train ===
+best_score = -1.0
+model.train()
+for epoch in range(args.epochs):
+    losses = []
+    for batch in train_loader:
+        batch = {k: v.to(device) for k, v in batch.items()}
+        loss = model(**batch)["loss"]
+        loss.backward()
+        torch.nn.utils.clip_grad_norm_(model.parameters(), 1.0)
+        optimizer.step()
+        scheduler.step()
+        optimizer.zero_grad()
+        losses.append(loss.item())
+
+    intent_acc, entity_f1 = evaluate()
+    print(f"[INFO] Epoch {epoch + 1}: loss={np.mean(losses):.4f} intent_acc={intent_acc:.4f} entity_token_f1={entity_f1:.4f}")
+    score = intent_acc + entity_f1
+    if score > best_score:
+        best_score = score
+        model.save(args.output_dir, tokenizer)
+        print(f"[INFO] Saved best model to {args.output_dir}")
+
+print("Joint model, tokenizer and label config saved. Enable with NLU_MODE=joint.")
@@ -0,0 +1,95 @@
+import re
+import copy
+import time
+import threading
+
+from voice_assistant.utils.cache import TTLCache, path_fingerprint
+
+# === Utterance normalization (cache key only) ===
+UNITS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13,
+    "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19,
+}
+TENS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+_PUNCTUATION = re.compile(r"[^\w\s']+")
+
+
+def _numbers_to_digits(words: list) -> list:
+    """["twenty", "five", "minute"] -> ["25", "minute"]"""
+    out, current = [], None
+    for word in words:
+        if word in TENS and current is None:
+            current = TENS[word]
+        elif word in UNITS and (current is None or (current >= 20 and current % 10 == 0 and UNITS[word] < 10)):
+            current = UNITS[word] if current is None else current + UNITS[word]
+        elif word == "hundred" and current is not None and current < 10:
+            current *= 100
+        else:
+            if current is not None:
+                out.append(str(current))
+                current = None
+            if word in TENS or word in UNITS:
+                current = TENS.get(word, UNITS.get(word))
+            else:
+                out.append(word)
+    if current is not None:
+        out.append(str(current))
+    return out
+
+
+def normalize_utterance(text: str) -> str:
+    """Case, punctuation, whitespace and number words folded: "Twenty-five min Yoga!" -> "25 min yoga"."""
+    text = _PUNCTUATION.sub(" ", text.replace("’", "'").lower())
+    return " ".join(_numbers_to_digits(text.split()))
+
+
+# === Parse cache ===
+
+class NLUCache:
+    """
+    Parsed results keyed by normalized utterance. Entries are dropped as soon
+    as any of the model paths changes on disk (checked at most every
+    `check_interval` seconds) so a retrained model never serves stale parses.
+    """
+
+    def __init__(self, model_paths, max_entries: int = 4096, ttl_seconds: float = None, check_interval: float = 1.0):
+        self.model_paths = [p for p in model_paths if p]
+        self.cache = TTLCache(max_entries, ttl_seconds)
+        self.check_interval = check_interval
+        self.invalidations = 0
+        self._fingerprint = path_fingerprint(self.model_paths)
+        self._checked_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _check_models(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            fingerprint = path_fingerprint(self.model_paths)
+            if fingerprint != self._fingerprint:
+                self._fingerprint = fingerprint
+                self.cache.clear()
+                self.invalidations += 1
+
+    def get(self, text: str):
+        self._check_models()
+        parsed = self.cache.get(normalize_utterance(text))
+        # Callers (e.g. normalize_entities) mutate the result in place
+        return copy.deepcopy(parsed) if parsed is not None else None
+
+    def put(self, text: str, parsed: dict):
+        self.cache.put(normalize_utterance(text), copy.deepcopy(parsed))
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return dict(self.cache.stats(), invalidations=self.invalidations)
@@ -2,103 +2,345 @@ import sys
 from pathlib import Path
 import os
 import json
-import spacy
-from transformers import pipeline, DistilBertForSequenceClassification, DistilBertTokenizerFast
+import threading
 import argparse
 # === Setup project root ===
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(project_root))
 
-from voice_assistant.nlu.entity_scripts.custom_entity_scripts.custom_entity_extractor import keyword_matcher
 from voice_assistant.utils import config
-from voice_assistant.search.search_workouts import search_workouts
-from voice_assistant.asr.record_and_transcribe import record_and_transcribe
-from voice_assistant.asr.transcribe import transcribe_audio
+from voice_assistant.nlu.intent_batcher import IntentBatcher
+from voice_assistant.nlu.intent_backends import load_intent_classifier
+from voice_assistant.nlu.gazetteer import fast_parse
+from voice_assistant.nlu.nlu_cache import NLUCache
+from voice_assistant.nlu.spacy_loader import load_ner_pipeline
+from voice_assistant.utils.log import get_logger
+from voice_assistant.utils.metrics import INTENT_ROUTES, NLU_CACHE, NLU_FAST_PATH, timed
 
-# === Record user input ===
-# speech_input = record_and_transcribe()
+logger = get_logger(__name__)
 
-# === Load models ===
-print("[INFO] Loading intent classifier (fine-tuned DistilBERT model)...")
-MODEL_DIR = os.path.join(project_root, "voice_assistant/models/intent_model")
-with open(os.path.join(MODEL_DIR, "label_map.json")) as f:
-    label_to_id = json.load(f)
-id_to_label = {v: k for k, v in label_to_id.items()}
+MODEL_DIR = config.INTENT_MODEL_DIR or os.path.join(project_root, "voice_assistant/models/intent_model")
 
-model = DistilBertForSequenceClassification.from_pretrained(MODEL_DIR)
-tokenizer = DistilBertTokenizerFast.from_pretrained(MODEL_DIR)
-intent_classifier = pipeline("text-classification", model=model, tokenizer=tokenizer, top_k=1)
 
-print(f"[INFO] Loading spaCy NER pipeline ({config.SPACY_MODEL})...")
-nlp = spacy.load(config.SPACY_MODEL)
+class NLUPipeline:
+    """
+    Intent + entity parsing with lazily loaded models.
 
-# === Entity Extraction ===
-def extract_entities(text):
-    print(f"[INFO] Extracting entities from: {text}")
-    doc = nlp(text)
-    entities = {}
+    Constructing the pipeline (and importing this module) is cheap: torch,
+    transformers and spaCy are imported and the models loaded on first use,
+    or up front via `warmup()`. Each component loads at most once, even when
+    several threads hit it at the same time.
+    """
+
+    def __init__(self, intent_model_dir: str = MODEL_DIR, spacy_model: str = None, intent_backend: str = None,
+                 mode: str = None, joint_model_dir: str = None, fast_path: bool = None):
+        self.intent_model_dir = intent_model_dir
+        self.spacy_model = spacy_model or config.SPACY_MODEL
+        self.intent_backend = intent_backend or config.INTENT_BACKEND
+        self.mode = mode or config.NLU_MODE
+        self.joint_model_dir = joint_model_dir or config.JOINT_MODEL_DIR
+        self.fast_path = config.NLU_FAST_PATH if fast_path is None else fast_path
+        self.intent_batcher = None
+        self._intent_classifier = None
+        self._joint_model = None
+        self._nlp = None
+        self._lock = threading.Lock()
+        self.cache = None
+        if config.NLU_CACHE_SIZE > 0:
+            self.cache = NLUCache(self._model_paths(), config.NLU_CACHE_SIZE, config.NLU_CACHE_TTL_SECONDS)
+
+        with open(os.path.join(intent_model_dir, "label_map.json")) as f:
+            label_to_id = json.load(f)
+        self.id_to_label = {v: k for k, v in label_to_id.items()}
+
+    def _model_paths(self) -> list:
+        """Files and dirs whose change must invalidate cached parses."""
+        paths = [self.intent_model_dir, self.spacy_model if os.path.exists(self.spacy_model or "") else None]
+        if self.intent_backend == "onnx":
+            paths.append(config.INTENT_ONNX_PATH)
+        if self.mode == "joint":
+            paths.append(self.joint_model_dir)
+        return paths
+
+    # === Lazy model loading ===
+    @property
+    def intent_classifier(self):
+        if self._intent_classifier is None:
+            with self._lock:
+                if self._intent_classifier is None:
+                    logger.info("Loading intent classifier (fine-tuned DistilBERT, %s backend)...", self.intent_backend)
+                    self._intent_classifier = load_intent_classifier(self.intent_model_dir, self.intent_backend)
+        return self._intent_classifier
+
+    @property
+    def nlp(self):
+        if self._nlp is None:
+            with self._lock:
+                if self._nlp is None:
+                    logger.info("Loading spaCy NER pipeline (%s)...", self.spacy_model)
+                    self._nlp = load_ner_pipeline(self.spacy_model)
+        return self._nlp
+
+    @property
+    def joint_model(self):
+        if self._joint_model is None:
+            with self._lock:
+                if self._joint_model is None:
+                    from voice_assistant.nlu.joint_model import JointNLU
+
+                    logger.info("Loading joint intent + entity model (%s)...", self.joint_model_dir)
+                    self._joint_model = JointNLU(self.joint_model_dir, max_length=config.INTENT_MAX_LENGTH)
+        return self._joint_model
+
+    def warmup(self, intent: bool = True, entities: bool = True):
+        """Load the models now and run one dummy inference so the first request is not cold."""
+        if self.mode == "joint":
+            self.joint_model.predict(["warmup"])
+            return self
+        if intent:
+            self.intent_classifier.predict(["warmup"])
+        if entities:
+            self.nlp("warmup")
+        return self
+
+    # === Entity Extraction ===
+    @staticmethod
+    def _doc_entities(doc) -> dict:
+        entities = {}
+        for ent in doc.ents:
+            label = ent.label_.lower()
+            entities[label] = ent.text
+
+            # comment below when my entity model is fine-tuned.
+            # if ent.label_ == "TIME":
+            #     entities["time"] = ent.text
+            # elif ent.label_ == "PERSON":
+            #     entities["person"] = ent.text
+
+        # custom_entities = keyword_matcher(text)
+        # entities.update(custom_entities)
+        return entities
+
+    def extract_entities(self, text):
+        logger.debug("Extracting entities from: %s", text)
+        with timed("ner"):
+            doc = self.nlp(text)
+        entities = self._doc_entities(doc)
+        logger.debug("Extracted entities: %s", entities)
+        return entities
+
+    def extract_entities_batch(self, texts: list, batch_size: int = 64, n_process: int = 1) -> list:
+        """NER over many utterances with nlp.pipe (one batched transformer call per batch)."""
+        with timed("ner"):
+            docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+            return [self._doc_entities(doc) for doc in docs]
+
+    # === Intent Detection ===
+    def detect_intents_scored(self, texts: list) -> list:
+        """(label, calibrated confidence) per utterance, from one padded forward pass."""
+        predictions = self.intent_classifier.predict(texts)
+        return [(self.id_to_label.get(label_id, "unknown"), score) for label_id, score in predictions]
+
+    def detect_intents(self, texts: list) -> list:
+        """Classify several utterances in one padded forward pass."""
+        return [label for label, _ in self.detect_intents_scored(texts)]
+
+    def enable_intent_batching(self):
+        if self.intent_batcher is None:
+            self.intent_batcher = IntentBatcher(self.detect_intents_scored).start()
+        return self.intent_batcher
+
+    def disable_intent_batching(self):
+        if self.intent_batcher is not None:
+            self.intent_batcher.stop()
+            self.intent_batcher = None
+
+    def detect_intent_scored(self, text: str) -> tuple:
+        with timed("intent"):
+            if self.intent_batcher is not None:
+                intent, confidence = self.intent_batcher.classify(text)
+            else:
+                intent, confidence = self.detect_intents_scored([text])[0]
+        logger.debug("Detected intent: %s (%.3f)", intent, confidence)
+        return intent, confidence
+
+    def detect_intent(self, text: str) -> str:
+        return self.detect_intent_scored(text)[0]
+
+    @staticmethod
+    def route_intent(intent: str, confidence: float) -> dict:
+        """
+        Early exit for requests that will not produce results: low-confidence
+        predictions become the fallback intent, and intents outside
+        ENTITY_INTENTS are returned without running NER. None means the
+        entities are needed.
+        """
+        if confidence < config.INTENT_CONFIDENCE_THRESHOLD:
+            INTENT_ROUTES.inc("fallback")
+            return {"intent": config.FALLBACK_INTENT, "confidence": confidence, "predicted_intent": intent, "entities": {}}
+        if intent not in config.ENTITY_INTENTS:
+            INTENT_ROUTES.inc("no_entities")
+            return {"intent": intent, "confidence": confidence, "entities": {}}
+        INTENT_ROUTES.inc("entities")
+        return None
 
-    for ent in doc.ents:
-        label = ent.label_.lower()
-        entities[label] = ent.text
+    # === Joint model (one forward pass for intent + entities) ===
+    def run_joint(self, transcript: str) -> dict:
+        with timed("nlu_joint"):
+            prediction = self.joint_model.predict([transcript])[0]
+        return self._joint_result(prediction)
 
-        # comment below when my entity model is fine-tuned.
-        # if ent.label_ == "TIME":
-        #     entities["time"] = ent.text
-        # elif ent.label_ == "PERSON":
-        #     entities["person"] = ent.text
+    def _joint_result(self, prediction: dict) -> dict:
+        routed = self.route_intent(prediction["intent"], prediction["intent_score"])
+        if routed is not None:
+            return routed
+        return {"intent": prediction["intent"], "confidence": prediction["intent_score"], "entities": prediction["entities"]}
 
-    # custom_entities = keyword_matcher(text)
-    # entities.update(custom_entities)
+    # === Gazetteer fast path ===
+    def run_fast_path(self, transcript: str):
+        """Rule-based parse for simple queries; None when the neural models are needed."""
+        with timed("gazetteer"):
+            parsed = fast_parse(transcript)
+        NLU_FAST_PATH.inc("hit" if parsed is not None else "miss")
+        return parsed
 
-    print("[INFO] Extracted entities:")
-    for key, value in entities.items():
-        print(f"    - {key}: {value}")
-    return entities
+    def fast_path_stats(self) -> dict:
+        hits, misses = NLU_FAST_PATH.value("hit"), NLU_FAST_PATH.value("miss")
+        total = hits + misses
+        return {"enabled": self.fast_path, "hits": int(hits), "misses": int(misses),
+                "hit_rate": round(hits / total, 4) if total else None}
+
+    # === Full Pipeline ===
+    def run(self, transcript: str) -> dict:
+        if self.cache is None:
+            return self._run_uncached(transcript)
+        parsed = self.cache.get(transcript)
+        NLU_CACHE.inc("hit" if parsed is not None else "miss")
+        if parsed is None:
+            parsed = self._run_uncached(transcript)
+            self.cache.put(transcript, parsed)
+        return parsed
+
+    def _run_uncached(self, transcript: str) -> dict:
+        if self.fast_path:
+            parsed = self.run_fast_path(transcript)
+            if parsed is not None:
+                return parsed
+        if self.mode == "joint":
+            return self.run_joint(transcript)
+        intent, confidence = self.detect_intent_scored(transcript)
+        routed = self.route_intent(intent, confidence)
+        if routed is not None:
+            return routed
+        return {"intent": intent, "confidence": confidence, "entities": self.extract_entities(transcript)}
+
+    def parse(self, text: str) -> dict:
+        logger.debug("User said: %s", text)
+        parsed = self.run(text)
+        logger.debug("Parsed: %s", parsed)
+        return parsed
+
+    def parse_batch(self, texts: list, batch_size: int = 64, n_process: int = 1) -> list:
+        """
+        Parse many utterances at once, in input order. Cache hits and fast-path
+        parses are answered directly; the rest go through batched intent
+        inference and nlp.pipe (or the joint model) `batch_size` at a time.
+        """
+        results = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            parsed = None
+            if self.cache is not None:
+                parsed = self.cache.get(text)
+                NLU_CACHE.inc("hit" if parsed is not None else "miss")
+            if parsed is None and self.fast_path:
+                parsed = self.run_fast_path(text)
+            if parsed is not None:
+                results[i] = parsed
+            else:
+                pending.append(i)
+
+        pending_texts = [texts[i] for i in pending]
+        if self.mode == "joint":
+            parsed = []
+            for start in range(0, len(pending_texts), batch_size):
+                with timed("nlu_joint"):
+                    predictions = self.joint_model.predict(pending_texts[start:start + batch_size])
+                parsed.extend(self._joint_result(p) for p in predictions)
+        else:
+            scored = []
+            for start in range(0, len(pending_texts), batch_size):
+                with timed("intent"):
+                    scored.extend(self.detect_intents_scored(pending_texts[start:start + batch_size]))
+            parsed = [self.route_intent(intent, confidence) for intent, confidence in scored]
+            # NER only for the utterances whose intent needs entities
+            needs_entities = [j for j, p in enumerate(parsed) if p is None]
+            entities = self.extract_entities_batch([pending_texts[j] for j in needs_entities], batch_size, n_process) if needs_entities else []
+            for j, ents in zip(needs_entities, entities):
+                intent, confidence = scored[j]
+                parsed[j] = {"intent": intent, "confidence": confidence, "entities": ents}
+
+        for i, p in zip(pending, parsed):
+            results[i] = p
+            if self.cache is not None:
+                self.cache.put(texts[i], p)
+        return results
+
+
+# === Default pipeline used by the module-level helpers ===
+_default_pipeline = None
+_default_lock = threading.Lock()
+
+def get_pipeline() -> NLUPipeline:
+    global _default_pipeline
+    if _default_pipeline is None:
+        with _default_lock:
+            if _default_pipeline is None:
+                _default_pipeline = NLUPipeline()
+    return _default_pipeline
+
+def warmup(intent: bool = True, entities: bool = True) -> NLUPipeline:
+    return get_pipeline().warmup(intent, entities)
+
+def extract_entities(text):
+    return get_pipeline().extract_entities(text)
+
+def detect_intents(texts: list) -> list:
+    return get_pipeline().detect_intents(texts)
 
-# === Intent Detection ===
 def detect_intent(text: str) -> str:
-    result = intent_classifier(text)
-    if isinstance(result, list) and len(result) > 0:
-        top = result[0][0] if isinstance(result[0], list) else result[0]
-        raw_label = top["label"]
-        score = top["score"]
-        label_id = int(raw_label.split("_")[-1])
-        intent = id_to_label.get(label_id, "unknown")
-        print(f"[INFO] Detected intent: {intent}")
-        return intent
-    raise ValueError("Unexpected output from intent classifier")
-
-# === Full Pipeline ===
-def parse_text(text: str) -> dict:
-    print("\n================ NLP PIPELINE START ================\n")
-    print(f"[INFO] User said: {text}")
-    intent = detect_intent(text)
-    entities = extract_entities(text)
-    result = {"intent": intent, "entities": entities}
-    print("\n[RESULT] Parsed result:")
-    print(result)
-    return result
+    return get_pipeline().detect_intent(text)
+
+def enable_intent_batching():
+    return get_pipeline().enable_intent_batching()
+
+def disable_intent_batching():
+    get_pipeline().disable_intent_batching()
 
 def run_pipeline(transcript: str):
-    intent = detect_intent(transcript)
-    entities = extract_entities(transcript)
-    return {"intent": intent, "entities": entities}
+    return get_pipeline().run(transcript)
 
 def parse_text(text: str):
-    print(f"\n[INFO] User said: {text}")
-    parsed = run_pipeline(text)
-    print(f"[RESULT] Parsed: {parsed}")
-    return parsed
+    return get_pipeline().parse(text)
+
+def parse_batch(texts: list, batch_size: int = 64, n_process: int = 1) -> list:
+    return get_pipeline().parse_batch(texts, batch_size, n_process)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--cli", action="store_true", help="Run end-to-end pipeline on CLI")
+    parser.add_argument("--stream", action="store_true", help="Stop recording at end of speech (VAD) instead of after 5s")
     args = parser.parse_args()
 
     if args.cli:
-        speech_input = record_and_transcribe()
+        from voice_assistant.search.search_workouts import search_workouts
+        from voice_assistant.asr.record_and_transcribe import record_and_transcribe, stream_and_transcribe
+
+        if args.stream:
+            speech_input = stream_and_transcribe(on_partial=lambda text: print(f"[PARTIAL] {text}"))
+        else:
+            speech_input = record_and_transcribe()
         parsed = parse_text(speech_input)
 
         print("\n================ SEARCH & RECOMMENDATION START ==================\n")
@@ -110,18 +352,3 @@ if __name__ == "__main__":
                 print(
                     f"- [{res['score']}] {res['title']} | {res['duration']} min | {res['instructor']} | {res['intensity']} | {res['type']}"
                 )
-
-
-# === Run Pipeline ===
-# if __name__ == "__main__":
-#     parsed = parse_text(speech_input)
-
-#     print("\n================ SEARCH & RECOMMENDATION START ==================\n")
-#     if parsed["intent"] == "search_class":
-#         top_k = 10
-#         results = search_workouts(parsed["intent"], parsed["entities"], top_k=top_k)
-#         print("[INFO] Top {} recommended classes (ranked by relevance score):".format(top_k))
-#         for res in results:
-#             print(
-#                 f"- [{res['score']}] {res['title']} | {res['duration']} min | {res['instructor']} | {res['intensity']} | {res['type']}"
-#             )
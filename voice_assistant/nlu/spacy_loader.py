@@ -0,0 +1,77 @@
+from pathlib import Path
+
+from voice_assistant.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Components that write doc.ents; everything else is only kept if one of these listens to it
+ENTITY_FACTORIES = {"ner", "beam_ner", "entity_ruler"}
+EMBEDDING_FACTORIES = {"tok2vec", "transformer"}
+
+
+def _find_config(name: str) -> Path:
+    """config.cfg of a model directory or an installed model package."""
+    from spacy import util
+
+    path = Path(name)
+    if not path.exists():
+        path = util.get_package_path(name)
+    candidates = [path / "config.cfg"] + sorted(path.glob("*/config.cfg"))
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    raise FileNotFoundError(f"No config.cfg for spaCy model {name!r}")
+
+
+def _listener_upstreams(node) -> set:
+    """Upstream names of every Tok2VecListener / TransformerListener inside a component config."""
+    upstreams = set()
+    if isinstance(node, dict):
+        if "Listener" in str(node.get("@architectures", "")):
+            upstreams.add(node.get("upstream", "*"))
+        for value in node.values():
+            upstreams |= _listener_upstreams(value)
+    return upstreams
+
+
+def ner_components(nlp_config) -> set:
+    """Names of the pipes needed to produce doc.ents: the entity pipes plus the embedders they listen to."""
+    components = nlp_config["components"]
+    pipeline = nlp_config["nlp"]["pipeline"]
+    needed = {name for name in pipeline if components.get(name, {}).get("factory") in ENTITY_FACTORIES}
+    for name in list(needed):
+        for upstream in _listener_upstreams(components[name]):
+            if upstream == "*":
+                needed |= {n for n in pipeline if components.get(n, {}).get("factory") in EMBEDDING_FACTORIES}
+            else:
+                needed.add(upstream)
+    return needed
+
+
+def load_ner_pipeline(name: str):
+    """
+    spacy.load() with only the components NER depends on. Unused pipes are
+    excluded (never loaded), so tagger/parser/lemmatizer cost neither startup
+    time nor per-request latency.
+    """
+    import spacy
+    from spacy import util
+
+    try:
+        nlp_config = util.load_config(_find_config(name))
+        needed = ner_components(nlp_config)
+        exclude = [n for n in nlp_config["nlp"]["pipeline"] if n not in needed]
+        nlp = spacy.load(name, exclude=exclude)
+    except (OSError, KeyError) as e:
+        # Unusual packaging: load everything, then switch off what NER does not use
+        logger.warning("Could not read spaCy config for %s (%s); disabling pipes after load", name, e)
+        nlp = spacy.load(name)
+        needed = {n for n, pipe in nlp.pipeline if type(pipe).__name__ in ("EntityRecognizer", "EntityRuler")}
+        for n, pipe in nlp.pipeline:
+            if set(getattr(pipe, "listening_components", [])) & needed:
+                needed.add(n)
+        exclude = [n for n in nlp.pipe_names if n not in needed]
+        nlp.select_pipes(disable=exclude)
+
+    logger.info("spaCy NER pipeline %s: keeping %s, excluded %s", name, nlp.pipe_names, exclude)
+    return nlp
@@ -0,0 +1,139 @@
+import time
+import random
+import asyncio
+import threading
+
+from opensearchpy import AsyncOpenSearch, OpenSearch
+from opensearchpy.exceptions import ConnectionError, ConnectionTimeout, TransportError
+
+from voice_assistant.utils import config
+from voice_assistant.utils.log import get_logger
+from voice_assistant.utils.metrics import SEARCH_RETRIES
+
+logger = get_logger(__name__)
+
+# === OpenSearch client factory ===
+# One sync and one async client per process, built from config: a sized
+# keep-alive connection pool, a per-request timeout, and retries with
+# exponential backoff done here (the transport's own retries fire immediately,
+# which only hammers a node that is already struggling).
+
+RETRY_STATUSES = (429, 502, 503, 504)
+
+_client = None
+_async_client = None
+_lock = threading.Lock()
+
+
+def _client_kwargs(timeout: float = None, pool_size: int = None, http_compress: bool = None) -> dict:
+    return {
+        "hosts": [config.OPENSEARCH_HOST],
+        "timeout": timeout or config.OPENSEARCH_TIMEOUT,
+        "maxsize": pool_size or config.OPENSEARCH_POOL_SIZE,
+        "max_retries": 0,
+        "http_compress": config.OPENSEARCH_HTTP_COMPRESS if http_compress is None else http_compress,
+    }
+
+
+def create_client(timeout: float = None, pool_size: int = None, http_compress: bool = None) -> OpenSearch:
+    """A new sync client; use get_client() for the shared one."""
+    return OpenSearch(**_client_kwargs(timeout, pool_size, http_compress))
+
+
+def create_async_client(timeout: float = None, pool_size: int = None) -> AsyncOpenSearch:
+    """A new async client; create it inside the event loop that will use it."""
+    return AsyncOpenSearch(**_client_kwargs(timeout, pool_size))
+
+
+def get_client() -> OpenSearch:
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = create_client()
+    return _client
+
+
+def get_async_client() -> AsyncOpenSearch:
+    global _async_client
+    if _async_client is None:
+        _async_client = create_async_client()
+    return _async_client
+
+
+async def init_clients() -> dict:
+    """Create both clients at app startup and report cluster health."""
+    get_client()
+    get_async_client()
+    health = await async_check_health()
+    if health["status"] in ("red", "unreachable"):
+        logger.warning("OpenSearch at %s is %s: %s", config.OPENSEARCH_HOST, health["status"], health.get("error", ""))
+    else:
+        logger.info("OpenSearch at %s is %s", config.OPENSEARCH_HOST, health["status"])
+    return health
+
+
+async def close_clients():
+    global _client, _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+# === Retries ===
+def _retryable(exc: Exception) -> bool:
+    if isinstance(exc, (ConnectionError, ConnectionTimeout)):
+        return True
+    return isinstance(exc, TransportError) and exc.status_code in RETRY_STATUSES
+
+
+def _backoff(attempt: int) -> float:
+    # Exponential with full jitter: 0..base, 0..2*base, 0..4*base, ...
+    return random.uniform(0, config.OPENSEARCH_RETRY_BACKOFF * (2 ** attempt))
+
+
+def with_retries(call, *args, **kwargs):
+    for attempt in range(config.OPENSEARCH_MAX_RETRIES + 1):
+        try:
+            return call(*args, **kwargs)
+        except Exception as e:
+            if attempt == config.OPENSEARCH_MAX_RETRIES or not _retryable(e):
+                raise
+            SEARCH_RETRIES.inc(type(e).__name__)
+            time.sleep(_backoff(attempt))
+
+
+async def async_with_retries(call, *args, **kwargs):
+    for attempt in range(config.OPENSEARCH_MAX_RETRIES + 1):
+        try:
+            return await call(*args, **kwargs)
+        except Exception as e:
+            if attempt == config.OPENSEARCH_MAX_RETRIES or not _retryable(e):
+                raise
+            SEARCH_RETRIES.inc(type(e).__name__)
+            await asyncio.sleep(_backoff(attempt))
+
+
+# === Health ===
+def _health_result(health: dict = None, error: Exception = None) -> dict:
+    if error is not None:
+        return {"status": "unreachable", "error": str(error)}
+    return {"status": health["status"], "nodes": health["number_of_nodes"], "cluster": health["cluster_name"]}
+
+
+def check_health() -> dict:
+    try:
+        return _health_result(get_client().cluster.health(request_timeout=config.OPENSEARCH_HEALTH_TIMEOUT))
+    except Exception as e:
+        return _health_result(error=e)
+
+
+async def async_check_health() -> dict:
+    try:
+        health = await get_async_client().cluster.health(request_timeout=config.OPENSEARCH_HEALTH_TIMEOUT)
+        return _health_result(health)
+    except Exception as e:
+        return _health_result(error=e)
@@ -1,27 +1,159 @@
-import json
-from opensearchpy import OpenSearch
+'''
+Bulk (re)indexer for the workouts catalog.
+
+Every run builds a fresh versioned index (workouts-<timestamp>-<id>) with an
+explicit mapping, streams the documents in through parallel _bulk requests
+with refresh disabled, then atomically points the `workouts` alias at it.
+Searches keep hitting the previous index until the swap, so reindexing has
+no downtime.
 
+    python voice_assistant/search/index_workouts.py
+    python voice_assistant/search/index_workouts.py --data workouts.jsonl --threads 8 --chunk-size 5000 --keep 1
+'''
 import sys
+import json
+import time
+import uuid
+import argparse
 from pathlib import Path
+from opensearchpy import OpenSearch, helpers
+
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(project_root))
-from voice_assistant.utils.config import OPENSEARCH_HOST
+from voice_assistant.utils import config
+from voice_assistant.search.client import create_client, with_retries
+
+INDEX_NAME = "workouts"  # alias the API searches
+DATA_PATH = "voice_assistant/data/database_workouts/workouts.json"
+
+# Exact-match fields are keywords with a lowercase normalizer ("Low Impact" == "low impact");
+# the .text subfield keeps analyzed token matching available. It is only used for
+# filters, so it stores neither norms nor term frequencies: a match then scores the
+# same on every document, and filtering on it cannot change the ranking.
+_KEYWORD = {
+    "type": "keyword",
+    "normalizer": "lowercase_normalizer",
+    "fields": {"text": {"type": "text", "norms": False, "index_options": "docs"}},
+}
+INDEX_SETTINGS = {
+    "analysis": {
+        "normalizer": {
+            "lowercase_normalizer": {"type": "custom", "filter": ["lowercase", "asciifolding"]}
+        }
+    }
+}
+INDEX_MAPPING = {
+    "properties": {
+        "title": {"type": "text", "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}},
+        "type": _KEYWORD,
+        "intensity": _KEYWORD,
+        "instructor": _KEYWORD,
+        "tags": _KEYWORD,
+        "duration": {"type": "integer"},
+    }
+}
+
+
+def iter_documents(path: str):
+    """Stream documents from a JSON array or a JSONL file (one workout per line)."""
+    with open(path) as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+def bulk_actions(index: str, documents):
+    for i, doc in enumerate(documents):
+        yield {"_index": index, "_id": doc.get("id", i), "_source": doc}
+
+
+def create_versioned_index(client: OpenSearch, alias: str, shards: int) -> str:
+    # Millisecond timestamp keeps versions in creation order; the random suffix keeps
+    # two runs in the same millisecond from colliding (create fails if one still does)
+    now = time.time()
+    stamp = f"{time.strftime('%Y%m%d%H%M%S', time.localtime(now))}{int(now * 1000) % 1000:03d}"
+    index = f"{alias}-{stamp}-{uuid.uuid4().hex[:6]}"
+    client.indices.create(index=index, body={
+        "settings": {
+            **INDEX_SETTINGS,
+            "number_of_shards": shards,
+            # No refresh and no replicas while loading; both are restored afterwards
+            "refresh_interval": "-1",
+            "number_of_replicas": 0,
+        },
+        "mappings": INDEX_MAPPING,
+    })
+    return index
+
+
+def load_documents(client: OpenSearch, index: str, documents, threads: int, chunk_size: int):
+    indexed, failed = 0, 0
+    for ok, item in helpers.parallel_bulk(
+        client, bulk_actions(index, documents),
+        thread_count=threads, chunk_size=chunk_size, raise_on_error=False, request_timeout=120,
+    ):
+        if ok:
+            indexed += 1
+        else:
+            failed += 1
+            if failed <= 5:
+                print(f"[WARN] Failed to index: {item}")
+    return indexed, failed
+
+
+def swap_alias(client: OpenSearch, alias: str, index: str) -> list:
+    """Point `alias` at `index` in one atomic _aliases call; returns the indices it used to point at."""
+    actions = [{"add": {"index": index, "alias": alias}}]
+    previous = []
+    if client.indices.exists_alias(name=alias):
+        previous = list(client.indices.get_alias(name=alias))
+        actions = [{"remove": {"index": old, "alias": alias}} for old in previous] + actions
+    elif client.indices.exists(index=alias):
+        # Legacy setup: a concrete index already has the alias name; replace it in the same call
+        actions.append({"remove_index": {"index": alias}})
+    client.indices.update_aliases(body={"actions": actions})
+    return previous
+
+
+def delete_old_versions(client: OpenSearch, alias: str, current: str, keep: int):
+    versions = sorted(name for name in client.indices.get(index=f"{alias}-*") if name != current)
+    for name in versions[:max(len(versions) - keep, 0)]:
+        client.indices.delete(index=name)
+        print(f"[INFO] Deleted old index {name}")
+
 
-INDEX_NAME = "workouts"
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-index workouts into a new versioned index and swap the alias.")
+    parser.add_argument("--data", default=DATA_PATH, help="JSON array or JSONL file")
+    parser.add_argument("--alias", default=INDEX_NAME)
+    parser.add_argument("--threads", type=int, default=4, help="Parallel _bulk requests")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="Documents per _bulk request")
+    parser.add_argument("--shards", type=int, default=1)
+    parser.add_argument("--replicas", type=int, default=1, help="Replicas restored after the load")
+    parser.add_argument("--keep", type=int, default=1, help="Previous index versions to keep for rollback")
+    args = parser.parse_args()
 
-# Connect to OpenSearch
-client = OpenSearch(hosts=[OPENSEARCH_HOST])
+    # Factory client: bulk-sized timeout, a connection per bulk thread, compressed bodies
+    client = create_client(timeout=60, pool_size=max(args.threads, config.OPENSEARCH_POOL_SIZE), http_compress=True)
 
-# Load data
-with open("voice_assistant/data/database_workouts/workouts.json") as f:
-    workouts = json.load(f)
+    start = time.perf_counter()
+    index = create_versioned_index(client, args.alias, args.shards)
+    print(f"[INFO] Created {index}")
 
-# Create index (if doesn't exist)
-if not client.indices.exists(INDEX_NAME):
-    client.indices.create(index=INDEX_NAME)
+    indexed, failed = load_documents(client, index, iter_documents(args.data), args.threads, args.chunk_size)
+    load_seconds = time.perf_counter() - start
+    print(f"[INFO] Indexed {indexed} workouts ({failed} failed) in {load_seconds:.1f}s ({indexed / max(load_seconds, 1e-9):.0f} docs/s)")
+    if failed:
+        client.indices.delete(index=index)
+        sys.exit(f"[ERROR] {failed} documents failed; {index} deleted, alias '{args.alias}' unchanged.")
 
-# Index data
-for i, doc in enumerate(workouts):
-    client.index(index=INDEX_NAME, id=i, body=doc)
+    with_retries(client.indices.put_settings, index=index, body={"index": {"refresh_interval": "1s", "number_of_replicas": args.replicas}})
+    with_retries(client.indices.refresh, index=index)
 
-print(f"Indexed {len(workouts)} workouts.")
+    previous = swap_alias(client, args.alias, index)
+    print(f"[INFO] Alias '{args.alias}' -> {index} (was: {', '.join(previous) or 'none'})")
+    delete_old_versions(client, args.alias, index, args.keep)
+    print(f"Indexed {indexed} workouts in {time.perf_counter() - start:.1f}s.")
@@ -0,0 +1,166 @@
+import re
+import json
+import math
+import threading
+import unicodedata
+
+import numpy as np
+
+from voice_assistant.search.query_builder import FALLBACK_TAG_WEIGHTS, extract_minutes, normalize_entities
+from voice_assistant.search.synonyms import GOAL_TO_TAGS
+from voice_assistant.utils import config
+from voice_assistant.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+KEYWORD_FIELDS = ("type", "intensity", "instructor", "tags")
+# Fields filtered by token match on their .text subfield (see query_builder.match_tokens)
+TEXT_FIELDS = ("instructor", "tags")
+# Lucene BM25 with norms disabled (keyword fields): score = boost * idf * tf / (tf + k1), tf = 1
+BM25_K1 = 1.2
+
+
+def normalize_keyword(value) -> str:
+    """Same as the index's lowercase_normalizer (lowercase + asciifolding)."""
+    folded = unicodedata.normalize("NFKD", str(value)).encode("ascii", "ignore").decode()
+    return folded.lower()
+
+
+def tokenize(value) -> list:
+    """Roughly the standard analyzer behind the .text subfields: lowercase word tokens."""
+    return re.findall(r"\w+", str(value).lower())
+
+
+class LocalWorkoutIndex:
+    """
+    In-memory workouts index with the same filter/boost semantics as
+    query_builder.build_query on the OpenSearch mapping:
+
+    - keyword fields -> inverted index {normalized value: sorted doc ids}
+    - instructor/tags -> also a token index, so "alex" matches "Alex Morgan"
+    - duration -> int column plus a sorted index for range lookups
+    - hard constraints intersect posting lists; only the exact-duration boost
+      and the goal-less tag preferences are scored
+    """
+
+    def __init__(self, docs: list):
+        self.docs = docs
+        self.ids = [str(d.get("id", i)) for i, d in enumerate(docs)]  # same _id as index_workouts.py
+        n = len(docs)
+        self.duration = np.array([int(d["duration"]) if d.get("duration") is not None else -1 for d in docs], dtype=np.int32)
+        self._duration_order = np.argsort(self.duration, kind="stable")
+        self._duration_sorted = self.duration[self._duration_order]
+
+        postings = {field: {} for field in KEYWORD_FIELDS}
+        token_postings = {field: {} for field in TEXT_FIELDS}
+        for doc_id, doc in enumerate(docs):
+            for field in KEYWORD_FIELDS:
+                values = doc.get(field)
+                if values is None:
+                    continue
+                values = set(values if isinstance(values, list) else [values])
+                for value in values:
+                    postings[field].setdefault(normalize_keyword(value), []).append(doc_id)
+                if field in token_postings:
+                    for token in {t for value in values for t in tokenize(value)}:
+                        token_postings[field].setdefault(token, []).append(doc_id)
+        self.postings = {
+            field: {value: np.array(ids, dtype=np.int32) for value, ids in values.items()}
+            for field, values in postings.items()
+        }
+        self.token_postings = {
+            field: {token: np.array(ids, dtype=np.int32) for token, ids in tokens.items()}
+            for field, tokens in token_postings.items()
+        }
+
+        # Goal-less tag preference scores are query independent: precompute them per doc
+        tagged_docs = sum(1 for d in docs if d.get("tags"))
+        self.fallback_tag_scores = np.zeros(n, dtype=np.float64)
+        for tag, weight in FALLBACK_TAG_WEIGHTS.items():
+            ids = self.postings["tags"].get(normalize_keyword(tag))
+            if ids is None:
+                continue
+            idf = math.log(1 + (tagged_docs - len(ids) + 0.5) / (len(ids) + 0.5))
+            self.fallback_tag_scores[ids] += weight * idf / (1 + BM25_K1)
+
+    @classmethod
+    def from_file(cls, path: str) -> "LocalWorkoutIndex":
+        with open(path) as f:
+            if path.endswith(".jsonl"):
+                docs = [json.loads(line) for line in f if line.strip()]
+            else:
+                docs = json.load(f)
+        return cls(docs)
+
+    def _duration_range(self, low: int, high: int) -> np.ndarray:
+        start = np.searchsorted(self._duration_sorted, low, side="left")
+        end = np.searchsorted(self._duration_sorted, high, side="right")
+        return self._duration_order[start:end]
+
+    def _term(self, field: str, value) -> np.ndarray:
+        return self.postings[field].get(normalize_keyword(value), np.empty(0, dtype=np.int32))
+
+    def _match(self, field: str, text) -> np.ndarray:
+        """Docs containing every token of `text` in `field` (match with operator "and")."""
+        ids = None
+        for token in tokenize(text):
+            hits = self.token_postings[field].get(token, np.empty(0, dtype=np.int32))
+            ids = hits if ids is None else np.intersect1d(ids, hits, assume_unique=True)
+        return ids if ids is not None else np.empty(0, dtype=np.int32)
+
+    def rank(self, entities: dict, top_k: int = 10):
+        """(doc positions, scores) of the top_k matches, best first."""
+        entities = normalize_entities(entities)
+        candidates = None  # None = every document
+
+        def restrict(ids):
+            nonlocal candidates
+            candidates = ids if candidates is None else np.intersect1d(candidates, ids, assume_unique=True)
+
+        minutes = extract_minutes(entities.get("duration", ""))
+        if minutes:
+            restrict(np.sort(self._duration_range(max(minutes - 5, 5), minutes + 5)))
+        if "instructor" in entities:
+            restrict(self._match("instructor", entities["instructor"]))
+        if "intensity" in entities:
+            restrict(self._term("intensity", entities["intensity"]))
+        if "workout_type" in entities:
+            restrict(self._term("type", entities["workout_type"]))
+        if "goal" in entities:
+            for tag in GOAL_TO_TAGS.get(entities["goal"].lower(), [entities["goal"]]):
+                restrict(self._match("tags", tag))
+
+        if candidates is None:
+            candidates = np.arange(len(self.docs), dtype=np.int32)
+        if len(candidates) == 0:
+            return candidates, np.zeros(0)
+
+        scores = np.zeros(len(candidates), dtype=np.float64)
+        if minutes:
+            scores += 10.0 * (self.duration[candidates] == minutes)
+        if "goal" not in entities:
+            scores += self.fallback_tag_scores[candidates]
+
+        # Highest score first; ties keep index order, like a single-shard OpenSearch index
+        order = np.lexsort((candidates, -scores))[:top_k]
+        return candidates[order], scores[order]
+
+    def search(self, entities: dict, top_k: int = 10) -> list:
+        positions, scores = self.rank(entities, top_k)
+        return [{**self.docs[p], "score": round(float(s), 2)} for p, s in zip(positions, scores)]
+
+
+_local_index = None
+_local_lock = threading.Lock()
+
+def get_local_index() -> LocalWorkoutIndex:
+    global _local_index
+    if _local_index is None:
+        with _local_lock:
+            if _local_index is None:
+                _local_index = LocalWorkoutIndex.from_file(config.LOCAL_CATALOG_PATH)
+                logger.info("Loaded local workout index: %d docs from %s", len(_local_index.docs), config.LOCAL_CATALOG_PATH)
+    return _local_index
+
+def local_search_workouts(intent: str, entities: dict, top_k: int = 10) -> list:
+    return get_local_index().search(entities, top_k)
@@ -0,0 +1,93 @@
+import re
+from collections import Counter
+
+from word2number import w2n
+
+from voice_assistant.search.synonyms import WORKOUT_TYPE_SYNONYMS, INTENSITY_SYNONYMS, GOAL_SYNONYMS, GOAL_TO_TAGS
+
+
+# === Utilities ===
+def extract_minutes(time_str):
+    """Convert textual or numeric time expression to integer minutes."""
+    if not time_str:
+        return None
+    match = re.search(r"\d+", time_str)
+    if match:
+        return int(match.group())
+    try:
+        return w2n.word_to_num(time_str)
+    except Exception:
+        return None
+
+def normalize_entities(entities):
+    """Normalize synonyms for consistent filtering."""
+    if "workout_type" in entities:
+        raw = entities["workout_type"].lower()
+        entities["workout_type"] = WORKOUT_TYPE_SYNONYMS.get(raw, raw)
+
+    if "intensity" in entities:
+        raw = entities["intensity"].lower()
+        entities["intensity"] = INTENSITY_SYNONYMS.get(raw, raw)
+
+    if "goal" in entities:
+        raw = entities["goal"].lower()
+        entities["goal"] = GOAL_SYNONYMS.get(raw, raw)
+
+    return entities
+
+
+# === Query construction ===
+# Hard constraints (duration window, instructor, type, intensity, goal tags) go
+# in `filter`: they are cached by OpenSearch and not scored. Type and intensity
+# are normalized to catalog values above, so they are exact keyword terms.
+# Instructor and goal tags come straight from the utterance ("Alex" for
+# "Alex Morgan"), so they match tokens on the analyzed .text subfield.
+FALLBACK_TAG_WEIGHTS = Counter(tag for tags in GOAL_TO_TAGS.values() for tag in tags)
+
+
+def match_tokens(field: str, text) -> dict:
+    """Every token of `text` must appear in the field ("alex" matches "Alex Morgan")."""
+    return {"match": {f"{field}.text": {"query": text, "operator": "and"}}}
+
+
+def build_query(entities: dict, top_k: int = 10) -> dict:
+    entities = normalize_entities(entities)
+    filters = []
+    should_clauses = []
+
+    # Duration: ±5 min tolerance window, exact match ranks first
+    minutes = extract_minutes(entities.get("duration", ""))
+    if minutes:
+        filters.append({"range": {"duration": {"gte": max(minutes - 5, 5), "lte": minutes + 5}}})
+        should_clauses.append({"term": {"duration": {"value": minutes, "boost": 10}}})
+
+    if "instructor" in entities:
+        filters.append(match_tokens("instructor", entities["instructor"]))
+
+    if "intensity" in entities:
+        filters.append({"term": {"intensity": entities["intensity"]}})
+
+    if "workout_type" in entities:
+        filters.append({"term": {"type": entities["workout_type"]}})
+
+    # Goal: every tag it expands to is required
+    if "goal" in entities:
+        for tag in GOAL_TO_TAGS.get(entities["goal"].lower(), [entities["goal"]]):
+            filters.append(match_tokens("tags", tag))
+    else:
+        # No goal: prefer classes with popular goal tags. Tags shared by several
+        # goals are weighted by how often they appear instead of repeated clauses.
+        for tag, count in FALLBACK_TAG_WEIGHTS.items():
+            should_clauses.append({"term": {"tags": {"value": tag, "boost": count}}})
+
+    return {
+        "size": top_k,
+        "track_total_hits": False,  # only the top hits are used
+        "query": {
+            "bool": {
+                "filter": filters,
+                "should": should_clauses,
+                "minimum_should_match": 0
+            }
+        }
+    }
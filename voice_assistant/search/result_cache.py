@@ -0,0 +1,79 @@
+import time
+import threading
+
+from voice_assistant.search.query_builder import extract_minutes, normalize_entities
+from voice_assistant.utils.cache import TTLCache
+from voice_assistant.utils.metrics import SEARCH_CACHE
+
+# Entities that change the query; anything else (mood, time_of_day, ...) does not affect results
+QUERY_ENTITIES = ("workout_type", "intensity", "instructor", "goal")
+
+
+def canonical_key(entities: dict, top_k: int) -> tuple:
+    """("yoga", "low impact", 20, "alex", None, 10) for "20 min gentle Yoga with Alex"."""
+    entities = normalize_entities(dict(entities))
+    values = tuple(str(entities[k]).strip().lower() if entities.get(k) else None for k in QUERY_ENTITIES)
+    return values[:2] + (extract_minutes(entities.get("duration", "")),) + values[2:] + (top_k,)
+
+
+class SearchResultCache:
+    """
+    Ranked hits keyed by the canonical entity tuple and top_k.
+
+    Entries belong to one index version (the concrete index behind the alias,
+    see index_workouts.py); when a reindex swaps the alias the whole cache is
+    dropped. The version is re-read at most every `version_check_seconds`, by
+    one caller at a time (claim_version_check / finish_version_check); if the
+    lookup fails the last known version is kept until the next check.
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = None, version_check_seconds: float = 5.0):
+        self.cache = TTLCache(max_entries, ttl_seconds)
+        self.version_check_seconds = version_check_seconds
+        self.version = None
+        self.invalidations = 0
+        self._checked_at = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def needs_version_check(self) -> bool:
+        return self._checked_at is None or time.monotonic() - self._checked_at >= self.version_check_seconds
+
+    def claim_version_check(self) -> bool:
+        """True for the single caller that should look the version up now; others keep the current one."""
+        return self.needs_version_check() and self._refresh_lock.acquire(blocking=False)
+
+    def finish_version_check(self, version=None):
+        """Release the claim; version=None (lookup failed) keeps the last known version."""
+        try:
+            if version is not None:
+                self.set_version(version)
+            else:
+                with self._lock:
+                    self._checked_at = time.monotonic()
+        finally:
+            self._refresh_lock.release()
+
+    def set_version(self, version):
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if version != self.version:
+                if self.version is not None:
+                    self.invalidations += 1
+                self.version = version
+                self.cache.clear()
+
+    def get(self, entities: dict, top_k: int):
+        results = self.cache.get(canonical_key(entities, top_k))
+        SEARCH_CACHE.inc("hit" if results is not None else "miss")
+        # Copies, so a caller editing a hit cannot corrupt the cached ranking
+        return [dict(hit) for hit in results] if results is not None else None
+
+    def put(self, entities: dict, top_k: int, results: list):
+        self.cache.put(canonical_key(entities, top_k), [dict(hit) for hit in results])
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return dict(self.cache.stats(), version=self.version, invalidations=self.invalidations)
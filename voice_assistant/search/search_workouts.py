@@ -1,167 +1,22 @@
-import re
-from opensearchpy import OpenSearch
-from voice_assistant.utils.config import OPENSEARCH_HOST
-from word2number import w2n
+from opensearchpy import NotFoundError
+from voice_assistant.utils import config
+from voice_assistant.utils.log import get_logger
+from voice_assistant.utils.metrics import timed
+from voice_assistant.search.client import async_with_retries, get_async_client, get_client, with_retries
+from voice_assistant.search.query_builder import build_query
+from voice_assistant.search.result_cache import SearchResultCache
 
-INDEX_NAME = "workouts"
-client = OpenSearch(hosts=[OPENSEARCH_HOST])
-
-# === Synonym Normalization Map ===
-WORKOUT_TYPE_SYNONYMS = {
-    "bike": "cycling", "ride": "cycling", "spin": "cycling", "cycling": "cycling",
-    "run": "running", "jog": "running", "walk": "walking",
-    "stretch": "stretching", "strength training": "strength",
-    "hiit": "hiit", "yoga": "yoga", "meditation": "meditation", "pilates": "pilates"
-}
-INTENSITY_SYNONYMS = {
-    "easy": "low impact",
-    "light": "low impact",
-    "beginner": "low impact",
-    "gentle": "low impact",
-    "moderate": "moderate",
-    "intermediate": "moderate",
-    "medium intensity": "moderate",
-    "high": "high intensity",
-    "challenging": "high intensity",
-    "advanced": "high intensity",
-    "tough": "high intensity",
-    "super intense": "high intensity",
-    "killer": "high intensity",
-    "hardcore": "high intensity",
-}
-# === Goal → Tag expansion ===
-GOAL_TO_TAGS = {
-    "weight loss": ["weight loss", "cardio"],
-    "relax": ["relaxing", "mood"],
-    "flexibility": ["flexibility", "yoga"],
-    "strength": ["strength", "core"],
-    "endurance": ["endurance", "running", "cycling"],
-    "mood": ["mood", "relaxing"]
-}
+logger = get_logger(__name__)
 
+INDEX_NAME = "workouts"
+# Clients come from search/client.py (created at app startup, or on first use)
+result_cache = SearchResultCache(
+    config.SEARCH_CACHE_SIZE, config.SEARCH_CACHE_TTL_SECONDS, config.SEARCH_CACHE_VERSION_CHECK_SECONDS
+) if config.SEARCH_CACHE_SIZE > 0 else None
 
-# === Utilities ===
-def extract_minutes(time_str):
-    """Convert textual or numeric time expression to integer minutes."""
-    if not time_str:
-        return None
-    match = re.search(r"\d+", time_str)
-    if match:
-        return int(match.group())
-    try:
-        return w2n.word_to_num(time_str)
-    except Exception:
-        return None
-
-def normalize_entities(entities):
-    """Normalize synonyms for consistent filtering."""
-    if "workout_type" in entities:
-        raw = entities["workout_type"].lower()
-        entities["workout_type"] = WORKOUT_TYPE_SYNONYMS.get(raw, raw)
-
-    if "intensity" in entities:
-        raw = entities["intensity"].lower()
-        entities["intensity"] = INTENSITY_SYNONYMS.get(raw, raw)
 
-    return entities
-    
 # === Main Search Logic ===
-def search_workouts(intent: str, entities: dict, top_k: int = 10):
-    entities = normalize_entities(entities)
-    must_clauses = []
-    should_clauses = []
-
-    # Duration filtering with tolerance range ±5 min
-    minutes = extract_minutes(entities.get("duration", ""))
-    if minutes:
-        # Range match to allow a tolerance window
-        must_clauses.append({
-            "range": {
-                "duration": {
-                    "gte": max(minutes - 5, 5),
-                    "lte": minutes + 5
-                }
-            }
-        })
-
-        # Exact match as additional scoring boost
-        should_clauses.append({
-            "match": {
-                "duration": {
-                    "query": minutes,
-                    "boost": 10  # Boost exact time match to top
-                }
-            }
-        })
-
-    if "instructor" in entities:
-        must_clauses.append({
-            "match": {
-                "instructor": {
-                    "query": entities["instructor"],
-                    "boost": 7
-                }
-            }
-        })
-
-    if "intensity" in entities:
-        must_clauses.append({
-            "match": {
-                "intensity": {
-                    "query": entities["intensity"],
-                    "boost": 2.5
-                }
-            }
-        })
-
-    if "workout_type" in entities:
-        must_clauses.append({
-            "match": {
-                "type": {
-                    "query": entities["workout_type"],
-                    "boost": 6
-                }
-            }
-        })
-
-    # Expand goal into relevant tags
-    if "goal" in entities:
-        tag_list = GOAL_TO_TAGS.get(entities["goal"].lower(), [entities["goal"]])
-        for tag in tag_list:
-            must_clauses.append({
-                "match": {
-                    "tags": {
-                        "query": tag,
-                        "boost": 2
-                    }
-                }
-            })
-    else:
-        # Fallback: widen tag relevance if no goal is provided
-        for tag_list in GOAL_TO_TAGS.values():
-            for tag in tag_list:
-                should_clauses.append({
-                    "match": {
-                        "tags": {
-                            "query": tag,
-                            "boost": 1
-                        }
-                    }
-                })
-
-    query = {
-        "size": top_k,
-        "query": {
-            "bool": {
-                "must": must_clauses,
-                "should": should_clauses,
-                "minimum_should_match": 0
-            }
-        }
-    }
-
-    response = client.search(index=INDEX_NAME, body=query)
-
+def format_hits(response: dict) -> list:
     # Return full metadata + score for visibility
     return [
         {
@@ -170,3 +25,97 @@ def search_workouts(intent: str, entities: dict, top_k: int = 10):
         }
         for hit in response["hits"]["hits"]
     ]
+
+def _local_search(intent: str, entities: dict, top_k: int):
+    from voice_assistant.search.local_engine import local_search_workouts
+
+    with timed("local_search"):
+        return local_search_workouts(intent, entities, top_k)
+
+def index_version() -> str:
+    """Concrete index behind the alias; changes on every reindex (see index_workouts.py)."""
+    if config.SEARCH_BACKEND == "local":
+        return "local"
+    try:
+        return ",".join(sorted(with_retries(get_client().indices.get_alias, name=INDEX_NAME)))
+    except NotFoundError:
+        # Legacy concrete index without an alias: its uuid changes when it is recreated
+        info = with_retries(get_client().indices.get, index=INDEX_NAME)
+        return info[INDEX_NAME]["settings"]["index"]["uuid"]
+
+def _refresh_version():
+    # One caller refreshes; a failed lookup keeps the last known version
+    if not result_cache.claim_version_check():
+        return
+    version = None
+    try:
+        version = index_version()
+    except Exception as e:
+        logger.warning("Index version check failed, keeping %s: %s", result_cache.version, e)
+    finally:
+        result_cache.finish_version_check(version)
+
+def _search_uncached(intent: str, entities: dict, top_k: int):
+    if config.SEARCH_BACKEND == "local":
+        return _local_search(intent, entities, top_k)
+    with timed("query_build"):
+        query = build_query(entities, top_k)
+    with timed("opensearch"):
+        response = with_retries(get_client().search, index=INDEX_NAME, body=query)
+    return format_hits(response)
+
+def search_workouts(intent: str, entities: dict, top_k: int = 10):
+    if result_cache is None:
+        return _search_uncached(intent, entities, top_k)
+    _refresh_version()
+    if result_cache.version is None:
+        # No version known yet (lookups failing): results cannot be tied to an index
+        return _search_uncached(intent, entities, top_k)
+    results = result_cache.get(entities, top_k)
+    if results is None:
+        results = _search_uncached(intent, dict(entities), top_k)
+        result_cache.put(entities, top_k, results)
+    return results
+
+async def async_index_version() -> str:
+    if config.SEARCH_BACKEND == "local":
+        return "local"
+    try:
+        return ",".join(sorted(await async_with_retries(get_async_client().indices.get_alias, name=INDEX_NAME)))
+    except NotFoundError:
+        info = await async_with_retries(get_async_client().indices.get, index=INDEX_NAME)
+        return info[INDEX_NAME]["settings"]["index"]["uuid"]
+
+async def _async_refresh_version():
+    if not result_cache.claim_version_check():
+        return
+    version = None
+    try:
+        version = await async_index_version()
+    except Exception as e:
+        logger.warning("Index version check failed, keeping %s: %s", result_cache.version, e)
+    finally:
+        result_cache.finish_version_check(version)
+
+async def _async_search_uncached(intent: str, entities: dict, top_k: int):
+    if config.SEARCH_BACKEND == "local":
+        # Sub-millisecond, so it runs inline on the loop
+        return _local_search(intent, entities, top_k)
+    with timed("query_build"):
+        query = build_query(entities, top_k)
+    with timed("opensearch"):
+        response = await async_with_retries(get_async_client().search, index=INDEX_NAME, body=query)
+    return format_hits(response)
+
+async def async_search_workouts(intent: str, entities: dict, top_k: int = 10):
+    """Non-blocking variant of search_workouts for the API event loop."""
+    if result_cache is None:
+        return await _async_search_uncached(intent, entities, top_k)
+    await _async_refresh_version()
+    if result_cache.version is None:
+        return await _async_search_uncached(intent, entities, top_k)
+    results = result_cache.get(entities, top_k)
+    if results is None:
+        results = await _async_search_uncached(intent, dict(entities), top_k)
+        result_cache.put(entities, top_k, results)
+    return results
@@ -0,0 +1,55 @@
+# Vocabulary shared by the query builder and the NLU gazetteer; kept free of
+# heavy imports so the NLU side can use it without pulling in the OpenSearch client.
+
+# === Synonym Normalization Map ===
+# Keys are every surface form the NLU gazetteer recognizes; values are catalog types.
+WORKOUT_TYPE_SYNONYMS = {
+    "bike": "cycling", "ride": "cycling", "spin": "cycling", "cycling": "cycling",
+    "bike ride": "cycling", "riding": "cycling", "bicycle": "cycling", "spinning": "cycling",
+    "run": "running", "jog": "running", "walk": "walking",
+    "running": "running", "jogging": "running", "walking": "walking",
+    "stretch": "stretching", "stretching": "stretching",
+    "strength training": "strength", "strength": "strength", "lift": "strength", "lifting": "strength",
+    "weightlifting": "strength", "resistance training": "strength",
+    "hiit": "hiit", "high intensity interval training": "hiit",
+    "yoga": "yoga", "vinyasa": "yoga", "restorative yoga": "yoga",
+    "meditation": "meditation", "pilates": "pilates"
+}
+INTENSITY_SYNONYMS = {
+    "easy": "low impact",
+    "low effort": "low impact",
+    "light": "low impact",
+    "beginner": "low impact",
+    "gentle": "low impact",
+    "moderate": "moderate",
+    "intermediate": "moderate",
+    "medium intensity": "moderate",
+    "high": "high intensity",
+    "challenging": "high intensity",
+    "advanced": "high intensity",
+    "tough": "high intensity",
+    "super intense": "high intensity",
+    "killer": "high intensity",
+    "hardcore": "high intensity",
+}
+# === Goal → Tag expansion ===
+GOAL_TO_TAGS = {
+    "weight loss": ["weight loss", "cardio"],
+    "relax": ["relaxing", "mood"],
+    "flexibility": ["flexibility", "yoga"],
+    "strength": ["strength", "core"],
+    "endurance": ["endurance", "running", "cycling"],
+    "mood": ["mood", "relaxing"]
+}
+# Goal phrases the NLU gazetteer recognizes → GOAL_TO_TAGS keys
+GOAL_SYNONYMS = {
+    "lose weight": "weight loss", "drop fat": "weight loss", "burn calories": "weight loss",
+    "slim down": "weight loss", "fat burn": "weight loss",
+    "build muscle": "strength", "gain muscle": "strength", "get stronger": "strength",
+    "tone up": "strength", "tone body": "strength", "get toned": "strength", "look defined": "strength",
+    "mobility": "flexibility",
+    "de-stress": "relax", "reduce anxiety": "relax", "calm mind": "relax", "stress relief": "relax",
+    "clear my mind": "relax", "mental clarity": "relax",
+    "gain endurance": "endurance", "build stamina": "endurance",
+    "boost energy": "mood", "energy boost": "mood", "wake up": "mood", "feel better": "mood",
+}
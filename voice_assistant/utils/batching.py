@@ -0,0 +1,134 @@
+import time
+import queue
+import asyncio
+import threading
+from collections import Counter
+from concurrent.futures import Future
+
+
+class BatchQueueFull(Exception):
+    """Raised when a micro-batcher's request queue is full (backpressure signal)."""
+
+
+class MicroBatcher:
+    """
+    Background thread that coalesces single requests into batches.
+
+    Callers `submit()` one item and get a Future back. The worker waits for the
+    first request, then keeps collecting until either `max_batch_size` items are
+    pending or `max_wait_ms` has passed, and hands the whole batch to
+    `process_batch()`, which must return one result per item in order. The queue
+    is bounded by `max_queue`; when it is full `submit()` raises `queue_full_error`
+    instead of letting latency grow without limit.
+
+    Subclasses implement `process_batch()` and may override `setup()` to load
+    models on `start()`.
+    """
+
+    name = "batcher"
+    queue_full_error = BatchQueueFull
+
+    def __init__(self, max_batch_size: int, max_wait_ms: float, max_queue: int):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._stop = threading.Event()
+        self.batch_sizes = Counter()
+        self.rejected = 0
+
+    def setup(self):
+        pass
+
+    def process_batch(self, items: list) -> list:
+        raise NotImplementedError
+
+    # === Lifecycle ===
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return self
+        self.setup()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        # Fail whatever is still queued so no caller waits forever
+        while True:
+            try:
+                _, future = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError(f"{self.name} stopped"))
+
+    # === Submission ===
+    def submit(self, item, timeout: float = 0) -> Future:
+        """Queue one item. Waits up to `timeout` seconds for a free slot."""
+        future = Future()
+        try:
+            self._queue.put((item, future), block=timeout > 0, timeout=timeout or None)
+        except queue.Full:
+            self.rejected += 1
+            raise self.queue_full_error(f"{self.name} queue is full ({self._queue.maxsize} pending)")
+        return future
+
+    async def submit_async(self, item):
+        return await asyncio.wrap_future(self.submit(item))
+
+    # === Batching loop ===
+    def _collect_batch(self) -> list:
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not self._stop.is_set():
+            # Drop requests whose caller gave up (e.g. a cancelled submit_async);
+            # the rest are marked running so they can no longer be cancelled.
+            batch = [(item, future) for item, future in self._collect_batch() if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            items, futures = zip(*batch)
+            try:
+                results = self.process_batch(list(items))
+                if len(results) != len(items):
+                    raise RuntimeError(f"{self.name}: process_batch returned {len(results)} results for {len(items)} items")
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            self.batch_sizes[len(batch)] += 1
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        batches = sum(self.batch_sizes.values())
+        items = sum(size * count for size, count in self.batch_sizes.items())
+        return {
+            "queued": self._queue.qsize(),
+            "batches": batches,
+            "items": items,
+            "mean_batch_size": round(items / batches, 2) if batches else 0.0,
+            "batch_size_counts": dict(sorted(self.batch_sizes.items())),
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,80 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+
+# === Bounded LRU cache with optional TTL ===
+
+class TTLCache:
+    """
+    Thread-safe LRU cache holding at most `max_entries` items, each expiring
+    `ttl_seconds` after it was stored (None = never). Expired entries are
+    dropped lazily on lookup and evicted first by the LRU order anyway.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+def path_fingerprint(paths) -> tuple:
+    """
+    (path, newest mtime) for each path and its direct children. Saving a model
+    rewrites its files, so the fingerprint changes whenever a model dir does.
+    """
+    fingerprint = []
+    for path in paths:
+        if not path or not os.path.exists(path):
+            continue
+        newest = os.stat(path).st_mtime_ns
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    newest = max(newest, entry.stat().st_mtime_ns)
+        fingerprint.append((path, newest))
+    return tuple(fingerprint)
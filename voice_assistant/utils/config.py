@@ -6,3 +6,83 @@ load_dotenv()
 OPENSEARCH_HOST = os.getenv("OPENSEARCH_HOST")
 MODEL_NAME = os.getenv("MODEL_NAME")
 SPACY_MODEL = os.getenv("SPACY_MODEL")
+# DEBUG, INFO, WARNING, ERROR or OFF
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
+# === Search ===
+OPENSEARCH_TIMEOUT = float(os.getenv("OPENSEARCH_TIMEOUT", "2"))              # seconds per request
+OPENSEARCH_POOL_SIZE = int(os.getenv("OPENSEARCH_POOL_SIZE", "32"))           # keep-alive connections per node
+OPENSEARCH_MAX_RETRIES = int(os.getenv("OPENSEARCH_MAX_RETRIES", "2"))
+OPENSEARCH_RETRY_BACKOFF = float(os.getenv("OPENSEARCH_RETRY_BACKOFF", "0.05"))  # base seconds, doubled per attempt
+OPENSEARCH_HEALTH_TIMEOUT = float(os.getenv("OPENSEARCH_HEALTH_TIMEOUT", "1"))
+OPENSEARCH_HTTP_COMPRESS = os.getenv("OPENSEARCH_HTTP_COMPRESS", "0") == "1"
+# "opensearch" (cluster at OPENSEARCH_HOST) or "local" (in-process index over LOCAL_CATALOG_PATH)
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "opensearch")
+LOCAL_CATALOG_PATH = os.getenv(
+    "LOCAL_CATALOG_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "data", "database_workouts", "workouts.json"),
+)
+# Search result cache; SEARCH_CACHE_SIZE=0 disables it
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "2048"))
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "300")) or None
+# How often the alias -> index version is re-read to detect a reindex
+SEARCH_CACHE_VERSION_CHECK_SECONDS = float(os.getenv("SEARCH_CACHE_VERSION_CHECK_SECONDS", "5"))
+
+# === ASR ===
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+ASR_CHUNK_MS = int(os.getenv("ASR_CHUNK_MS", "100"))
+ASR_PARTIAL_INTERVAL_MS = int(os.getenv("ASR_PARTIAL_INTERVAL_MS", "500"))
+ASR_PARTIAL_WINDOW_MS = int(os.getenv("ASR_PARTIAL_WINDOW_MS", "8000"))  # partials decode only the latest audio
+ASR_MAX_SECONDS = float(os.getenv("ASR_MAX_SECONDS", "15"))
+VAD_THRESHOLD_DB = float(os.getenv("VAD_THRESHOLD_DB", "-45"))
+VAD_SILENCE_MS = int(os.getenv("VAD_SILENCE_MS", "600"))
+ASR_MAX_BATCH_SIZE = int(os.getenv("ASR_MAX_BATCH_SIZE", "8"))
+ASR_MAX_WAIT_MS = float(os.getenv("ASR_MAX_WAIT_MS", "20"))
+ASR_QUEUE_SIZE = int(os.getenv("ASR_QUEUE_SIZE", "64"))
+# Backend: "whisper" (fp32), "whisper-int8" (dynamic int8, CPU) or "faster-whisper" (CTranslate2)
+ASR_BACKEND = os.getenv("ASR_BACKEND", "whisper")
+ASR_DEVICE = os.getenv("ASR_DEVICE", "cpu")
+ASR_COMPUTE_TYPE = os.getenv("ASR_COMPUTE_TYPE", "int8")
+ASR_LANGUAGE = os.getenv("ASR_LANGUAGE", "en") or None
+ASR_BEAM_SIZE = int(os.getenv("ASR_BEAM_SIZE")) if os.getenv("ASR_BEAM_SIZE") else None
+# Temperature fallback schedule, tried in order when decoding fails quality checks
+ASR_TEMPERATURES = tuple(float(t) for t in os.getenv("ASR_TEMPERATURES", "0.0,0.2,0.4,0.6,0.8,1.0").split(","))
+
+# === API ===
+NLU_WORKERS = int(os.getenv("NLU_WORKERS", "4"))
+NLU_MAX_PENDING = int(os.getenv("NLU_MAX_PENDING", "64"))
+
+# === NLU ===
+# "pipeline" (DistilBERT intent + spaCy NER) or "joint" (one encoder, both heads)
+NLU_MODE = os.getenv("NLU_MODE", "pipeline")
+JOINT_MODEL_DIR = os.getenv(
+    "JOINT_MODEL_DIR", os.path.join(os.path.dirname(__file__), "..", "models", "joint_model")
+)
+# Answer simple, fully covered queries ("30 min yoga with Alex") from the gazetteer
+NLU_FAST_PATH = os.getenv("NLU_FAST_PATH", "1") == "1"
+# Parsed-utterance cache; NLU_CACHE_SIZE=0 disables it
+NLU_CACHE_SIZE = int(os.getenv("NLU_CACHE_SIZE", "4096"))
+NLU_CACHE_TTL_SECONDS = float(os.getenv("NLU_CACHE_TTL_SECONDS", "3600")) or None
+# Fine-tuned intent model (or a distilled student from distill_intent_classifier.py)
+INTENT_MODEL_DIR = os.getenv("INTENT_MODEL_DIR")
+# Intent backend: "torch" (HF pipeline) or "onnx" (ONNX Runtime, see export_intent_onnx.py)
+INTENT_BACKEND = os.getenv("INTENT_BACKEND", "torch")
+INTENT_ONNX_PATH = os.getenv(
+    "INTENT_ONNX_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "models", "intent_model", "onnx", "model.int8.onnx"),
+)
+INTENT_ONNX_THREADS = int(os.getenv("INTENT_ONNX_THREADS", "0"))
+INTENT_MAX_LENGTH = int(os.getenv("INTENT_MAX_LENGTH", "64"))
+# Calibration: empty = use models/intent_model/calibration.json (calibrate_intent.py), else 1.0
+INTENT_TEMPERATURE = float(os.getenv("INTENT_TEMPERATURE")) if os.getenv("INTENT_TEMPERATURE") else None
+# Below this calibrated confidence the request is routed to FALLBACK_INTENT
+INTENT_CONFIDENCE_THRESHOLD = float(os.getenv("INTENT_CONFIDENCE_THRESHOLD", "0.6"))
+FALLBACK_INTENT = os.getenv("FALLBACK_INTENT", "fallback")
+# Intents that need entities (and search); others skip NER entirely
+ENTITY_INTENTS = tuple(os.getenv("ENTITY_INTENTS", "search_class").split(","))
+# Coalesce concurrent intent requests into batches (used by the API). Opt-in:
+# only NLU_WORKERS requests are in flight at once, so it pays off with many workers
+INTENT_BATCHING = os.getenv("INTENT_BATCHING", "0") == "1"
+INTENT_MAX_BATCH_SIZE = int(os.getenv("INTENT_MAX_BATCH_SIZE", "16"))  # capped at NLU_WORKERS
+INTENT_MAX_WAIT_MS = float(os.getenv("INTENT_MAX_WAIT_MS", "5"))
+INTENT_QUEUE_SIZE = int(os.getenv("INTENT_QUEUE_SIZE", "256"))
@@ -0,0 +1,27 @@
+import logging
+
+from voice_assistant.utils import config
+
+# All project loggers hang off this one so LOG_LEVEL controls them together
+ROOT_LOGGER = "voice_assistant"
+_configured = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Return a project logger. LOG_LEVEL=DEBUG shows per-request detail,
+    INFO (default) only model loading and startup, OFF silences everything.
+    """
+    global _configured
+    if not _configured:
+        root = logging.getLogger(ROOT_LOGGER)
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("[%(levelname)s] %(name)s: %(message)s"))
+        root.addHandler(handler)
+        level = config.LOG_LEVEL.upper()
+        root.setLevel(logging.CRITICAL + 1 if level == "OFF" else level)
+        root.propagate = False
+        _configured = True
+    if not name.startswith(ROOT_LOGGER):
+        name = f"{ROOT_LOGGER}.{name.split('.')[-1]}"
+    return logging.getLogger(name)
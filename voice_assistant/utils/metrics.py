@@ -0,0 +1,137 @@
+import time
+import threading
+import contextvars
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# === Minimal Prometheus-compatible metrics ===
+# Counters and histograms keep their state in plain dicts under one lock, and
+# render() emits the Prometheus text exposition format for the /metrics endpoint.
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry = []
+_lock = threading.Lock()
+
+
+def _format_labels(labelnames, values, extra=None) -> str:
+    pairs = list(zip(labelnames, values)) + list(extra or [])
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"') for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        _registry.append(self)
+
+    def inc(self, *labels, amount: float = 1.0):
+        with _lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}  # labels -> [bucket counts..., +Inf count, sum]
+        _registry.append(self)
+
+    def observe(self, value: float, *labels):
+        index = bisect_left(self.buckets, value)
+        with _lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                cumulative += count
+                le = [("le", bound if bound == "+Inf" else repr(float(bound)))]
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {series[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+def render() -> str:
+    with _lock:
+        lines = [line for metric in _registry for line in metric.render()]
+    return "\n".join(lines) + "\n"
+
+
+# === Pipeline metrics ===
+STAGE_SECONDS = Histogram(
+    "voice_stage_seconds", "Wall time per pipeline stage", ["stage"]
+)
+REQUEST_SECONDS = Histogram(
+    "voice_request_seconds", "End-to-end request latency", ["endpoint"]
+)
+REQUESTS = Counter("voice_requests_total", "Requests handled", ["endpoint", "status"])
+ERRORS = Counter("voice_errors_total", "Errors raised inside a pipeline stage", ["stage"])
+INTENT_ROUTES = Counter("nlu_intent_routes_total", "Classified utterances by route (entities, no_entities, fallback)", ["route"])
+SEARCH_RETRIES = Counter("search_retries_total", "OpenSearch requests retried after a transient error", ["error"])
+SEARCH_CACHE = Counter("search_cache_total", "Search result cache lookups", ["result"])
+NLU_CACHE = Counter("nlu_cache_total", "Parsed-utterance cache lookups", ["result"])
+NLU_FAST_PATH = Counter("nlu_fast_path_total", "Utterances checked by the gazetteer fast path", ["result"])
+
+
+# === Per-request tracing ===
+# The active request's stage timings; copied into worker threads by run_cpu.
+current_trace = contextvars.ContextVar("current_trace", default=None)
+
+
+class Trace:
+    """Collects stage timings (ms) for one request."""
+
+    def __init__(self):
+        self.timings_ms = {}
+        self._token = None
+
+    def __enter__(self):
+        self._token = current_trace.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        current_trace.reset(self._token)
+
+    def record(self, stage: str, seconds: float):
+        self.timings_ms[stage] = round(self.timings_ms.get(stage, 0.0) + seconds * 1000, 2)
+
+
+@contextmanager
+def timed(stage: str):
+    """Time a block into the stage histogram and the active request trace, if any."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        ERRORS.inc(stage)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_SECONDS.observe(elapsed, stage)
+        trace = current_trace.get()
+        if trace is not None:
+            trace.record(stage, elapsed)
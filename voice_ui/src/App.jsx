@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { useRef, useState } from "react";
 import axios from "axios";
 import "./App.css";
 
@@ -37,6 +37,47 @@ export default function App() {
   };
 
   const [searchTime, setSearchTime] = useState(null);
+  const [stageTimings, setStageTimings] = useState(null);
+  const [recording, setRecording] = useState(false);
+  const recorderRef = useRef(null);
+
+  // Record in the browser and let the backend run Whisper → NLU → search
+  const handleServerVoice = async () => {
+    if (recording) {
+      recorderRef.current?.stop();
+      return;
+    }
+    try {
+      const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
+      const recorder = new MediaRecorder(stream);
+      const chunks = [];
+      recorder.ondataavailable = (e) => chunks.push(e.data);
+      recorder.onstop = async () => {
+        stream.getTracks().forEach((t) => t.stop());
+        setRecording(false);
+        const blob = new Blob(chunks, { type: recorder.mimeType });
+        const form = new FormData();
+        form.append("file", blob, "voice.webm");
+        try {
+          const start = Date.now();
+          const res = await axios.post("http://127.0.0.1:8000/api/voice", form);
+          setSearchTime(Date.now() - start);
+          setTranscript(res.data.transcript);
+          setResults(res.data.results);
+          setStageTimings(res.data.timings_ms);
+        } catch (err) {
+          console.error("Voice search failed", err);
+          setSearchTime(null);
+          setStageTimings(null);
+        }
+      };
+      recorderRef.current = recorder;
+      recorder.start();
+      setRecording(true);
+    } catch (err) {
+      console.error("Microphone unavailable", err);
+    }
+  };
 
   const runSearch = async (inputText) => {
     if (!inputText.trim()) return;
@@ -48,6 +89,7 @@ export default function App() {
       const elapsed = Date.now() - start;
       setResults(res.data);
       setSearchTime(elapsed);  // Set the latency time
+      setStageTimings(null);
     } catch (err) {
       console.error("Search failed", err);
       setSearchTime(null);  // Clear latency if failed
@@ -63,6 +105,13 @@ export default function App() {
         <div className="text-center text-sm text-gray-600 mt-2">
           Latency: {(searchTime / 1000).toFixed(2)} seconds
         </div>
+      )}
+      {stageTimings && (
+        <div className="text-center text-xs text-gray-500 mt-1">
+          {Object.entries(stageTimings)
+            .map(([stage, ms]) => `${stage}: ${ms} ms`)
+            .join(" · ")}
+        </div>
       )}
         <h1 className="text-4xl font-extrabold text-center text-indigo-700 mb-6">
           Voice AI Workout Assistant
@@ -89,6 +138,12 @@ export default function App() {
           >
             🎙 Speak
           </button>
+          <button
+            onClick={handleServerVoice}
+            className="px-6 py-2 bg-white border border-indigo-300 text-indigo-700 rounded-full font-semibold hover:bg-indigo-50 shadow-md"
+          >
+            {recording ? "⏹ Stop" : "🎤 Record (Whisper)"}
+          </button>
         </div>
 
         <div className="mt-10">